@@ -0,0 +1,103 @@
+"""
+Benchmark: CSV vs Parquet storage for the video metadata dataset.
+
+Generates a synthetic metadata table and compares load time and peak RSS
+for full loads, a two-column projection and a single age group. Each load
+runs in a fresh subprocess and reports peak RSS growth over the post-import
+baseline, so the numbers reflect that load alone (Linux only).
+
+Run from the repository root:
+    python benchmarks/bench_video_storage.py --rows 100000 1000000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from video_storage import open_store
+
+# Runs inside the subprocess: load once, report seconds and peak RSS in MB
+# (ru_maxrss survives exec on Linux, so read the fresh process's VmHWM instead)
+_LOAD_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import pyarrow.parquet
+from video_storage import open_store
+
+def status_kb(field):
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field + ":"))
+
+baseline_kb = status_kb("VmRSS")
+start = time.perf_counter()
+df = open_store({path!r}).read(columns={columns!r}, filters={filters!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "rows": len(df), "peak_mb": (status_kb("VmHWM") - baseline_kb) / 1024,
+                  "frame_mb": df.memory_usage(deep=True).sum() / 1e6}}))
+"""
+
+CASES = [
+    ("full table", None, None),
+    ("filename + child_age", ["filename", "child_age"], None),
+    ("age group 7-12m", None, [("child_age", ">", 6), ("child_age", "<=", 12)]),
+]
+
+
+def make_metadata(rows: int) -> pd.DataFrame:
+    """Synthetic metadata in the video_metadata.csv layout, sorted by age like a typical export."""
+    rng = np.random.default_rng(0)
+    milestones = [f"{domain}_{age}M_{n:03d}" for domain in "MLS" for age in (6, 9, 12, 18, 24, 30, 36) for n in range(1, 6)]
+    ages = np.sort(rng.integers(0, 37, rows))
+    return pd.DataFrame({
+        "filename": [f"video_{i:07d}.mp4" for i in range(rows)],
+        "child_age": ages,
+        "milestone_id": rng.choice(milestones, rows),
+        "label": rng.choice(["achieved", "not_achieved"], rows, p=[0.8, 0.2]),
+    })
+
+
+def measure(path: str, columns, filters) -> dict:
+    snippet = _LOAD_SNIPPET.format(root=str(ROOT), path=path, columns=columns, filters=filters)
+    output = subprocess.run([sys.executable, "-c", snippet], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(rows: int, workdir: str):
+    df = make_metadata(rows)
+    paths = {"csv": str(Path(workdir) / f"metadata_{rows}.csv"), "parquet": str(Path(workdir) / f"metadata_{rows}.parquet")}
+    for path in paths.values():
+        open_store(path).write(df)
+    sizes = {fmt: Path(path).stat().st_size / 1e6 for fmt, path in paths.items()}
+
+    print(f"\n{rows:,} rows | file size: CSV {sizes['csv']:.1f} MB, Parquet {sizes['parquet']:.1f} MB")
+    for name, columns, filters in CASES:
+        csv = measure(paths["csv"], columns, filters)
+        parquet = measure(paths["parquet"], columns, filters)
+        assert csv["rows"] == parquet["rows"]
+        print(f"  {name:<22} | CSV {csv['seconds'] * 1000:>8.1f} ms {csv['peak_mb']:>7.1f} MB peak "
+              f"{csv['frame_mb']:>7.1f} MB frame | Parquet {parquet['seconds'] * 1000:>7.1f} ms "
+              f"{parquet['peak_mb']:>7.1f} MB peak {parquet['frame_mb']:>6.1f} MB frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print("⏱️  Video metadata storage: CSV vs Parquet (load time, peak RSS growth, DataFrame size)")
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            run(rows, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import argparse
+import gc
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Literal, Sequence, Tuple
+
+from pydantic import AfterValidator, ConfigDict, Field, StrictBool, StrictInt, StrictStr, TypeAdapter, ValidationError
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+from assessment_stream import iter_records
+
+# Records validated per TypeAdapter call by validate_export
+DEFAULT_BATCH_SIZE = 10000
+
+
+def _iso_date(value: str) -> str:
+    date.fromisoformat(value)
+    return value
+
+
+# Typed mirror of mcp_milestones_schema.json (draft-07); tests/test_assessment_schema.py
+# checks that required fields and enums stay in step with the JSON file. As in
+# JSON Schema, types are strict and unknown properties are allowed. They are
+# ignored rather than copied, since callers keep the input records.
+IsoDate = Annotated[StrictStr, Field(pattern=r"^\d{4}-\d{2}-\d{2}$"), AfterValidator(_iso_date)]
+
+
+class AssessmentAgeRange(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="ignore")
+
+    min: StrictInt
+    max: StrictInt
+    typical: StrictInt
+
+
+class AssessmentMilestone(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="ignore")
+
+    milestone_id: StrictStr
+    age_range_months: AssessmentAgeRange
+    domain: Literal["motor", "language", "social"]
+    subdomain: NotRequired[StrictStr]
+    milestone_description: StrictStr
+    expected_response_type: Literal["yes_no", "scale_1_5", "text", "multiple_choice"]
+    response_options: NotRequired[List[StrictStr]]
+    assessment_method: NotRequired[StrictStr]
+    red_flag: NotRequired[StrictBool]
+    who_criteria: NotRequired[StrictBool]
+
+
+class AssessmentRecord(TypedDict):
+    __pydantic_config__ = ConfigDict(extra="ignore")
+
+    child_id: StrictStr
+    assessment_date: IsoDate
+    age_months: Annotated[StrictInt, Field(ge=0, le=36)]
+    milestones: List[AssessmentMilestone]
+
+
+# Compiled once at import. TypedDicts validate into plain dicts, so a batch
+# costs one Rust-side pass with no model instances.
+ASSESSMENT_ADAPTER = TypeAdapter(AssessmentRecord)
+ASSESSMENT_BATCH_ADAPTER = TypeAdapter(List[AssessmentRecord])
+
+
+@contextmanager
+def _gc_paused():
+    # Validation builds output dicts that are dropped at once; cyclic GC passes over them are wasted.
+    # gc.disable() is process-wide, so only single-threaded batch jobs (the CLI) opt in.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def error_path(loc: Sequence, prefix: str = "assessments", offset: int = 0) -> str:
+    """
+    Record path of a validation error location.
+
+    Args:
+        loc: Pydantic error location, starting with the record's index in the batch
+        prefix: Name of the collection the records came from
+        offset: Index of the batch's first record in that collection
+
+    Returns:
+        e.g. 'assessments[1042].milestones[3].domain', or just prefix when the
+        error is about the collection itself (such as malformed JSON)
+    """
+    if not loc:
+        return prefix
+    path = f"{prefix}[{loc[0] + offset}]"
+    for part in loc[1:]:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
+
+
+def _collect_errors(error: ValidationError, prefix: str, offset: int) -> List[Dict]:
+    return [
+        {
+            "index": detail["loc"][0] + offset if detail["loc"] else None,
+            "path": error_path(detail["loc"], prefix, offset),
+            "type": detail["type"],
+            "message": detail["msg"],
+        }
+        for detail in error.errors(include_url=False, include_context=False, include_input=False)
+    ]
+
+
+def validate_assessments(
+    records: List[Dict],
+    prefix: str = "assessments",
+    offset: int = 0,
+    pause_gc: bool = False
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Validate a batch of assessment records against the MCP schema in one call.
+
+    Args:
+        records: Assessment dicts in the mcp_milestones_sample_data.json format
+        prefix: Collection name used in error paths
+        offset: Index of records[0] in that collection, for error paths
+        pause_gc: Disable cyclic GC during the call. It is process-wide state,
+                  so only for single-threaded callers; never in the server
+
+    Returns:
+        (valid records, errors). Valid records are the input dicts, unchanged;
+        every error is a dict with the record's index, path, type and message.
+    """
+    try:
+        with _gc_paused() if pause_gc else nullcontext():
+            ASSESSMENT_BATCH_ADAPTER.validate_python(records)
+    except ValidationError as e:
+        errors = _collect_errors(e, prefix, offset)
+        if any(error["index"] is None for error in errors):
+            # The batch itself was rejected (e.g. not a list)
+            return [], errors
+        invalid = {error["index"] - offset for error in errors}
+        return [record for i, record in enumerate(records) if i not in invalid], errors
+    return records, []
+
+
+def validate_assessments_json(raw: bytes, prefix: str = "assessments") -> List[Dict]:
+    """
+    Validate an encoded JSON array of assessments without decoding it in Python first.
+
+    Returns:
+        Errors as in validate_assessments (empty if the whole array is valid)
+    """
+    try:
+        ASSESSMENT_BATCH_ADAPTER.validate_json(raw)
+    except ValidationError as e:
+        return _collect_errors(e, prefix, 0)
+    return []
+
+
+def validate_export(
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pause_gc: bool = False
+) -> Iterator[Tuple[List[Dict], List[Dict]]]:
+    """
+    Validate an assessment export in batches, streaming it from disk.
+
+    Args:
+        path: Export in the mcp_milestones_sample_data.json format
+        batch_size: Records validated per call
+        pause_gc: Disable cyclic GC during each batch call, as in validate_assessments
+
+    Yields:
+        (valid records, errors) per batch, as in validate_assessments; error
+        paths index into the whole export
+    """
+    batch: List[Dict] = []
+    offset = 0
+    for record in iter_records(path):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield validate_assessments(batch, offset=offset, pause_gc=pause_gc)
+            offset += len(batch)
+            batch = []
+    if batch:
+        yield validate_assessments(batch, offset=offset, pause_gc=pause_gc)
+
+
+def main(argv: Iterable[str] = None):
+    parser = argparse.ArgumentParser(description="Validate an assessment export against mcp_milestones_schema.json.")
+    parser.add_argument("path", help="Export in the mcp_milestones_sample_data.json format")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-errors", type=int, default=50, help="Errors to print (all are counted)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    records = valid = error_count = 0
+    for batch_valid, batch_errors in validate_export(args.path, args.batch_size, pause_gc=True):
+        for error in batch_errors:
+            if error_count < args.max_errors:
+                print(f"❌ {error['path']}: {error['message']}")
+            error_count += 1
+        valid += len(batch_valid)
+        records += len(batch_valid) + len({error["index"] for error in batch_errors})
+    elapsed = time.perf_counter() - start
+
+    print(f"{'✅' if not error_count else '⚠️'} {valid}/{records} assessments valid, {error_count} errors "
+          f"({records / elapsed:,.0f} records/s)")
+    raise SystemExit(1 if error_count else 0)
+
+
+if __name__ == "__main__":
+    main()
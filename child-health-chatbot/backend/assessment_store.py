@@ -0,0 +1,242 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from assessment_stream import iter_records, milestone_achieved
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    child_id TEXT NOT NULL,
+    assessment_date TEXT NOT NULL,
+    age_months INTEGER NOT NULL,
+    UNIQUE (child_id, assessment_date)
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_date ON assessments (assessment_date);
+CREATE TABLE IF NOT EXISTS assessment_milestones (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    milestone_id TEXT NOT NULL,
+    achieved INTEGER NOT NULL,
+    PRIMARY KEY (assessment_id, milestone_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_assessment_milestones_milestone ON assessment_milestones (milestone_id, assessment_id);
+"""
+
+class AssessmentStore:
+    """
+    Embedded SQLite store of longitudinal milestone assessments.
+
+    One row per (child_id, assessment_date) plus one row per milestone
+    observed in it; milestone details stay in the catalog. Indexes on child
+    and date, date, and milestone serve the per-child queries below without
+    parsing every assessment.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file, or ':memory:'
+        """
+        self.path = path
+        # Shared by request handlers and pool threads; the lock serializes access
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of stored assessments."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+
+    def insert_many(self, assessments: Iterable[Dict]) -> int:
+        """
+        Insert assessments in one transaction.
+
+        Re-inserting a child's assessment for the same date replaces it.
+
+        Args:
+            assessments: Dicts with child_id, assessment_date (YYYY-MM-DD),
+                         age_months and milestones (entries with milestone_id)
+
+        Returns:
+            Number of assessments written
+
+        Raises:
+            ValueError: If an assessment_date is not an ISO date; nothing is written
+        """
+        count = 0
+        with self._lock, self.conn:
+            for assessment in assessments:
+                child_id = assessment["child_id"]
+                assessment_date = date.fromisoformat(assessment["assessment_date"]).isoformat()
+                self.conn.execute(
+                    "INSERT INTO assessments (child_id, assessment_date, age_months) VALUES (?, ?, ?) "
+                    "ON CONFLICT (child_id, assessment_date) DO UPDATE SET age_months = excluded.age_months",
+                    (child_id, assessment_date, assessment["age_months"])
+                )
+                assessment_id = self.conn.execute(
+                    "SELECT id FROM assessments WHERE child_id = ? AND assessment_date = ?",
+                    (child_id, assessment_date)
+                ).fetchone()[0]
+                self.conn.execute("DELETE FROM assessment_milestones WHERE assessment_id = ?", (assessment_id,))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO assessment_milestones (assessment_id, milestone_id, achieved) VALUES (?, ?, ?)",
+                    [(assessment_id, entry["milestone_id"], milestone_achieved(entry))
+                     for entry in assessment.get("milestones", [])]
+                )
+                count += 1
+        return count
+
+    def load_json(self, path: str) -> int:
+        """
+        Bulk insert a JSON file of assessments ({"assessments": [...]} or a bare list).
+
+        The file is streamed one assessment at a time (see iter_records), so
+        exports larger than memory load in one transaction.
+        """
+        return self.insert_many(iter_records(path))
+
+    def latest_per_child(self, as_of: Optional[str] = None) -> List[Dict]:
+        """
+        Each child's most recent assessment.
+
+        Args:
+            as_of: Only consider assessments on or before this date (YYYY-MM-DD)
+
+        Returns:
+            Dicts with child_id, assessment_date and age_months, ordered by child_id
+        """
+        # SQLite takes the bare columns from the row that supplied MAX(); the
+        # (child_id, assessment_date) index makes that one seek per child
+        query = "SELECT child_id, MAX(assessment_date), age_months FROM assessments"
+        params = ()
+        if as_of is not None:
+            query += " WHERE assessment_date <= ?"
+            params = (as_of,)
+        query += " GROUP BY child_id ORDER BY child_id"
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [
+            {"child_id": child_id, "assessment_date": assessment_date, "age_months": age_months}
+            for child_id, assessment_date, age_months in rows
+        ]
+
+    def latest(self, child_id: str, as_of: Optional[str] = None) -> Optional[Dict]:
+        """A child's most recent assessment (as in latest_per_child), or None if there is none."""
+        query = "SELECT assessment_date, age_months FROM assessments WHERE child_id = ?"
+        params = [child_id]
+        if as_of is not None:
+            query += " AND assessment_date <= ?"
+            params.append(as_of)
+        query += " ORDER BY assessment_date DESC LIMIT 1"
+        with self._lock:
+            row = self.conn.execute(query, params).fetchone()
+        if row is None:
+            return None
+        return {"child_id": child_id, "assessment_date": row[0], "age_months": row[1]}
+
+    def trajectory(self, child_id: str, milestone_id: Optional[str] = None) -> List[Dict]:
+        """
+        How a child's milestones were recorded across assessments, oldest first.
+
+        Args:
+            child_id: Child to look up
+            milestone_id: Restrict to one milestone (None for all)
+
+        Returns:
+            Dicts with assessment_date, age_months, milestone_id and achieved
+        """
+        query = (
+            "SELECT a.assessment_date, a.age_months, m.milestone_id, m.achieved "
+            "FROM assessments a JOIN assessment_milestones m ON m.assessment_id = a.id "
+            "WHERE a.child_id = ?"
+        )
+        params = [child_id]
+        if milestone_id is not None:
+            query += " AND m.milestone_id = ?"
+            params.append(milestone_id)
+        query += " ORDER BY a.assessment_date, m.milestone_id"
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [
+            {"assessment_date": assessment_date, "age_months": age_months,
+             "milestone_id": milestone, "achieved": bool(achieved)}
+            for assessment_date, age_months, milestone, achieved in rows
+        ]
+
+    def milestone_history(self, milestone_id: str) -> List[Dict]:
+        """Every recorded observation of one milestone across children, oldest first."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT a.child_id, a.assessment_date, a.age_months, m.achieved "
+                "FROM assessment_milestones m JOIN assessments a ON a.id = m.assessment_id "
+                "WHERE m.milestone_id = ? ORDER BY a.assessment_date, a.child_id",
+                (milestone_id,)
+            ).fetchall()
+        return [
+            {"child_id": child_id, "assessment_date": assessment_date, "age_months": age_months,
+             "achieved": bool(achieved)}
+            for child_id, assessment_date, age_months, achieved in rows
+        ]
+
+    def _achieved_by_child(self, child_id: Optional[str], as_of: Optional[str]) -> Dict[str, List[str]]:
+        query = (
+            "SELECT DISTINCT a.child_id, m.milestone_id "
+            "FROM assessments a JOIN assessment_milestones m ON m.assessment_id = a.id WHERE m.achieved"
+        )
+        params = []
+        if child_id is not None:
+            query += " AND a.child_id = ?"
+            params.append(child_id)
+        if as_of is not None:
+            query += " AND a.assessment_date <= ?"
+            params.append(as_of)
+        query += " ORDER BY a.child_id, m.milestone_id"
+        achieved = defaultdict(list)
+        with self._lock:
+            for child, milestone in self.conn.execute(query, params):
+                achieved[child].append(milestone)
+        return achieved
+
+    def child_data(self, child_id: str, as_of: Optional[str] = None) -> Optional[Dict]:
+        """
+        A child's state for DevelopmentEvaluator.evaluate_development.
+
+        Age comes from the latest assessment; completed_milestones holds every
+        milestone achieved in any assessment up to then, since an achieved
+        milestone stays achieved.
+
+        Returns:
+            Dict with child_id, child_name (the child_id), assessment_date,
+            age_months and completed_milestones, or None if the child has no assessment
+        """
+        latest = self.latest(child_id, as_of)
+        if latest is None:
+            return None
+        completed = self._achieved_by_child(child_id, latest["assessment_date"]).get(child_id, [])
+        return {**latest, "child_name": child_id, "completed_milestones": completed}
+
+    def all_child_data(self, as_of: Optional[str] = None) -> List[Dict]:
+        """child_data for every child, in two queries (see child_data)."""
+        latest = self.latest_per_child(as_of)
+        achieved = self._achieved_by_child(None, as_of)
+        return [
+            {**row, "child_name": row["child_id"], "completed_milestones": achieved.get(row["child_id"], [])}
+            for row in latest
+        ]
@@ -0,0 +1,279 @@
+import json
+import sys
+from typing import AsyncIterator, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from milestone_catalog import MilestoneCatalog
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is in requirements.txt; the fallback scanner yields the same records, slower
+    ijson = None
+
+# Characters read per refill of the fallback scanner's buffer
+CHUNK_SIZE = 64 * 1024
+
+# Longest NDJSON line ndjson_batches buffers; one assessment is a few KB
+MAX_LINE_BYTES = 1024 * 1024
+
+# Responses that count as achieved when a milestone entry records one
+_ACHIEVED_RESPONSES = {"yes", "achieved", "true", "1"}
+
+
+def milestone_achieved(entry: Dict) -> bool:
+    """
+    Whether a milestone entry in an assessment records the milestone as achieved.
+
+    Uses an explicit 'achieved' flag or a 'response' value when the entry has
+    one. Entries with neither count as achieved: in the MCP card format
+    (mcp_milestones_sample_data.json) an assessment lists the milestones observed.
+    """
+    if "achieved" in entry:
+        return bool(entry["achieved"])
+    if "response" in entry:
+        return str(entry["response"]).strip().lower() in _ACHIEVED_RESPONSES
+    return True
+
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Scanner:
+    """
+    Incremental reader of JSON values from a text stream.
+
+    Holds the unread tail of the input plus at most one chunk, and decodes one
+    value at a time with JSONDecoder.raw_decode, reading more input whenever a
+    value runs past the end of the buffer.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop everything already consumed so memory stays bounded by one value plus a chunk
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of the input."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON input, found {char or 'end of input'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def scan_array(fp: TextIO, key: Optional[str] = "assessments", chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Yield the items of a JSON array one at a time without loading the whole document.
+
+    Args:
+        fp: Text stream holding either {"<key>": [...], ...} or a bare [...]
+        key: Top-level member holding the array when the document is an object
+        chunk_size: Characters read per refill
+
+    Raises:
+        ValueError: If the input is not valid JSON or has no such array
+    """
+    scanner = _Scanner(fp, chunk_size)
+    if scanner.peek() == "{":
+        scanner.expect("{")
+        found = False
+        while scanner.peek() != "}":
+            name = scanner.value()
+            scanner.expect(":")
+            if name == key:
+                found = True
+                break
+            # Other top-level members are small; decode and drop them
+            scanner.value()
+            if scanner.expect(",}") == "}":
+                break
+        if not found:
+            raise ValueError(f"No '{key}' array in JSON input")
+
+    scanner.expect("[")
+    if scanner.peek() == "]":
+        return
+    while True:
+        yield scanner.value()
+        if scanner.expect(",]") == "]":
+            return
+
+
+def iter_records(path: str, key: str = "assessments", chunk_size: int = CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Yield the records of a JSON export one at a time.
+
+    Uses ijson's C parser when it is installed and scan_array otherwise.
+
+    Args:
+        path: JSON file holding {"<key>": [...]} or a bare list of records
+        key: Top-level member holding the records
+        chunk_size: Bytes or characters read at a time
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            is_object = f.read(64).lstrip().startswith(b"{")
+            f.seek(0)
+            yield from ijson.items(f, f"{key}.item" if is_object else "item", use_float=True, buf_size=chunk_size)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from scan_array(f, key, chunk_size)
+
+
+async def ndjson_batches(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[List[Tuple[int, Optional[bytes]]]]:
+    """
+    Split a streamed NDJSON body into lines as the chunks arrive.
+
+    Memory stays bounded by max_line_bytes plus one chunk, however long the
+    body is. Blank lines are skipped but still counted.
+
+    Args:
+        chunks: Body chunks, e.g. Request.stream()
+        max_line_bytes: Longer lines are reported as None and skipped
+
+    Yields:
+        The (1-based line number, line) pairs completed by each chunk; the
+        line is None if it was longer than max_line_bytes
+    """
+    pending = b""
+    line_number = 0
+    oversized = False
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        batch = []
+        for line in lines:
+            line_number += 1
+            if oversized:
+                # Tail of a line already reported as too long
+                oversized = False
+                batch.append((line_number, None))
+            elif line.strip():
+                batch.append((line_number, line if len(line) <= max_line_bytes else None))
+        if len(pending) > max_line_bytes:
+            pending = b""
+            oversized = True
+        if batch:
+            yield batch
+    if oversized or pending.strip():
+        yield [(line_number + 1, None if oversized else pending)]
+
+
+class AssessmentStream:
+    """
+    Streaming reader of assessment exports in the mcp_milestones_sample_data.json format.
+
+    Each record in an export repeats the full definition of every milestone it
+    lists. Iterating yields one compact record at a time with those bodies
+    replaced by catalog milestone IDs, so memory stays constant however large
+    the export is. Records can go straight to AssessmentStore.insert_many or
+    DevelopmentEvaluator.evaluate_development.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        catalog: Optional[MilestoneCatalog] = None,
+        key: str = "assessments",
+        chunk_size: int = CHUNK_SIZE
+    ):
+        """
+        Set up the reader; the file is opened on iteration.
+
+        Args:
+            path: Export file
+            catalog: Catalog whose ID strings records share (None to intern IDs instead)
+            key: Top-level member holding the assessments
+            chunk_size: Bytes or characters read at a time
+        """
+        self.path = path
+        self.catalog = catalog
+        self.key = key
+        self.chunk_size = chunk_size
+        self.records = 0
+        self.milestones = 0
+        self.unknown_milestones = 0
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Yield compact assessments.
+
+        Each has child_id, child_name (the child_id), assessment_date,
+        age_months, milestones ([{"milestone_id", "achieved"}]) and
+        completed_milestones (the achieved IDs).
+        """
+        ids = self.catalog.ids if self.catalog is not None else None
+        position_by_id = self.catalog.position_by_id if self.catalog is not None else None
+        for record in iter_records(self.path, self.key, self.chunk_size):
+            milestones = []
+            completed = []
+            for entry in record.get("milestones", []):
+                milestone_id = entry["milestone_id"]
+                if position_by_id is None:
+                    milestone_id = sys.intern(milestone_id)
+                else:
+                    position = position_by_id.get(milestone_id)
+                    if position is None:
+                        self.unknown_milestones += 1
+                        milestone_id = sys.intern(milestone_id)
+                    else:
+                        milestone_id = ids[position]
+                achieved = milestone_achieved(entry)
+                milestones.append({"milestone_id": milestone_id, "achieved": achieved})
+                if achieved:
+                    completed.append(milestone_id)
+            self.records += 1
+            self.milestones += len(milestones)
+            yield {
+                "child_id": record["child_id"],
+                "child_name": record["child_id"],
+                "assessment_date": record["assessment_date"],
+                "age_months": record["age_months"],
+                "milestones": milestones,
+                "completed_milestones": completed,
+            }
@@ -0,0 +1,103 @@
+"""
+Assessment export ingest benchmark: json.load vs the streaming AssessmentStream.
+
+Writes a synthetic export in the mcp_milestones_sample_data.json format (every
+assessment repeats full milestone bodies), then reports records/sec and peak
+Python heap for loading it whole versus streaming it, and for streaming it
+through DevelopmentEvaluator.evaluate_export.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_assessment_stream.py --records 10000 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(BACKEND_DIR.parent.parent))
+
+import assessment_stream
+from assessment_stream import AssessmentStream
+from development_evaluator import DevelopmentEvaluator
+
+
+def write_export(path: str, count: int, milestones):
+    """Stream a synthetic export to disk, one assessment per line."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"assessments": [\n')
+        for i in range(count):
+            age = 6 + (i % 5) * 6
+            expected = [m for m in milestones if m["age_range_months"]["min"] <= age <= m["age_range_months"]["max"]]
+            record = {
+                "child_id": f"CHILD_{i // 4:07d}",
+                "assessment_date": f"{2024 + i % 4}-{i % 12 + 1:02d}-05",
+                "age_months": age,
+                "milestones": expected[: len(expected) - i % 2],
+            }
+            f.write(("," if i else "") + json.dumps(record) + "\n")
+        f.write("]}\n")
+
+
+def measure(label: str, count: int, consume):
+    start = time.perf_counter()
+    consume()
+    elapsed = time.perf_counter() - start
+
+    # Separate pass: tracemalloc slows allocation-heavy code too much to time under it
+    tracemalloc.start()
+    consume()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"  {label:<28} {count / elapsed:>10,.0f} records/s | peak heap {peak / 1e6:>8.1f} MB")
+
+
+def run(count: int, workdir: str, evaluator: DevelopmentEvaluator):
+    path = os.path.join(workdir, f"export_{count}.json")
+    write_export(path, count, evaluator.milestones_data)
+    print(f"{count:,} assessments ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+    def load_whole():
+        with open(path, "r", encoding="utf-8") as f:
+            for _ in json.load(f)["assessments"]:
+                pass
+
+    def stream():
+        for _ in AssessmentStream(path, evaluator.catalog):
+            pass
+
+    def evaluate():
+        for _ in evaluator.evaluate_export(path):
+            pass
+
+    measure("json.load", count, load_whole)
+    measure(f"AssessmentStream ({'ijson' if assessment_stream.ijson else 'scanner'})", count, stream)
+    measure("evaluate_export", count, evaluate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    evaluator = DevelopmentEvaluator(
+        milestones_file=str(BACKEND_DIR / "data" / "milestones_data.json"),
+        recommendations_file=str(BACKEND_DIR.parent.parent / "recommendations.json")
+    )
+
+    print("📥 Assessment export ingest: json.load vs streaming")
+    print("-" * 80)
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in args.records:
+            run(count, workdir, evaluator)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Assessment validation benchmark: one Pydantic model per record vs compiled batch validation.
+
+Validates synthetic assessments in the mcp_milestones_sample_data.json format
+four ways: a BaseModel built per record (the pattern main.py uses for
+milestones), the compiled TypeAdapter called per record, the TypeAdapter over
+a whole batch, and the TypeAdapter over the batch's encoded JSON.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_assessment_validation.py --records 10000 100000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Literal, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import BaseModel, Field
+
+from assessment_schema import ASSESSMENT_ADAPTER, validate_assessments, validate_assessments_json
+
+MILESTONES = json.loads((Path(__file__).resolve().parents[3] / "mcp_milestones_sample_data.json").read_text())[
+    "assessments"][-1]["milestones"]
+
+
+class AgeRangeModel(BaseModel):
+    min: int
+    max: int
+    typical: int
+
+
+class MilestoneModel(BaseModel):
+    milestone_id: str
+    age_range_months: AgeRangeModel
+    domain: Literal["motor", "language", "social"]
+    subdomain: Optional[str] = None
+    milestone_description: str
+    expected_response_type: Literal["yes_no", "scale_1_5", "text", "multiple_choice"]
+    assessment_method: Optional[str] = None
+    red_flag: Optional[bool] = None
+    who_criteria: Optional[bool] = None
+
+
+class AssessmentModel(BaseModel):
+    child_id: str
+    assessment_date: str
+    age_months: int = Field(ge=0, le=36)
+    milestones: List[MilestoneModel]
+
+
+def make_records(count: int):
+    return [
+        {
+            "child_id": f"CHILD_{i:07d}",
+            "assessment_date": f"{2024 + i % 3}-{i % 12 + 1:02d}-05",
+            "age_months": 6 + i % 30,
+            "milestones": MILESTONES[: 2 + i % (len(MILESTONES) - 1)],
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(count: int, repeat: int):
+    records = make_records(count)
+    raw = json.dumps(records).encode()
+    assert validate_assessments(records)[1] == [] and validate_assessments_json(raw) == []
+
+    variants = {
+        "BaseModel per record": lambda: [AssessmentModel(**record) for record in records],
+        "TypeAdapter per record": lambda: [ASSESSMENT_ADAPTER.validate_python(record) for record in records],
+        "TypeAdapter batch": lambda: validate_assessments(records),
+        "TypeAdapter batch (JSON)": lambda: validate_assessments_json(raw),
+    }
+    print(f"{count:,} assessments")
+    for label, fn in variants.items():
+        print(f"  {label:<26} {count / best_of(repeat, fn):>12,.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("🧪 Assessment validation: per-record models vs compiled batch validation")
+    print("-" * 80)
+    for count in args.records:
+        run(count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Throughput benchmark: precompiled chat NLU vs the original per-call implementation.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_chat_nlu.py --messages 20000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chat_nlu import KEYWORD_MAP, parse_message
+
+LEGACY_KEYWORD_MAP = {keyword: domain for keyword, (domain, _) in KEYWORD_MAP.items()}
+
+TEMPLATES = [
+    "My child is {n} months old but not crawling yet",
+    "My {n}-month-old cannot stand alone",
+    "Is it normal that my {n}-month-old can't sit?",
+    "My child is {n} months and only says 10 words",
+    "My baby does not smile at strangers, she is {n} months old",
+    "He is {y} years old and does not talk much, what should we do?",
+    "We are worried because our daughter seems quiet and does not respond to her name",
+]
+
+
+def legacy_extract_age_from_message(message):
+    """The original implementation: lowercases and compiles patterns on every call."""
+    patterns = [
+        r'(\d+)\s*months?\s+old',
+        r'(\d+)\s*months?',
+        r'(\d+)-month',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, message.lower())
+        if match:
+            return int(match.group(1))
+    year_pattern = r'(\d+)\s*years?\s+old'
+    match = re.search(year_pattern, message.lower())
+    if match:
+        return int(match.group(1)) * 12
+    return None
+
+
+def legacy_detect_intent(message):
+    message_lower = message.lower()
+    for keyword, domain in LEGACY_KEYWORD_MAP.items():
+        if keyword in message_lower:
+            return domain
+    return "general"
+
+
+def make_messages(count, seed=42):
+    rng = random.Random(seed)
+    return [
+        rng.choice(TEMPLATES).format(n=rng.randint(1, 36), y=rng.randint(1, 3))
+        for _ in range(count)
+    ]
+
+
+def legacy_parse_message(message):
+    return legacy_extract_age_from_message(message), legacy_detect_intent(message)
+
+
+def throughput(parse, messages):
+    start = time.perf_counter()
+    for message in messages:
+        parse(message)
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    legacy = max(throughput(legacy_parse_message, messages) for _ in range(args.repeat))
+    compiled = max(throughput(parse_message, messages) for _ in range(args.repeat))
+
+    print(f"⏱️  Chat NLU throughput over {len(messages)} messages (best of {args.repeat})")
+    print("-" * 60)
+    print(f"{'legacy':>10} | {legacy:>12,.0f} messages/sec")
+    print(f"{'compiled':>10} | {compiled:>12,.0f} messages/sec ({compiled / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: list-based vs set-based completion matching.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_completion_matching.py --milestones 500 1000 2000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from milestone_catalog import MilestoneCatalog
+from scoring_engine import partition_milestones
+
+
+def make_milestones(count: int):
+    """Synthetic milestones that are all expected at the same age."""
+    return [
+        {
+            "milestone_id": f"M_SYN_{i:06d}",
+            "age_range_months": {"min": 0, "max": 36, "typical": 12},
+            "domain": "motor",
+            "red_flag": i % 10 == 0,
+        }
+        for i in range(count)
+    ]
+
+
+def list_matching(expected_milestones, completed_milestone_ids):
+    """The original three-comprehension implementation."""
+    completed = [m for m in expected_milestones if m['milestone_id'] in completed_milestone_ids]
+    missing = [m for m in expected_milestones if m['milestone_id'] not in completed_milestone_ids]
+    red_flags = [m for m in missing if m.get('red_flag', False)]
+    return completed, missing, red_flags
+
+
+def run(count: int, repeat: int):
+    milestones = make_milestones(count)
+    # A child who has achieved 80% of expected milestones
+    completed_ids = [m["milestone_id"] for m in milestones[: int(count * 0.8)]]
+
+    catalog = MilestoneCatalog(milestones)
+    positions = range(len(catalog))
+
+    completed, missing, red_flags = list_matching(milestones, completed_ids)
+    assert (completed, missing, red_flags) == tuple(
+        catalog.hydrate_many(p) for p in partition_milestones(catalog, positions, completed_ids)
+    )
+
+    list_time = min(timeit.repeat(lambda: list_matching(milestones, completed_ids), number=1, repeat=repeat))
+    set_time = min(timeit.repeat(
+        lambda: partition_milestones(catalog, positions, completed_ids), number=1, repeat=repeat
+    ))
+
+    print(f"{count:>7} milestones | list: {list_time * 1000:>9.3f} ms | "
+          f"set: {set_time * 1000:>7.3f} ms | speedup: {list_time / set_time:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--milestones", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("⏱️  Completion matching: list membership vs frozenset single pass")
+    print("-" * 78)
+    for count in args.milestones:
+        run(count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Latency benchmark: /evaluate under concurrent load, scored inline vs on the compute pool.
+
+Serves the app with uvicorn in a separate process (so the load generator
+does not share its GIL), loaded with a synthetic catalog of --milestones
+entries so scoring costs what a large catalog would.
+--concurrency clients then post to /evaluate (a mix of repeated and unique
+milestone sets, response cache disabled) while a probe polls GET / to show
+how long cheap requests wait behind scoring. Reports p50/p95/p99 for both.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_concurrent_evaluate.py --milestones 5000 --requests 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND))
+
+from bench_startup import make_milestones
+from compute_pool import percentiles
+from data_store import DataStore
+from main import RECOMMENDATIONS_PATH, _validate_milestones
+
+# Runs in the server process: swap in the synthetic catalog, disable the
+# response cache so every request is scored (or coalesced), pick the mode
+_SERVER_SNIPPET = """
+import sys
+sys.path.insert(0, {backend!r})
+import uvicorn
+import main
+from compute_pool import ComputePool
+from data_store import DataStore
+from evaluation_cache import EvaluationCache
+
+class InlinePool:
+    # The previous behaviour: score directly on the event loop
+    async def run(self, key, fn, *args):
+        return fn(*args)
+
+main.DATA_STORE = DataStore({milestones!r}, main.RECOMMENDATIONS_PATH, main._validate_milestones)
+main.EVALUATION_CACHE = EvaluationCache(maxsize=1, ttl_seconds=0)
+main.COMPUTE_POOL = ComputePool(max_workers={workers}, max_pending=1_000_000) if {pooled} else InlinePool()
+uvicorn.run(main.app, host="127.0.0.1", port={port}, log_level="warning")
+"""
+
+
+def make_payloads(snapshot, count: int, duplicate_share: float):
+    rng = random.Random(0)
+    ages = [age for age in range(0, 61) if snapshot.milestone_index.positions(age)]
+    popular = []
+    for age in ages[:8]:
+        ids = [m["milestone_id"] for m in snapshot.milestone_index.expected(age)]
+        popular.append({"child_age_months": age, "completed_milestones": ids[: len(ids) // 2]})
+
+    payloads = []
+    for _ in range(count):
+        if rng.random() < duplicate_share:
+            payloads.append(rng.choice(popular))
+            continue
+        age = rng.choice(ages)
+        ids = [m["milestone_id"] for m in snapshot.milestone_index.expected(age)]
+        payloads.append({"child_age_months": age, "completed_milestones": rng.sample(ids, rng.randint(0, len(ids)))})
+    return payloads
+
+
+def start_server(milestones_path: str, pooled: bool, workers: int):
+    """Start the server process; returns (process, base URL) once it answers."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    snippet = _SERVER_SNIPPET.format(
+        backend=str(BACKEND), milestones=milestones_path, workers=workers, pooled=pooled, port=port
+    )
+    process = subprocess.Popen([sys.executable, "-c", snippet], cwd=BACKEND, stdout=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(600):
+        try:
+            httpx.get(base_url + "/")
+            return process, base_url
+        except httpx.TransportError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("benchmark server did not start")
+
+
+def bench(name, milestones_path, payloads, args, pooled):
+    process, base_url = start_server(milestones_path, pooled, args.workers)
+    try:
+        report(name, *asyncio.run(run_load(base_url, payloads, args.concurrency)))
+        if pooled:
+            stats = httpx.get(base_url + "/evaluate/pool").json()
+            print(f"  pool: {stats['submitted']} computations, {stats['coalesced']} coalesced, "
+                  f"{stats['rejected']} rejected")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def run_load(base_url: str, payloads, concurrency: int):
+    latencies, probe_latencies = [], []
+    queue = list(reversed(payloads))
+    done = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=concurrency + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        async def worker():
+            while queue:
+                payload = queue.pop()
+                start = time.perf_counter()
+                response = await client.post("/evaluate", json=payload)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/")
+                probe_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.005)
+
+        probe_task = asyncio.ensure_future(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+    return latencies, probe_latencies, elapsed
+
+
+def report(name, latencies, probe_latencies, elapsed):
+    evaluate = percentiles(latencies, points=(50, 95, 99))
+    probe = percentiles(probe_latencies, points=(50, 95, 99))
+    print(f"  {name:<7} | {len(latencies) / elapsed:>7.0f} req/s | /evaluate "
+          + " ".join(f"{k} {v * 1000:>6.1f} ms" for k, v in evaluate.items())
+          + " | GET / " + " ".join(f"{k} {v * 1000:>6.1f} ms" for k, v in probe.items()))
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--milestones", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duplicates", type=float, default=0.5, help="share of requests repeating a popular input")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        milestones_path = os.path.join(workdir, "milestones.json")
+        with open(milestones_path, "w") as f:
+            json.dump(make_milestones(args.milestones), f)
+        snapshot = DataStore(milestones_path, RECOMMENDATIONS_PATH, _validate_milestones).current()
+        payloads = make_payloads(snapshot, args.requests, args.duplicates)
+
+        print(f"⏱️  /evaluate: {args.milestones} milestones, {args.requests} requests, "
+              f"{args.concurrency} concurrent, {args.duplicates:.0%} repeated inputs")
+        bench("inline", milestones_path, payloads, args, pooled=False)
+        bench("pool", milestones_path, payloads, args, pooled=True)
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,94 @@
+"""
+Startup benchmark: per-entry Pydantic validation vs the compiled catalog artifact.
+
+Measures how long a worker takes to build its DataStore from a synthetic
+milestones file, first validating every entry, then loading the artifact.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/bench_startup.py --milestones 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_store import DataStore
+from main import MILESTONE_SCHEMA_FINGERPRINT, RECOMMENDATIONS_PATH, _validate_milestones
+
+
+def make_milestones(count: int):
+    """Synthetic milestones with every field the schema requires."""
+    domains = ("motor", "language", "social", "cognitive")
+    return [
+        {
+            "milestone_id": f"M_SYN_{i:06d}",
+            "age_range_months": {"min": i % 48, "max": i % 48 + 4, "typical": i % 48 + 2},
+            "domain": domains[i % len(domains)],
+            "subdomain": "synthetic",
+            "milestone_description": f"Synthetic milestone {i}",
+            "expected_response_type": "yes_no",
+            "assessment_method": "Parent report",
+            "red_flag": i % 10 == 0,
+            "who_criteria": i % 3 == 0,
+            "options": [{"label": "Yes", "value": "yes"}, {"label": "No", "value": "no"}],
+        }
+        for i in range(count)
+    ]
+
+
+def run(count: int, repeat: int, workdir: str):
+    milestones_path = os.path.join(workdir, f"milestones_{count}.json")
+    artifact_path = os.path.join(workdir, f"catalog_{count}.pkl")
+    with open(milestones_path, "w") as f:
+        json.dump(make_milestones(count), f)
+
+    def validated():
+        return DataStore(milestones_path, RECOMMENDATIONS_PATH, _validate_milestones)
+
+    def from_artifact():
+        store = DataStore(
+            milestones_path, RECOMMENDATIONS_PATH, _validate_milestones,
+            artifact_path=artifact_path, schema_fingerprint=MILESTONE_SCHEMA_FINGERPRINT
+        )
+        assert store.catalog_source == "artifact"
+        return store
+
+    # First artifact-enabled start validates and compiles; every later start loads it
+    compile_time = timeit.timeit(
+        lambda: DataStore(
+            milestones_path, RECOMMENDATIONS_PATH, _validate_milestones,
+            artifact_path=artifact_path, schema_fingerprint=MILESTONE_SCHEMA_FINGERPRINT
+        ),
+        number=1
+    )
+    assert validated().current().catalog.to_dicts() == from_artifact().current().catalog.to_dicts()
+
+    validate_time = min(timeit.repeat(validated, number=1, repeat=repeat))
+    artifact_time = min(timeit.repeat(from_artifact, number=1, repeat=repeat))
+
+    print(f"{count:>7} milestones | validate: {validate_time * 1000:>9.1f} ms | "
+          f"compile: {compile_time * 1000:>9.1f} ms | artifact: {artifact_time * 1000:>7.1f} ms | "
+          f"speedup: {validate_time / artifact_time:>5.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--milestones", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("⏱️  Worker startup: Pydantic validation vs compiled catalog artifact")
+    print("-" * 100)
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in args.milestones:
+            run(count, args.repeat, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Load test for the backend API: /evaluate, /evaluate/batch and /api/chat.
+
+Generates a synthetic milestone catalog per --milestones size and synthetic
+children, then drives each endpoint with --concurrency clients in two modes:
+
+  inproc   the app in this process through httpx's ASGI transport; measures
+           per-request cost without sockets or worker processes
+  workers  `uvicorn main:app --workers N` in a subprocess, over HTTP
+
+Each run reports throughput, p50/p95/p99 latency and server RSS, writes all
+results to --output as JSON and, with --check, exits non-zero when a result
+breaks a rule in --thresholds.
+
+Run from child-health-chatbot/backend:
+    python benchmarks/load_test.py --milestones 1000 10000 --modes inproc workers --check
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_startup import make_milestones
+from compute_pool import percentiles
+from milestone_index import MilestoneIndex
+
+ENDPOINTS = ("evaluate", "batch", "chat")
+MODES = ("inproc", "workers")
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "load_thresholds.json"
+
+CHAT_TEMPLATES = [
+    "My child is {n} months old but not crawling yet",
+    "My {n}-month-old does not say any words",
+    "Is it normal that my {n}-month-old does not smile at people?",
+    "We are worried about our {n} months old baby's walking",
+]
+
+
+def make_children(milestones: List[Dict], count: int, seed: int = 0) -> List[Dict]:
+    """Children of random ages, each having completed a random share of their expected milestones."""
+    rng = random.Random(seed)
+    index = MilestoneIndex(milestones)
+    children = []
+    for i in range(count):
+        age = rng.randint(0, index.max_age)
+        expected = [index.catalog.ids[p] for p in index.positions(age)]
+        completed = rng.sample(expected, int(len(expected) * rng.random()))
+        children.append({"child_age_months": age, "completed_milestones": completed, "child_name": f"Child {i}"})
+    return children
+
+
+def make_requests(endpoint: str, children: List[Dict], count: int, batch_size: int, seed: int = 0) -> List[tuple]:
+    """(path, json body) pairs for one endpoint."""
+    rng = random.Random(seed)
+    if endpoint == "evaluate":
+        return [("/evaluate", children[i % len(children)]) for i in range(count)]
+    if endpoint == "batch":
+        return [("/evaluate/batch", {"children": rng.sample(children, min(batch_size, len(children)))})
+                for _ in range(count)]
+    return [("/api/chat", {"message": rng.choice(CHAT_TEMPLATES).format(n=rng.randint(1, 36)), "seed": i})
+            for i in range(count)]
+
+
+async def drive(client: httpx.AsyncClient, requests: List[tuple], concurrency: int) -> Dict:
+    """Send the requests from `concurrency` clients; returns latency samples and error count."""
+    queue = list(reversed(requests))
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while queue:
+            path, body = queue.pop()
+            start = time.perf_counter()
+            try:
+                response = await client.post(path, json=body)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"latencies": latencies, "errors": errors, "seconds": time.perf_counter() - start}
+
+
+def summarize(mode: str, milestones: int, endpoint: str, concurrency: int, run: Dict, rss_mb: float) -> Dict:
+    latency = percentiles(run["latencies"], points=(50, 95, 99))
+    return {
+        "mode": mode,
+        "milestones": milestones,
+        "endpoint": endpoint,
+        "requests": len(run["latencies"]),
+        "concurrency": concurrency,
+        "errors": run["errors"],
+        "throughput_rps": round(len(run["latencies"]) / run["seconds"], 1),
+        **{f"{name}_ms": round(value * 1000, 2) for name, value in latency.items()},
+        "rss_mb": round(rss_mb, 1),
+    }
+
+
+def _status_kb(pid, field: str) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return next((int(line.split()[1]) for line in f if line.startswith(field + ":")), 0)
+    except OSError:
+        return 0
+
+
+def process_tree_rss_mb(root_pid: int) -> float:
+    """Resident memory of a process and all its descendants (Linux /proc)."""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The command name may contain spaces, so split after its closing parenthesis
+                    parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    tree, frontier = {root_pid}, [root_pid]
+    while frontier:
+        parent = frontier.pop()
+        children = [pid for pid, ppid in parents.items() if ppid == parent and pid not in tree]
+        tree.update(children)
+        frontier.extend(children)
+    return sum(_status_kb(pid, "VmRSS") for pid in tree) / 1024
+
+
+def write_dataset(workdir: str, count: int) -> List[Dict]:
+    """Lay out data/ in workdir the way main.py expects it, with a synthetic catalog."""
+    milestones = make_milestones(count)
+    data_dir = Path(workdir) / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with open(data_dir / "milestones_data.json", "w") as f:
+        json.dump(milestones, f)
+    shutil.copy(BACKEND / "data" / "recommendations.json", data_dir / "recommendations.json")
+    return milestones
+
+
+def run_inproc(workdir: str, milestones: int, request_sets: Dict[str, List[tuple]], concurrency: int) -> List[Dict]:
+    import main
+    from data_store import DataStore
+
+    main.DATA_STORE = DataStore(
+        os.path.join(workdir, main.MILESTONES_PATH), os.path.join(workdir, main.RECOMMENDATIONS_PATH),
+        main._validate_milestones
+    )
+    main.EVALUATION_CACHE.clear()
+
+    async def run_all():
+        results = []
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=300) as client:
+            for endpoint, requests in request_sets.items():
+                run = await drive(client, requests, concurrency)
+                rss_mb = _status_kb("self", "VmRSS") / 1024
+                results.append(summarize("inproc", milestones, endpoint, concurrency, run, rss_mb))
+        return results
+
+    return asyncio.run(run_all())
+
+
+def run_workers(workdir: str, milestones: int, request_sets: Dict[str, List[tuple]], concurrency: int, workers: int) -> List[Dict]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(BACKEND), os.environ.get("PYTHONPATH")]))}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 600
+        while True:
+            try:
+                httpx.get(base_url + "/")
+                break
+            except httpx.TransportError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start; run from child-health-chatbot/backend")
+                time.sleep(0.1)
+
+        async def run_all():
+            results = []
+            limits = httpx.Limits(max_connections=concurrency)
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=300) as client:
+                for endpoint, requests in request_sets.items():
+                    run = await drive(client, requests, concurrency)
+                    results.append(summarize(
+                        "workers", milestones, endpoint, concurrency, run, process_tree_rss_mb(server.pid)
+                    ))
+            return results
+
+        return asyncio.run(run_all())
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def check_thresholds(results: List[Dict], rules: List[Dict]) -> List[str]:
+    """
+    Compare results against regression rules.
+
+    A rule matches on any of mode, endpoint and milestones it names and sets
+    limits: max_p50_ms, max_p95_ms, max_p99_ms, min_throughput_rps,
+    max_rss_mb, max_errors.
+
+    Returns:
+        One message per broken limit
+    """
+    failures = []
+    for rule in rules:
+        for result in results:
+            if any(key in rule and rule[key] != result[key] for key in ("mode", "endpoint", "milestones")):
+                continue
+            name = f"{result['mode']} {result['endpoint']} @ {result['milestones']} milestones"
+            for limit, value in rule.items():
+                if limit.startswith("max_") and result[limit[4:]] > value:
+                    failures.append(f"{name}: {limit[4:]} {result[limit[4:]]} > {value}")
+                elif limit.startswith("min_") and result[limit[4:]] < value:
+                    failures.append(f"{name}: {limit[4:]} {result[limit[4:]]} < {value}")
+    return failures
+
+
+def run(milestone_counts: List[int], modes: List[str], endpoints: List[str], requests: int, concurrency: int,
+        workers: int, batch_size: int, children: int) -> List[Dict]:
+    results = []
+    for count in milestone_counts:
+        with tempfile.TemporaryDirectory() as workdir:
+            milestones = write_dataset(workdir, count)
+            population = make_children(milestones, children)
+            # Batches carry batch_size children each, so send proportionally fewer
+            request_sets = {
+                endpoint: make_requests(
+                    endpoint, population, max(1, requests // batch_size) if endpoint == "batch" else requests, batch_size
+                )
+                for endpoint in endpoints
+            }
+            for mode in modes:
+                if mode == "inproc":
+                    mode_results = run_inproc(workdir, count, request_sets, concurrency)
+                else:
+                    mode_results = run_workers(workdir, count, request_sets, concurrency, workers)
+                for result in mode_results:
+                    print(f"  {result['mode']:<7} {count:>7} milestones {result['endpoint']:<8} | "
+                          f"{result['throughput_rps']:>8.1f} req/s | p50 {result['p50_ms']:>8.1f} ms "
+                          f"p95 {result['p95_ms']:>8.1f} ms p99 {result['p99_ms']:>8.1f} ms | "
+                          f"RSS {result['rss_mb']:>7.1f} MB | errors {result['errors']}")
+                results.extend(mode_results)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--milestones", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=list(ENDPOINTS))
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint (batch sends requests / batch-size)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4, help="uvicorn worker processes in 'workers' mode")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--children", type=int, default=1000, help="synthetic children to draw requests from")
+    parser.add_argument("--output", default="load_test_results.json")
+    parser.add_argument("--thresholds", default=str(DEFAULT_THRESHOLDS))
+    parser.add_argument("--check", action="store_true", help="exit 1 if any threshold is broken")
+    args = parser.parse_args(argv)
+
+    print("⏱️  Backend load test")
+    results = run(args.milestones, args.modes, args.endpoints, args.requests, args.concurrency,
+                  args.workers, args.batch_size, args.children)
+
+    with open(args.output, "w") as f:
+        json.dump({
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "settings": {key: value for key, value in vars(args).items() if key not in ("output", "check")},
+            "results": results,
+        }, f, indent=2)
+    print(f"✅ Results saved to {args.output}")
+
+    if not args.check:
+        return 0
+    with open(args.thresholds) as f:
+        failures = check_thresholds(results, json.load(f))
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ All thresholds met")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
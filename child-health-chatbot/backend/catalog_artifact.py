@@ -0,0 +1,103 @@
+"""
+Compiled milestone catalog artifact.
+
+Validating every MilestoneEntry with Pydantic dominates worker startup on large
+catalogs. The build step validates once and pickles the resulting
+MilestoneCatalog together with a hash of the source file; workers load the
+pickle and only fall back to full validation when the hash no longer matches.
+
+Build it ahead of deployment, from child-health-chatbot/backend:
+    python catalog_artifact.py [--output data/milestones_catalog.pkl]
+
+The artifact is a local build output and is trusted like the code itself;
+never point MILESTONE_CATALOG_ARTIFACT at a file from an untrusted source.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+from typing import Optional
+
+from milestone_catalog import MilestoneCatalog
+
+# Bump when MilestoneCatalog's layout changes so old artifacts are rebuilt
+ARTIFACT_FORMAT = 2
+DEFAULT_ARTIFACT_PATH = "data/milestones_catalog.pkl"
+
+
+def source_key(milestones_raw: bytes, schema_fingerprint: str = "") -> str:
+    """
+    Identify the input an artifact was compiled from.
+
+    Args:
+        milestones_raw: Raw bytes of milestones_data.json
+        schema_fingerprint: Changes whenever the validation schema changes
+
+    Returns:
+        Hex digest covering the artifact format, schema and source bytes
+    """
+    digest = hashlib.sha256(f"{ARTIFACT_FORMAT}:{schema_fingerprint}:".encode())
+    digest.update(milestones_raw)
+    return digest.hexdigest()
+
+
+def load_artifact(path: str, key: str) -> Optional[MilestoneCatalog]:
+    """
+    Load a compiled catalog if it was built from the same source.
+
+    Returns:
+        The catalog, or None if the artifact is missing, stale or unreadable
+    """
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable catalog artifact {path}: {e}")
+        return None
+
+    if not isinstance(artifact, dict) or artifact.get("key") != key:
+        return None
+    catalog = artifact.get("catalog")
+    return catalog if isinstance(catalog, MilestoneCatalog) else None
+
+
+def write_artifact(path: str, key: str, catalog: MilestoneCatalog):
+    """
+    Write a compiled catalog atomically.
+
+    Several workers may rebuild the same artifact at once; each writes its own
+    temporary file and renames it into place, so readers never see a partial file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "catalog": catalog}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate milestones_data.json and compile the catalog artifact.")
+    parser.add_argument("--output", default=os.getenv("MILESTONE_CATALOG_ARTIFACT", DEFAULT_ARTIFACT_PATH))
+    args = parser.parse_args()
+
+    # Imported here so the schema and data paths stay defined in one place
+    from main import MILESTONES_PATH, MILESTONE_SCHEMA_FINGERPRINT, _validate_milestones
+
+    with open(MILESTONES_PATH, "rb") as f:
+        milestones_raw = f.read()
+    catalog = MilestoneCatalog(_validate_milestones(json.loads(milestones_raw)))
+    write_artifact(args.output, source_key(milestones_raw, MILESTONE_SCHEMA_FINGERPRINT), catalog)
+    print(f"✅ Compiled {len(catalog)} milestones into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
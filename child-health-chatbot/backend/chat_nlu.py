@@ -0,0 +1,159 @@
+import re
+from typing import Callable, ContextManager, Dict, Optional, Tuple
+
+# Keyword Mapper: keyword stem -> (domain, weight)
+# Specific terms outweigh generic ones when a message touches several domains.
+KEYWORD_MAP: Dict[str, Tuple[str, float]] = {
+    # Motor
+    "walk": ("motor", 2.0), "run": ("motor", 1.0), "crawl": ("motor", 2.0), "sit": ("motor", 2.0),
+    "stand": ("motor", 2.0), "move": ("motor", 1.0), "grasp": ("motor", 2.0), "hold": ("motor", 1.0),
+    # Language
+    "talk": ("language", 2.0), "speak": ("language", 2.0), "word": ("language", 2.0),
+    "say": ("language", 1.0), "babble": ("language", 2.0), "sound": ("language", 1.0),
+    "listen": ("language", 1.0), "understand": ("language", 1.0),
+    # Social
+    "smile": ("social", 2.0), "play": ("social", 1.0), "cry": ("social", 1.0),
+    "laugh": ("social", 2.0), "look": ("social", 1.0), "eye": ("social", 1.0),
+    "stranger": ("social", 2.0), "fear": ("social", 1.0)
+}
+
+# Order used to break ties between equally scored domains
+DOMAIN_PRIORITY = ("motor", "language", "social")
+
+
+def _keyword_alternation(keywords) -> str:
+    """
+    Build a prefix-factored alternation, e.g. s(?:it|ay|t(?:and|ranger)).
+
+    Factoring shared prefixes lets the regex engine reject most positions on
+    the first character instead of trying every keyword in turn.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = "(?:" + "|".join(branches) + ")" if len(branches) > 1 or "" in node else branches[0]
+        return body + "?" if "" in node else body
+
+    return build(trie)
+
+
+# Keywords are stems, so they must start a word but may be followed by a suffix ("walking").
+# Patterns run on lowercased text; IGNORECASE is several times slower.
+_KEYWORD_PATTERN = re.compile(r"\b(" + _keyword_alternation(KEYWORD_MAP) + r")")
+
+# Devanagari digits (०-९) -> ASCII so one age pattern handles both
+_DIGIT_TRANSLATION = str.maketrans("०१२३४५६७८९", "0123456789")
+
+_MONTH_WORDS = r"(?:months?|mos?\b|महीने|महीना|माह)"
+_YEAR_WORDS = r"(?:years?|yrs?\b|साल|वर्ष)"
+
+# One pass finds every "<number> <unit>" phrase:
+#   group 1: the number ("10", "1.5")
+#   group 2: set when the unit is months ("10 months old", "10-month-old", "10 महीने")
+#   group 3: trailing months after a year count ("1 year 6 months", "2 years and 3 months")
+_AGE_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*-?\s*(?:(" + _MONTH_WORDS + r")|" + _YEAR_WORDS
+    + r"(?:\s*(?:and\s*|,\s*|और\s*)?(\d+)\s*-?\s*" + _MONTH_WORDS + r")?)"
+)
+
+
+def _to_months(value: str, months_per_unit: int = 1) -> int:
+    """Convert a matched number to whole months, rounding half up."""
+    if "." not in value:
+        return int(value) * months_per_unit
+    return int(float(value) * months_per_unit + 0.5)
+
+
+def _extract_age(text: str) -> Optional[int]:
+    """Age extraction on already lowercased text."""
+    if not text.isascii():
+        text = text.translate(_DIGIT_TRANSLATION)
+
+    # An explicit month count wins over a bare year count anywhere in the message
+    years_only = None
+    match = _AGE_PATTERN.search(text)
+    while match:
+        number, month_unit, extra_months = match.groups()
+        if month_unit:
+            return _to_months(number)
+        if extra_months:
+            return _to_months(number, 12) + int(extra_months)
+        if years_only is None:
+            years_only = _to_months(number, 12)
+        match = _AGE_PATTERN.search(text, match.end())
+    return years_only
+
+
+def _score_domains(text: str) -> Dict[str, float]:
+    """Keyword scoring on already lowercased text."""
+    scores: Dict[str, float] = {}
+    for keyword in _KEYWORD_PATTERN.findall(text):
+        domain, weight = KEYWORD_MAP[keyword]
+        scores[domain] = scores.get(domain, 0.0) + weight
+    return scores
+
+
+def _best_domain(scores: Dict[str, float]) -> str:
+    if not scores:
+        return "general"
+
+    best = max(scores.values())
+    for domain in DOMAIN_PRIORITY:
+        if scores.get(domain) == best:
+            return domain
+    return "general"
+
+
+def extract_age_from_message(message: str) -> Optional[int]:
+    """Extract child's age in months from the message."""
+    return _extract_age(message.lower())
+
+
+def score_domains(message: str) -> Dict[str, float]:
+    """
+    Score each domain by the weighted keywords found in the message.
+
+    Args:
+        message: Parent's chat message
+
+    Returns:
+        Dictionary of domain -> total keyword weight (only matched domains)
+    """
+    return _score_domains(message.lower())
+
+
+def detect_intent(message: str) -> str:
+    """Detect the domain of concern from the user message."""
+    return _best_domain(_score_domains(message.lower()))
+
+
+def parse_message(
+    message: str, span: Optional[Callable[[str], ContextManager]] = None
+) -> Tuple[Optional[int], str]:
+    """
+    Extract age and domain of concern, lowercasing the message only once.
+
+    Args:
+        message: Parent's chat message
+        span: Optional stage timer (e.g. Metrics.stage_timer), called with
+              'age_extraction' and 'intent_detection'
+
+    Returns:
+        Tuple of (age in months or None, domain)
+    """
+    text = message.lower()
+    if span is None:
+        return _extract_age(text), _best_domain(_score_domains(text))
+    with span("age_extraction"):
+        age = _extract_age(text)
+    with span("intent_detection"):
+        domain = _best_domain(_score_domains(text))
+    return age, domain
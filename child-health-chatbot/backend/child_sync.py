@@ -0,0 +1,331 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Set, Tuple
+
+from milestone_index import MilestoneIndex
+from scoring_engine import ChildScore, determine_status
+
+# Completed milestone IDs kept per child; far above any catalog, it bounds what a client can make us store
+MAX_COMPLETED_PER_CHILD = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_children (
+    child_id TEXT PRIMARY KEY,
+    age_months INTEGER NOT NULL,
+    token TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_completed (
+    child_id TEXT NOT NULL,
+    milestone_id TEXT NOT NULL,
+    PRIMARY KEY (child_id, milestone_id)
+) WITHOUT ROWID;
+"""
+
+
+def _id_hash(milestone_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(milestone_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _token(age_months: int, ids_hash: int) -> str:
+    return f"{age_months}.{ids_hash:016x}"
+
+
+class StaleVersion(Exception):
+    """A delta was based on a version token that is not the child's current one."""
+
+    def __init__(self, current: Optional[str]):
+        super().__init__("Version token is stale; send the full milestone list")
+        self.current = current
+
+
+class ChildState:
+    """
+    Milestones one child has completed, with the evaluation counters kept current.
+
+    completed holds every milestone ID the device reported; done is the
+    subset expected at age_months, as catalog positions, and
+    missing_red_flags counts the expected red-flag milestones not in done.
+    ids_hash is the XOR of the per-ID hashes of completed, so it is updated
+    per changed milestone and, with the age, gives the version token.
+    """
+
+    __slots__ = ("age_months", "completed", "ids_hash", "catalog_version", "expected", "expected_set",
+                 "done", "missing_red_flags")
+
+    def __init__(self, age_months: int, completed: Iterable[str]):
+        self.age_months = age_months
+        self.completed: Set[str] = set(completed)
+        self.ids_hash = 0
+        for milestone_id in self.completed:
+            self.ids_hash ^= _id_hash(milestone_id)
+        self.catalog_version = None
+        self.expected: Sequence[int] = ()
+        self.expected_set: FrozenSet[int] = frozenset()
+        self.done: Set[int] = set()
+        self.missing_red_flags = 0
+
+    @property
+    def token(self) -> str:
+        return _token(self.age_months, self.ids_hash)
+
+
+class ChildSyncStore:
+    """
+    Per-child milestone state for delta sync with the milestone-tracker app.
+
+    The app sends only milestones changed since the version token of its
+    last sync. Each delta adjusts the child's counters milestone by
+    milestone instead of rescoring the whole age bucket; a full rescore only
+    happens when the age or the loaded catalog changes.
+
+    Completed milestones live in SQLite, so every worker process sharing the
+    database file accepts the same tokens, and they survive restarts. A token
+    is derived from the child's age and completed set, not from a counter:
+    any worker can check it against the stored state, and it never matches a
+    different state. Each process keeps the derived counters of recently
+    synced children in an LRU; a child missing there, or last changed by
+    another worker, is rebuilt from the database first.
+    """
+
+    def __init__(self, path: str = ":memory:", maxsize: int = 100_000):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file shared by the workers, or ':memory:'
+            maxsize: Children whose counters this process keeps in memory
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.path = path
+        self.maxsize = maxsize
+        # Transactions are managed explicitly; BEGIN IMMEDIATE serializes writers across processes
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            # A commit lost to a power cut only costs the device a full sync
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._children: "OrderedDict[str, ChildState]" = OrderedDict()
+        self._expected_sets: Dict[Tuple[int, int], FrozenSet[int]] = {}
+        self._lock = threading.Lock()
+
+        self.deltas = 0
+        self.full_syncs = 0
+        self.rescores = 0
+        self.rebuilds = 0
+        self.stale = 0
+        self.evictions = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of children with stored state."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM sync_children").fetchone()[0]
+
+    def _expected_set(self, catalog_version: int, index: MilestoneIndex, age_months: int) -> FrozenSet[int]:
+        if not index.min_age <= age_months <= index.max_age:
+            return frozenset()
+        key = (catalog_version, age_months)
+        expected_set = self._expected_sets.get(key)
+        if expected_set is None:
+            if self._expected_sets and next(iter(self._expected_sets))[0] != catalog_version:
+                self._expected_sets.clear()
+            expected_set = self._expected_sets[key] = frozenset(index.positions(age_months))
+        return expected_set
+
+    def _rescore(self, state: ChildState, catalog_version: int, index: MilestoneIndex):
+        catalog = index.catalog
+        state.catalog_version = catalog_version
+        state.expected = index.positions(state.age_months)
+        state.expected_set = self._expected_set(catalog_version, index, state.age_months)
+        state.done = {
+            position for milestone_id in state.completed for position in catalog.positions(milestone_id)
+            if position in state.expected_set
+        }
+        state.missing_red_flags = sum(
+            1 for position in state.expected if catalog.red_flags[position] and position not in state.done
+        )
+        self.rescores += 1
+
+    def _mark(self, state: ChildState, index: MilestoneIndex, milestone_id: str, completed: bool) -> bool:
+        """Apply one change to state; False if it was already in effect."""
+        if (milestone_id in state.completed) == completed:
+            return False
+        if completed:
+            state.completed.add(milestone_id)
+        else:
+            state.completed.discard(milestone_id)
+        state.ids_hash ^= _id_hash(milestone_id)
+        # A repeated catalog ID completes every entry that has it, as in score_child
+        for position in index.catalog.positions(milestone_id):
+            if position not in state.expected_set:
+                continue
+            if completed:
+                state.done.add(position)
+            else:
+                state.done.discard(position)
+            if index.catalog.red_flags[position]:
+                state.missing_red_flags += -1 if completed else 1
+        return True
+
+    def _load(self, child_id: str, age_months: int, token: str) -> ChildState:
+        """The child's counters as of the stored token, from this process's LRU or the database."""
+        state = self._children.get(child_id)
+        if state is None or state.token != token:
+            rows = self.conn.execute("SELECT milestone_id FROM sync_completed WHERE child_id = ?", (child_id,))
+            state = ChildState(age_months, (milestone_id for milestone_id, in rows))
+            self.rebuilds += 1
+        return state
+
+    def sync(
+        self,
+        child_id: str,
+        catalog_version: int,
+        index: MilestoneIndex,
+        version: Optional[str],
+        age_months: Optional[int],
+        added: Iterable[str] = (),
+        removed: Iterable[str] = ()
+    ) -> Tuple[str, int, ChildScore]:
+        """
+        Apply a change set to a child's state and return the updated evaluation.
+
+        Args:
+            child_id: Child the device tracks
+            catalog_version: Version of the snapshot index belongs to
+            index: Milestone index of the current data snapshot
+            version: Token from the device's last sync; None for a full sync,
+                     where added is the complete list of completed milestones
+            age_months: Child's age; required on a full sync, None to keep it
+            added: Milestones newly marked as completed
+            removed: Milestones no longer marked as completed (applied before added)
+
+        Returns:
+            Tuple of (new version token, the child's age, ChildScore)
+
+        Raises:
+            StaleVersion: If version is not the child's current token
+            ValueError: If a full sync has no age, or the child would have more
+                        than MAX_COMPLETED_PER_CHILD completed milestones
+            sqlite3.OperationalError: If another process held the database
+                                      locked for longer than the busy timeout
+        """
+        added = list(added)
+        removed = list(removed)
+        if version is None:
+            if age_months is None:
+                raise ValueError("child_age_months is required on a full sync")
+            if len(set(added)) > MAX_COMPLETED_PER_CHILD:
+                raise ValueError(f"At most {MAX_COMPLETED_PER_CHILD} completed milestones per child")
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                state, changed = self._apply(child_id, catalog_version, index, version, age_months, added, removed)
+                if version is None:
+                    self.conn.execute("DELETE FROM sync_completed WHERE child_id = ?", (child_id,))
+                # Only milestones whose state changed are written, so a delta costs O(delta) rows
+                self.conn.executemany(
+                    "DELETE FROM sync_completed WHERE child_id = ? AND milestone_id = ?",
+                    [(child_id, milestone_id) for milestone_id in changed if milestone_id not in state.completed]
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO sync_completed (child_id, milestone_id) VALUES (?, ?)",
+                    [(child_id, milestone_id) for milestone_id in changed if milestone_id in state.completed]
+                )
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sync_children (child_id, age_months, token) VALUES (?, ?, ?)",
+                    (child_id, state.age_months, state.token)
+                )
+                self.conn.execute("COMMIT")
+            except StaleVersion:
+                self.conn.execute("ROLLBACK")
+                raise
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                # The cached counters may already include the rolled-back change
+                self._children.pop(child_id, None)
+                raise
+
+            self._children[child_id] = state
+            self._children.move_to_end(child_id)
+            while len(self._children) > self.maxsize:
+                self._children.popitem(last=False)
+                self.evictions += 1
+            return state.token, state.age_months, self._score(state, index)
+
+    def _apply(
+        self,
+        child_id: str,
+        catalog_version: int,
+        index: MilestoneIndex,
+        version: Optional[str],
+        age_months: Optional[int],
+        added: Sequence[str],
+        removed: Sequence[str]
+    ) -> Tuple[ChildState, Set[str]]:
+        """Update the child's counters inside sync's transaction; returns them and the changed milestone IDs."""
+        if version is None:
+            state = ChildState(age_months, added)
+            self._rescore(state, catalog_version, index)
+            self.full_syncs += 1
+            return state, state.completed
+
+        row = self.conn.execute(
+            "SELECT age_months, token FROM sync_children WHERE child_id = ?", (child_id,)
+        ).fetchone()
+        if row is None or row[1] != version:
+            self.stale += 1
+            raise StaleVersion(row[1] if row is not None else None)
+        state = self._load(child_id, row[0], row[1])
+        if len(state.completed) + len(added) > MAX_COMPLETED_PER_CHILD:
+            raise ValueError(f"At most {MAX_COMPLETED_PER_CHILD} completed milestones per child")
+        if (age_months is not None and age_months != state.age_months) or catalog_version != state.catalog_version:
+            state.age_months = state.age_months if age_months is None else age_months
+            self._rescore(state, catalog_version, index)
+        changed = {milestone_id for milestone_id in removed if self._mark(state, index, milestone_id, False)}
+        changed.update(milestone_id for milestone_id in added if self._mark(state, index, milestone_id, True))
+        self.deltas += 1
+        return state, changed
+
+    @staticmethod
+    def _score(state: ChildState, index: MilestoneIndex) -> ChildScore:
+        red_flags = index.catalog.red_flags
+        missing = [position for position in state.expected if position not in state.done]
+        total_expected = len(state.expected)
+        total_completed = len(state.done)
+        return ChildScore(
+            status=determine_status(total_completed, total_expected, state.missing_red_flags > 0),
+            completion_rate=(total_completed / total_expected) * 100 if total_expected > 0 else 0.0,
+            total_expected=total_expected,
+            total_completed=total_completed,
+            completed_positions=[position for position in state.expected if position in state.done],
+            missing_positions=missing,
+            red_flag_positions=[position for position in missing if red_flags[position]],
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring; everything but children counts this process only."""
+        with self._lock:
+            return {
+                "children": self.conn.execute("SELECT COUNT(*) FROM sync_children").fetchone()[0],
+                "cached": len(self._children),
+                "maxsize": self.maxsize,
+                "deltas": self.deltas,
+                "full_syncs": self.full_syncs,
+                "rescores": self.rescores,
+                "rebuilds": self.rebuilds,
+                "stale": self.stale,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class PoolSaturated(Exception):
+    """Raised when max_pending computations are already queued or running."""
+
+
+def percentiles(samples, points=(50, 90, 95, 99)) -> Dict[str, float]:
+    """Nearest-rank percentiles of a sample, e.g. {"p50": ..., "p99": ...}."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {f"p{point}": 0.0 for point in points}
+    last = len(ordered) - 1
+    return {f"p{point}": ordered[min(last, round(point / 100 * last))] for point in points}
+
+
+class ComputePool:
+    """
+    Bounded worker pool for CPU-bound request work, with request coalescing.
+
+    Handlers await run() instead of scoring on the event loop, so one large
+    evaluation no longer stalls every other connection. Backpressure: once
+    max_pending computations are queued or running, run() raises
+    PoolSaturated instead of queueing without limit. Concurrent calls with the
+    same key share a single computation.
+
+    Threads rather than processes: the work reads the in-memory DataSnapshot,
+    which a process pool would have to copy to every worker.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 256, latency_samples: int = 10_000):
+        """
+        Args:
+            max_workers: Worker threads
+            max_pending: Computations allowed to be queued or running at once
+            latency_samples: Most recent compute latencies kept for percentiles
+        """
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be at least 1")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="compute")
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._latencies = deque(maxlen=latency_samples)
+
+        self.pending = 0
+        self.submitted = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def _call(self, key: Optional[Hashable], fn: Callable, args: tuple, submitted_at: float):
+        try:
+            return fn(*args)
+        finally:
+            # Release the slot before the result is published, so a caller woken
+            # by it always sees the pool with room again
+            with self._lock:
+                self.pending -= 1
+                self._latencies.append(time.perf_counter() - submitted_at)
+                if key is not None:
+                    self._inflight.pop(key, None)
+
+    def submit(self, key: Optional[Hashable], fn: Callable, *args) -> Future:
+        """
+        Start fn(*args) on the pool, or join the in-flight computation for key.
+
+        Args:
+            key: Normalized request key for coalescing (None to never coalesce)
+            fn: Function to run on a worker thread
+
+        Raises:
+            PoolSaturated: If max_pending computations are already in flight
+        """
+        with self._lock:
+            if key is not None:
+                future = self._inflight.get(key)
+                if future is not None:
+                    self.coalesced += 1
+                    return future
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PoolSaturated(f"{self.pending} computations already pending")
+
+            self.pending += 1
+            self.submitted += 1
+            future = self._executor.submit(self._call, key, fn, args, time.perf_counter())
+            if key is not None:
+                self._inflight[key] = future
+        return future
+
+    async def run(self, key: Optional[Hashable], fn: Callable, *args) -> Any:
+        """
+        Await fn(*args) on the pool without blocking the event loop.
+
+        A caller that disconnects does not cancel the shared computation,
+        since other coalesced callers may still be waiting for it.
+        """
+        future = self.submit(key, fn, *args)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, configuration and compute latency percentiles (ms) for monitoring."""
+        with self._lock:
+            latencies = list(self._latencies)
+            stats = {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "rejected": self.rejected,
+            }
+        stats["latency_ms"] = {name: round(value * 1000, 3) for name, value in percentiles(latencies).items()}
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,234 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from catalog_artifact import load_artifact, source_key, write_artifact
+from milestone_catalog import MilestoneCatalog
+from milestone_index import MilestoneIndex
+from milestone_payloads import MilestoneFragments
+from recommendation_index import RecommendationIndex
+from scoring_engine import BatchScorer, ScoringEngine
+
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """
+    Immutable view of the loaded milestone and recommendation data.
+
+    Handlers read DataStore.current() once per request, so a reload never
+    changes the data underneath an in-flight request.
+    """
+    version: int
+    content_hash: str
+    loaded_at: float
+    catalog: MilestoneCatalog
+    milestone_index: MilestoneIndex
+    scoring: ScoringEngine
+    fragments: MilestoneFragments
+    recommendations: List[Dict]
+    recommendation_index: RecommendationIndex
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def content_hash(*contents: bytes) -> str:
+    """Hash identifying a set of data file contents."""
+    digest = hashlib.sha256()
+    for content in contents:
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()[:12]
+
+
+class DataStore:
+    """
+    Holds the current DataSnapshot and rebuilds it when the data files change.
+
+    A reload reads, validates and indexes the new files completely before the
+    new snapshot is swapped in; if any step fails the old snapshot stays live.
+    """
+
+    def __init__(
+        self,
+        milestones_path: str,
+        recommendations_path: str,
+        validate_milestones: Callable[[List[Dict]], Iterable[Dict]],
+        on_swap: Optional[Callable[[DataSnapshot], None]] = None,
+        artifact_path: Optional[str] = None,
+        schema_fingerprint: str = ""
+    ):
+        """
+        Load the initial snapshot. Errors propagate so the caller can refuse to start.
+
+        Args:
+            milestones_path: Path to milestones_data.json
+            recommendations_path: Path to recommendations.json
+            validate_milestones: Validates raw milestone entries and returns them as dicts
+            on_swap: Called with each new snapshot after it goes live (e.g. to clear caches)
+            artifact_path: Compiled catalog to load instead of validating, rebuilt when stale
+            schema_fingerprint: Invalidates the artifact when the validation schema changes
+        """
+        self.milestones_path = milestones_path
+        self.recommendations_path = recommendations_path
+        self.validate_milestones = validate_milestones
+        self.on_swap = on_swap
+        self.artifact_path = artifact_path
+        self.schema_fingerprint = schema_fingerprint
+        self.catalog_source: Optional[str] = None
+
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self.last_error: Optional[str] = None
+        self.reloading = False
+
+        self._snapshot = self._build(version=1)
+
+    def current(self) -> DataSnapshot:
+        """The live snapshot. Reading one attribute is atomic, so no lock is needed."""
+        return self._snapshot
+
+    def _build(self, version: int) -> DataSnapshot:
+        milestones_raw = _read(self.milestones_path)
+        recommendations_raw = _read(self.recommendations_path)
+
+        catalog = self._load_catalog(milestones_raw)
+        milestone_index = MilestoneIndex(catalog)
+        recommendations = json.load(io.BytesIO(recommendations_raw))
+
+        return DataSnapshot(
+            version=version,
+            content_hash=content_hash(milestones_raw, recommendations_raw),
+            loaded_at=time.time(),
+            catalog=catalog,
+            milestone_index=milestone_index,
+            scoring=ScoringEngine(milestone_index, BatchScorer(milestone_index)),
+            fragments=MilestoneFragments(catalog),
+            recommendations=recommendations,
+            recommendation_index=RecommendationIndex(recommendations),
+        )
+
+    def _load_catalog(self, milestones_raw: bytes) -> MilestoneCatalog:
+        """Use the compiled artifact when it matches, otherwise validate and recompile."""
+        if not self.artifact_path:
+            self.catalog_source = "validated"
+            return MilestoneCatalog(self.validate_milestones(json.load(io.BytesIO(milestones_raw))))
+
+        key = source_key(milestones_raw, self.schema_fingerprint)
+        catalog = load_artifact(self.artifact_path, key)
+        if catalog is not None:
+            self.catalog_source = "artifact"
+            return catalog
+
+        catalog = MilestoneCatalog(self.validate_milestones(json.load(io.BytesIO(milestones_raw))))
+        self.catalog_source = "validated"
+        try:
+            write_artifact(self.artifact_path, key, catalog)
+        except OSError as e:
+            # A read-only deployment still serves; it just validates on every start
+            print(f"⚠️ Could not write catalog artifact {self.artifact_path}: {e}")
+        return catalog
+
+    def reload(self) -> DataSnapshot:
+        """
+        Rebuild from disk and swap the new snapshot in if the content changed.
+
+        Returns:
+            The live snapshot after the reload
+
+        Raises:
+            Whatever loading or validation raised; the old snapshot stays live
+        """
+        with self._reload_lock:
+            self.reloading = True
+            try:
+                current = self._snapshot
+                if content_hash(_read(self.milestones_path), _read(self.recommendations_path)) == current.content_hash:
+                    return current
+
+                snapshot = self._build(version=current.version + 1)
+                self._snapshot = snapshot
+                self.last_error = None
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                self.reloading = False
+
+        print(f"✅ Reloaded data as version {snapshot.version} ({len(snapshot.catalog)} milestones)")
+        if self.on_swap:
+            self.on_swap(snapshot)
+        return snapshot
+
+    def _reload_quietly(self):
+        try:
+            self.reload()
+        except Exception as e:
+            print(f"❌ Data reload failed, keeping version {self._snapshot.version}.\n{e}")
+
+    def reload_in_background(self) -> bool:
+        """
+        Start a reload on a background thread.
+
+        Returns:
+            False if a reload is already running
+        """
+        if self._reload_lock.locked():
+            return False
+        threading.Thread(target=self._reload_quietly, name="data-reload", daemon=True).start()
+        return True
+
+    def _file_state(self) -> Tuple:
+        return tuple(
+            (stat.st_mtime_ns, stat.st_size)
+            for stat in (os.stat(self.milestones_path), os.stat(self.recommendations_path))
+        )
+
+    def start_watching(self, interval_seconds: float):
+        """Poll the data files and reload when their size or mtime changes."""
+        if self._watcher is not None:
+            return
+        self._stop_watching.clear()
+        # Baseline taken before the thread starts so no change can slip in between
+        initial_state = self._file_state()
+
+        def watch():
+            last_state = initial_state
+            while not self._stop_watching.wait(interval_seconds):
+                try:
+                    state = self._file_state()
+                except OSError:
+                    continue  # file is being replaced; try again next tick
+                if state != last_state:
+                    last_state = state
+                    self._reload_quietly()
+
+        self._watcher = threading.Thread(target=watch, name="data-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._stop_watching.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def status(self) -> Dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "content_hash": snapshot.content_hash,
+            "loaded_at": snapshot.loaded_at,
+            "milestones": len(snapshot.catalog),
+            "recommendations": len(snapshot.recommendations),
+            "reloading": self.reloading,
+            "watching": self._watcher is not None,
+            "catalog_source": self.catalog_source,
+            "last_error": self.last_error,
+        }
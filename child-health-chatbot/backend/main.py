@@ -1,9 +1,23 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
+from starlette.requests import ClientDisconnect
 import json
-import re
-from typing import Optional, List, Dict
+import os
+import sqlite3
+from typing import Optional, List, Dict, FrozenSet, Iterable, Tuple, Union
+
+from assessment_schema import validate_assessments
+from assessment_stream import MAX_LINE_BYTES, milestone_achieved, ndjson_batches
+from child_sync import ChildSyncStore, StaleVersion
+from chat_nlu import parse_message
+from compute_pool import ComputePool, PoolSaturated
+from data_store import DataSnapshot, DataStore
+from evaluation_cache import EvaluationCache
+from metrics import Metrics, MetricsMiddleware, timed_route_class
+from milestone_payloads import FIELDS_FULL, EncodedJSONResponse, MilestoneFields, NDJSONStreamResponse, dumps, loads
+from scoring_engine import ChildScore, normalize_completed, status_counts
 
 app = FastAPI(title="Child Health Chatbot API")
 
@@ -23,6 +37,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request and per-stage latency histograms, served at /metrics. With
+# METRICS_ENABLED=0 neither the middleware nor the timed routes are installed.
+METRICS = Metrics(enabled=os.getenv("METRICS_ENABLED", "1") != "0")
+if METRICS.enabled:
+    app.router.route_class = timed_route_class(METRICS)
+    app.add_middleware(MetricsMiddleware, metrics=METRICS)
+
 from pydantic import BaseModel, ValidationError, Field
 
 # ... imports ...
@@ -49,13 +70,66 @@ class MilestoneEntry(BaseModel):
     who_criteria: bool
     options: List[MilestoneOption] = Field(..., min_items=1, description="List of options (e.g., Yes/No) is required")
 
-# Load and validate milestone data
+MILESTONES_PATH = "data/milestones_data.json"
+RECOMMENDATIONS_PATH = "data/recommendations.json"
+
+def _validate_milestones(raw_data: List[Dict]) -> Iterable[Dict]:
+    """Validate raw entries against MilestoneEntry; consumed lazily by the catalog."""
+    return (MilestoneEntry(**item).dict() for item in raw_data)
+
+# Compiled catalog (see catalog_artifact.py). When set, workers skip per-entry
+# validation as long as the data file and schema are unchanged.
+MILESTONE_CATALOG_ARTIFACT = os.getenv("MILESTONE_CATALOG_ARTIFACT") or None
+MILESTONE_SCHEMA_FINGERPRINT = json.dumps(MilestoneEntry.model_json_schema(), sort_keys=True)
+
+# Parents re-evaluate the same age and milestone set repeatedly
+EVALUATION_CACHE = EvaluationCache(
+    maxsize=int(os.getenv("EVALUATION_CACHE_SIZE", "4096")),
+    ttl_seconds=float(os.getenv("EVALUATION_CACHE_TTL", "300"))
+)
+
+# CPU-bound scoring runs here rather than on the event loop. Identical
+# in-flight evaluations share one computation, and past EVALUATION_MAX_PENDING
+# queued computations new ones get 503 instead of piling up.
+COMPUTE_POOL = ComputePool(
+    max_workers=int(os.getenv("EVALUATION_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    max_pending=int(os.getenv("EVALUATION_MAX_PENDING", "256"))
+)
+
+# Per-child milestone state for /children/{child_id}/sync. Every uvicorn worker
+# opens the same SQLite file, so a delta is accepted by whichever worker gets it.
+CHILD_SYNC = ChildSyncStore(
+    path=os.getenv("CHILD_SYNC_DB", "data/child_sync.sqlite"),
+    maxsize=int(os.getenv("CHILD_SYNC_MAX_CHILDREN", "100000"))
+)
+
+# Syncs wait on the store's lock and on other workers' SQLite write locks, so
+# they get their own pool rather than holding COMPUTE_POOL threads meanwhile.
+# The store runs one sync at a time, so one thread is all it can use.
+SYNC_POOL = ComputePool(
+    max_workers=1,
+    max_pending=int(os.getenv("CHILD_SYNC_MAX_PENDING", "64"))
+)
+
+# Longest accepted line on /assessments/stream (one assessment)
+ASSESSMENT_STREAM_MAX_LINE = int(os.getenv("ASSESSMENT_STREAM_MAX_LINE", str(MAX_LINE_BYTES)))
+
+def _pool_saturated() -> HTTPException:
+    return HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+# Load and validate milestone and recommendation data. Later reloads swap in a
+# new snapshot atomically and clear the evaluation cache.
 try:
-    with open("data/milestones_data.json", "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
-        # Validate data against schema
-        MILESTONES_DATA = [MilestoneEntry(**item).dict() for item in raw_data]
-        print(f"✅ Successfully validated {len(MILESTONES_DATA)} milestones.")
+    DATA_STORE = DataStore(
+        MILESTONES_PATH, RECOMMENDATIONS_PATH, _validate_milestones,
+        on_swap=lambda snapshot: EVALUATION_CACHE.clear(),
+        artifact_path=MILESTONE_CATALOG_ARTIFACT,
+        schema_fingerprint=MILESTONE_SCHEMA_FINGERPRINT
+    )
+    if DATA_STORE.catalog_source == "artifact":
+        print(f"✅ Loaded {len(DATA_STORE.current().catalog)} milestones from {MILESTONE_CATALOG_ARTIFACT}.")
+    else:
+        print(f"✅ Successfully validated {len(DATA_STORE.current().catalog)} milestones.")
 except ValidationError as e:
     print(f"❌ CRITICAL ERROR: Milestone data validation failed!\n{e}")
     raise SystemExit(1)
@@ -111,6 +185,7 @@ STIMULATION_ACTIVITIES = {
 class ChatQuery(BaseModel):
     message: str
     child_age_months: Optional[int] = None
+    seed: Optional[int] = None  # makes the recommendation pick reproducible
 
 class ChatResponse(BaseModel):
     response: str
@@ -128,184 +203,391 @@ class EvaluationResponse(BaseModel):
     completion_rate: float
     total_expected: int
     total_completed: int
-    missing_milestones: List[Dict]
-    red_flags: List[Dict]
+    missing_milestones: List[Union[Dict, str]]  # milestone IDs with ?fields=ids
+    red_flags: List[Union[Dict, str]]
     recommendations: List[str]
     message: str
 
+class BatchEvaluationRequest(BaseModel):
+    children: List[EvaluationRequest] = Field(..., min_items=1, max_items=5000)
+
+class BatchEvaluationResponse(BaseModel):
+    results: List[EvaluationResponse]
+    total_children: int
+    status_counts: Dict[str, int]  # children per result status
+    children_with_red_flags: int
+
+class SyncRequest(BaseModel):
+    version: Optional[str] = None  # token from the last sync; omit for a full sync
+    child_age_months: Optional[int] = None  # required on a full sync; send when it changes
+    added: List[str] = Field(default_factory=list, max_items=5000)  # full completed list on a full sync
+    removed: List[str] = Field(default_factory=list, max_items=5000)
+    child_name: Optional[str] = "Child"
+
+class SyncResponse(BaseModel):
+    version: str
+    evaluation: EvaluationResponse
 
-def extract_age_from_message(message: str) -> Optional[int]:
-    """Extract child's age in months from the message."""
-    # Pattern: "X months", "X month", "X-month"
-    patterns = [
-        r'(\d+)\s*months?\s+old',
-        r'(\d+)\s*months?',
-        r'(\d+)-month',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, message.lower())
-        if match:
-            return int(match.group(1))
-    
-    # Pattern: "X years" - convert to months
-    year_pattern = r'(\d+)\s*years?\s+old'
-    match = re.search(year_pattern, message.lower())
-    if match:
-        return int(match.group(1)) * 12
-    
-    return None
 
 import random
 
 # ... (Previous imports and variables remain)
 
-# Load recommendations data
-with open("data/recommendations.json", "r", encoding="utf-8") as f:
-    RECOMMENDATIONS_DATA = json.load(f)
-
-# Keyword Mapper
-KEYWORD_MAP = {
-    # Motor
-    "walk": "motor", "run": "motor", "crawl": "motor", "sit": "motor", 
-    "stand": "motor", "move": "motor", "grasp": "motor", "hold": "motor",
-    # Language
-    "talk": "language", "speak": "language", "word": "language", 
-    "say": "language", "babble": "language", "sound": "language", 
-    "listen": "language", "understand": "language",
-    # Social
-    "smile": "social", "play": "social", "cry": "social", 
-    "laugh": "social", "look": "social", "eye": "social", 
-    "stranger": "social", "fear": "social"
-}
-
-# ... (Previous validations remain)
+def get_smart_recommendation(domain: str, age_months: int, rng: Optional[random.Random] = None) -> str:
+    """Get a relevant recommendation based on domain and age."""
+    return DATA_STORE.current().recommendation_index.choose(domain, age_months, rng)
+
+def _chat_reply(query: ChatQuery) -> ChatResponse:
+    """Parse the message and pick a recommendation (runs on the compute pool)."""
+    # Extract age and detect intent in one pass over the message
+    message_age, target_domain = parse_message(query.message, METRICS.stage_timer("/api/chat"))
+    age_months = query.child_age_months
+    if not age_months:
+        age_months = message_age
+        
+    if not age_months:
+         return ChatResponse(
+            response="Could you please tell me your child's age in months? This helps me give better advice.",
+            response_type="normal"
+        )
 
-def detect_intent(message: str) -> str:
-    """Detect the domain of concern from the user message."""
-    message_lower = message.lower()
+    # Get Recommendation
+    rng = random.Random(query.seed) if query.seed is not None else None
+    with METRICS.span("/api/chat", "recommendation_lookup"):
+        recommendation = get_smart_recommendation(target_domain, age_months, rng)
     
-    # Check for keywords
-    for keyword, domain in KEYWORD_MAP.items():
-        if keyword in message_lower:
-            return domain
-            
-    return "general"
-
-def get_smart_recommendation(domain: str, age_months: int) -> str:
-    """Get a relevant recommendation based on domain and age."""
-    relevant_recs = []
+    # Construct Response
+    response_text = f"Based on your concern about {target_domain} skills for a {age_months}-month-old:\n\n{recommendation}"
     
-    for rec in RECOMMENDATIONS_DATA:
-        # Check domain match (or if rec is general fallback)
-        if rec["domain"] == domain or rec["domain"] == "general":
-            # Check age range
-            if rec["min_age"] <= age_months <= rec["max_age"]:
-                relevant_recs.append(rec)
-                
-    if not relevant_recs:
-        # Fallback to pure general if specific domain yields nothing
-        for rec in RECOMMENDATIONS_DATA:
-             if rec["domain"] == "general" and rec["min_age"] <= age_months <= rec["max_age"]:
-                 relevant_recs.append(rec)
-
-    if relevant_recs:
-        selected = random.choice(relevant_recs)
-        return selected["text"]
-        
-    return "Please consult a pediatrician for specific advice."
+    # (Optional) Preserve existing "Check for red flags" logic if needed, 
+    # but for this refactor we focus on the recommendation engine response.
+    
+    return ChatResponse(
+        response=response_text,
+        response_type="normal",
+        referral_needed=False
+    )
 
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat_endpoint(query: ChatQuery):
     """Main chatbot endpoint with smart filtering."""
     try:
-        # Extract age
-        age_months = query.child_age_months
-        if not age_months:
-            age_months = extract_age_from_message(query.message)
-            
-        if not age_months:
-             return ChatResponse(
-                response="Could you please tell me your child's age in months? This helps me give better advice.",
-                response_type="normal"
-            )
-
-        # Detect Intent
-        target_domain = detect_intent(query.message)
-        
-        # Get Recommendation
-        recommendation = get_smart_recommendation(target_domain, age_months)
-        
-        # Construct Response
-        response_text = f"Based on your concern about {target_domain} skills for a {age_months}-month-old:\n\n{recommendation}"
-        
-        # (Optional) Preserve existing "Check for red flags" logic if needed, 
-        # but for this refactor we focus on the recommendation engine response.
-        
-        return ChatResponse(
-            response=response_text,
-            response_type="normal",
-            referral_needed=False
-        )
-    
+        # Only seeded replies are deterministic, so only those can be shared
+        key = None
+        if query.seed is not None:
+            key = ("chat", query.message, query.child_age_months, query.seed, DATA_STORE.current().version)
+        return await COMPUTE_POOL.run(key, _chat_reply, query)
+    except PoolSaturated:
+        raise _pool_saturated()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-# ... (Evaluation endpoint and main block remain)
-# Re-adding evaluate endpoint and main block to ensure file validity
-@app.post("/evaluate", response_model=EvaluationResponse)
-async def evaluate_milestones(request: EvaluationRequest):
-    # ... (Same as before)
-    # Simplified for brevity in this replace block, normally implies keeping existing code
-    # But since I must replace completely or correctly patch, I will include the minimal necessary
-    # logic or assume the user wants me to KEEP the evaluation logic. 
-    # To be safe, I will paste the previous evaluation logic here.
-    return await _evaluate_logic(request) # Refactoring out to helper for cleanliness or just paste logic back.
-
-# Let's actually keep the existing evaluate logic inline to avoid errors
+def _evaluation_head(snapshot: DataSnapshot, score: ChildScore, fields: str) -> bytes:
+    """
+    Encode an evaluation body up to the message, joining pre-encoded milestones.
+
+    Produces the same JSON as EvaluationResponse, without hydrating milestone
+    dicts or validating them again. The message depends on the child's name
+    and is appended by _evaluation_body, so the head can be cached.
+    """
+    recommendations = []
+    if score.status not in ('On Track', 'No Data'):
+        recommendations.append("Please consult a health worker.")
+
+    fragments = snapshot.fragments
+    return b"".join([
+        b'{"result":', dumps(score.status),
+        b',"completion_rate":', dumps(round(float(score.completion_rate), 1)),
+        b',"total_expected":', dumps(score.total_expected),
+        b',"total_completed":', dumps(score.total_completed),
+        b',"missing_milestones":', fragments.array(score.missing_positions, fields),
+        b',"red_flags":', fragments.array(score.red_flag_positions, fields),
+        b',"recommendations":', dumps(recommendations),
+        b',"message":',
+    ])
+
+def _evaluation_body(head: bytes, message: str) -> bytes:
+    return head + dumps(message) + b"}"
+
+def _evaluation_message(status: str, age_months: int, child_name: str) -> str:
+    if status == "No Data":
+        return f"No milestone data available for {age_months} months."
+    return f"Evaluation complete for {child_name}."
+
+def _score_evaluation(
+    snapshot: DataSnapshot, age_months: int, completed_milestone_ids: FrozenSet[str], fields: str
+) -> Tuple[str, bytes]:
+    """
+    Score an age and completed-milestone set with the snapshot's scoring engine.
+
+    The result does not depend on the child's name, so it can be cached;
+    the message is filled in per request by _evaluate_logic.
+
+    Returns:
+        Tuple of (status, encoded body head)
+    """
+    with METRICS.span("/evaluate", "milestone_filtering"):
+        score = snapshot.scoring.score(age_months, completed_milestone_ids)
+    with METRICS.span("/evaluate", "response_encoding"):
+        return score.status, _evaluation_head(snapshot, score, fields)
+
+def _score_and_cache(
+    snapshot: DataSnapshot, age_months: int, completed_milestone_ids: FrozenSet[str], fields: str, cache_key
+) -> Tuple[str, bytes]:
+    scored = _score_evaluation(snapshot, age_months, completed_milestone_ids, fields)
+    EVALUATION_CACHE.put(cache_key, scored)
+    return scored
+
+async def _evaluate_logic(request: EvaluationRequest, fields: str = FIELDS_FULL) -> EncodedJSONResponse:
+    """
+    Evaluate a request, reusing cached scores for repeated inputs.
+
+    Cache misses are scored on the compute pool; concurrent misses for the
+    same key wait on a single computation.
+    """
     try:
+        # One snapshot for the whole request, even if a reload lands meanwhile
+        snapshot = DATA_STORE.current()
         age_months = request.child_age_months
-        completed_milestone_ids = request.completed_milestones
-        child_name = request.child_name
-        
-        expected_milestones = []
-        for milestone in MILESTONES_DATA:
-            if age_months >= milestone["age_range_months"]["min"]:
-                if age_months <= milestone["age_range_months"]["max"] + 6:
-                    expected_milestones.append(milestone)
+        completed_milestone_ids = normalize_completed(request.completed_milestones)
         
-        if not expected_milestones:
-            return EvaluationResponse(
-                result="No Data", completion_rate=0.0, total_expected=0, total_completed=0,
-                missing_milestones=[], red_flags=[], recommendations=[],
-                message=f"No milestone data available for {age_months} months."
+        cache_key = (age_months, completed_milestone_ids, snapshot.version, fields)
+        scored = EVALUATION_CACHE.get(cache_key)
+        if scored is None:
+            scored = await COMPUTE_POOL.run(
+                cache_key, _score_and_cache, snapshot, age_months, completed_milestone_ids, fields, cache_key
             )
-            
-        total_expected = len(expected_milestones)
-        completed_milestones = [m for m in expected_milestones if m['milestone_id'] in completed_milestone_ids]
-        total_completed = len(completed_milestones)
-        completion_rate = (total_completed / total_expected) * 100 if total_expected > 0 else 0
-        
-        missing_milestones = [m for m in expected_milestones if m['milestone_id'] not in completed_milestone_ids]
-        red_flags = [m for m in missing_milestones if m.get('red_flag', False)]
-        
-        status = 'Referral Needed' if red_flags else 'On Track' if completion_rate == 100 else 'Needs Support' if completion_rate >= 50 else 'Referral Needed'
-        
-        recommendations = [] # ... (Recommendation logic can be simplified or kept)
-        if status != 'On Track':
-             recommendations.append("Please consult a health worker.")
 
-        message = f"Evaluation complete for {child_name}."
+        status, head = scored
+        return EncodedJSONResponse(_evaluation_body(head, _evaluation_message(status, request.child_age_months, request.child_name)))
+    except PoolSaturated:
+        raise _pool_saturated()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        return EvaluationResponse(
-            result=status, completion_rate=round(completion_rate, 1),
-            total_expected=total_expected, total_completed=total_completed,
-            missing_milestones=missing_milestones, red_flags=red_flags,
-            recommendations=recommendations, message=message
+@app.post("/evaluate", response_model=EvaluationResponse)
+async def evaluate_milestones(request: EvaluationRequest, fields: MilestoneFields = FIELDS_FULL):
+    """
+    Evaluate a child's milestone progress.
+
+    With ?fields=ids, missing_milestones and red_flags list milestone IDs
+    only, for low-bandwidth devices that already hold the catalog.
+    """
+    return await _evaluate_logic(request, fields)
+
+def _score_batch(snapshot: DataSnapshot, children: List[EvaluationRequest], fields: str) -> bytes:
+    with METRICS.span("/evaluate/batch", "milestone_filtering"):
+        scores = snapshot.scoring.score_many(
+            [child.child_age_months for child in children],
+            [child.completed_milestones for child in children]
         )
+
+    with METRICS.span("/evaluate/batch", "response_encoding"):
+        results = b",".join([
+            _evaluation_body(_evaluation_head(snapshot, score, fields), _evaluation_message(score.status, child.child_age_months, child.child_name))
+            for score, child in zip(scores, children)
+        ])
+        return b"".join([
+            b'{"results":[', results,
+            b'],"total_children":', dumps(len(children)),
+            b',"status_counts":', dumps(status_counts(scores)),
+            b',"children_with_red_flags":', dumps(sum(1 for score in scores if score.red_flag_positions)),
+            b"}",
+        ])
+
+@app.post("/evaluate/batch", response_model=BatchEvaluationResponse)
+async def evaluate_batch(request: BatchEvaluationRequest, fields: MilestoneFields = FIELDS_FULL):
+    """Evaluate a whole sync batch of children in one vectorized pass (?fields=ids as for /evaluate)."""
+    try:
+        body = await COMPUTE_POOL.run(None, _score_batch, DATA_STORE.current(), request.children, fields)
+        return EncodedJSONResponse(body)
+    except PoolSaturated:
+        raise _pool_saturated()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _line_error(line_number: int, error_type: str, message: str) -> Dict:
+    return {"index": line_number, "path": f"line[{line_number}]", "type": error_type, "message": message}
+
+def _line_result(line_number: int, errors: List[Dict]) -> bytes:
+    return b"".join([b'{"line":', dumps(line_number), b',"ok":false,"errors":', dumps(errors), b"}\n"])
+
+def _evaluate_assessment_lines(
+    snapshot: DataSnapshot, lines: List[Tuple[int, Optional[bytes]]], fields: str, counts: Dict[str, int]
+) -> bytes:
+    """
+    Validate, score and encode the NDJSON lines from one request chunk (runs on the compute pool).
+
+    Each line becomes one result line: the evaluation of a valid assessment,
+    or every validation error with its path (line[<n>].milestones[0].domain).
+    counts accumulates per-status totals for the closing summary line.
+    """
+    results: Dict[int, bytes] = {}
+    valid: List[Tuple[int, Dict]] = []
+    with METRICS.span("/assessments/stream", "validation"):
+        for line_number, line in lines:
+            if line is None:
+                results[line_number] = _line_result(line_number, [
+                    _line_error(line_number, "line_too_long", f"Lines are limited to {ASSESSMENT_STREAM_MAX_LINE} bytes")
+                ])
+                continue
+            try:
+                record = loads(line)
+            except ValueError as e:
+                results[line_number] = _line_result(line_number, [_line_error(line_number, "json_invalid", str(e))])
+                continue
+            records, errors = validate_assessments([record], prefix="line", offset=line_number)
+            if errors:
+                results[line_number] = _line_result(line_number, errors)
+            else:
+                valid.append((line_number, records[0]))
+    counts["invalid"] += len(results)
+
+    with METRICS.span("/assessments/stream", "milestone_filtering"):
+        scores = snapshot.scoring.score_many(
+            [record["age_months"] for _, record in valid],
+            [[entry["milestone_id"] for entry in record["milestones"] if milestone_achieved(entry)] for _, record in valid]
+        ) if valid else []
+
+    with METRICS.span("/assessments/stream", "response_encoding"):
+        for (line_number, record), score in zip(valid, scores):
+            counts[score.status] = counts.get(score.status, 0) + 1
+            message = _evaluation_message(score.status, record["age_months"], record["child_id"])
+            results[line_number] = b"".join([
+                b'{"line":', dumps(line_number),
+                b',"ok":true,"child_id":', dumps(record["child_id"]),
+                b',"assessment_date":', dumps(record["assessment_date"]),
+                b',"evaluation":', _evaluation_body(_evaluation_head(snapshot, score, fields), message),
+                b"}\n",
+            ])
+        counts["valid"] += len(valid)
+        return b"".join(results[line_number] for line_number, _ in lines)
+
+async def _stream_assessment_results(request: Request, fields: str):
+    snapshot = DATA_STORE.current()
+    counts = {"valid": 0, "invalid": 0}
+    try:
+        async for lines in ndjson_batches(request.stream(), ASSESSMENT_STREAM_MAX_LINE):
+            try:
+                yield await COMPUTE_POOL.run(None, _evaluate_assessment_lines, snapshot, lines, fields, counts)
+            except PoolSaturated:
+                # The response has started; report these lines as retryable rather than failing the upload
+                counts["invalid"] += len(lines)
+                yield b"".join(
+                    _line_result(n, [_line_error(n, "server_busy", "Server busy, please resend this record")])
+                    for n, _ in lines
+                )
+    except ClientDisconnect:
+        return
+    valid, invalid = counts.pop("valid"), counts.pop("invalid")
+    yield b"".join([
+        b'{"summary":{"records":', dumps(valid + invalid),
+        b',"valid":', dumps(valid), b',"invalid":', dumps(invalid),
+        b',"status_counts":', dumps(counts), b"}}\n",
+    ])
+
+@app.post("/assessments/stream", response_class=NDJSONStreamResponse)
+async def stream_assessments(request: Request, fields: MilestoneFields = FIELDS_FULL):
+    """
+    Validate and evaluate newline-delimited assessments as the body streams in.
+
+    Takes one assessment per line, in the mcp_milestones_schema.json format,
+    and answers with one NDJSON result per line in the same order, then a
+    summary line. Memory stays bounded however large the upload is, so
+    tablets can sync days of offline assessments in one request.
+    ?fields=ids works as for /evaluate.
+    """
+    return NDJSONStreamResponse(_stream_assessment_results(request, fields))
+
+@app.post("/children/{child_id}/sync", response_model=SyncResponse)
+async def sync_child(child_id: str, request: SyncRequest, fields: MilestoneFields = FIELDS_FULL):
+    """
+    Delta sync for the milestone-tracker app.
+
+    The app sends the milestones changed since its last sync, together with
+    that sync's version token, and gets back the child's evaluation and a new
+    token. The server updates the child's evaluation from the delta rather
+    than rescoring it. With no token, added is the full completed list. A
+    token that is no longer current (another device synced since, or the
+    child is unknown) gets 409 with the current token, if any; the app then
+    does a full sync. ?fields=ids works as for /evaluate.
+    """
+    snapshot = DATA_STORE.current()
+    try:
+        with METRICS.span("/children/{child_id}/sync", "milestone_filtering"):
+            # The state is in SQLite; keep its I/O and lock waits off the event loop and the evaluation pool
+            version, age_months, score = await SYNC_POOL.run(
+                None, CHILD_SYNC.sync, child_id, snapshot.version, snapshot.milestone_index,
+                request.version, request.child_age_months, request.added, request.removed
+            )
+    except StaleVersion as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "version": e.current})
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except (PoolSaturated, sqlite3.OperationalError):
+        # Pool full, or another worker held the database locked past the busy timeout
+        raise _pool_saturated()
+
+    with METRICS.span("/children/{child_id}/sync", "response_encoding"):
+        message = _evaluation_message(score.status, age_months, request.child_name)
+        return EncodedJSONResponse(b"".join([
+            b'{"version":', dumps(version),
+            b',"evaluation":', _evaluation_body(_evaluation_head(snapshot, score, fields), message),
+            b"}",
+        ]))
+
+@app.get("/children/sync/stats")
+async def child_sync_stats():
+    """Stored children, this worker's delta/full-sync/stale counters and its sync queue."""
+    return {**CHILD_SYNC.stats(), "pool": SYNC_POOL.stats()}
+
+@app.get("/evaluate/cache")
+async def evaluation_cache_stats():
+    """Hit/miss/eviction counters for the /evaluate response cache."""
+    return {"catalog_version": DATA_STORE.current().version, **EVALUATION_CACHE.stats()}
+
+@app.get("/evaluate/pool")
+async def compute_pool_stats():
+    """Queue depth, coalescing/rejection counters and compute latency percentiles."""
+    return COMPUTE_POOL.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Latency histograms in the Prometheus text format."""
+    if not METRICS.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (METRICS_ENABLED=0)")
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def _check_admin_token(token: Optional[str]):
+    """Admin endpoints require X-Admin-Token when ADMIN_TOKEN is configured."""
+    expected = os.getenv("ADMIN_TOKEN")
+    if expected and token != expected:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@app.post("/admin/reload", status_code=202)
+async def reload_data(x_admin_token: Optional[str] = Header(None)):
+    """Reload milestone and recommendation data in the background."""
+    _check_admin_token(x_admin_token)
+    started = DATA_STORE.reload_in_background()
+    return {"reload_started": started, **DATA_STORE.status()}
+
+@app.get("/admin/data")
+async def data_status(x_admin_token: Optional[str] = Header(None)):
+    """Version and reload state of the loaded data."""
+    _check_admin_token(x_admin_token)
+    return DATA_STORE.status()
+
+@app.on_event("startup")
+async def start_data_watcher():
+    # DATA_RELOAD_INTERVAL=<seconds> reloads automatically when the data files change
+    interval = float(os.getenv("DATA_RELOAD_INTERVAL", "0"))
+    if interval > 0:
+        DATA_STORE.start_watching(interval)
+
+@app.on_event("shutdown")
+async def stop_data_watcher():
+    DATA_STORE.stop_watching()
+
 @app.get("/")
 async def root():
     return {"message": "Child Health Chatbot API", "version": "2.0.0"}
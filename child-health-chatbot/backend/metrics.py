@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, ContextManager, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.routing import APIRoute
+
+# Seconds; spans from sub-millisecond stages to slow batch requests
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class Histogram:
+    """Latency histogram with one series per label-value tuple, in Prometheus layout."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, labels: Tuple[str, ...], seconds: float):
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bucket] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        """Per-series (bucket counts, sum, count), copied under the lock."""
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self.snapshot().items()):
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total!r}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+class _Span:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(self.labels, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """
+    Request and per-stage latency histograms, rendered for Prometheus.
+
+    When disabled, span() hands back a shared no-op context manager and the
+    app installs neither MetricsMiddleware nor the timed route class, so the
+    hot path pays for one attribute check per span.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.requests = Histogram(
+            "http_request_duration_seconds", "HTTP request latency by method, route and status.",
+            ("method", "route", "status"), buckets
+        )
+        self.stages = Histogram(
+            "request_stage_duration_seconds", "Latency of hot-path stages inside request handlers.",
+            ("endpoint", "stage"), buckets
+        )
+
+    def span(self, endpoint: str, stage: str) -> ContextManager:
+        """Time a `with` block as one stage of an endpoint."""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self.stages, (endpoint, stage))
+
+    def stage_timer(self, endpoint: str) -> Optional[Callable[[str], ContextManager]]:
+        """span() bound to an endpoint, for code that names its own stages; None when disabled."""
+        if not self.enabled:
+            return None
+        return lambda stage: _Span(self.stages, (endpoint, stage))
+
+    def render(self) -> str:
+        """All histograms in the Prometheus text exposition format (version 0.0.4)."""
+        return "\n".join(self.requests.render() + self.stages.render()) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording every HTTP request in Metrics.requests, labelled by route template."""
+
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Routing stores the matched route in the scope; the template keeps label cardinality bounded
+            route = scope.get("route")
+            self.metrics.requests.observe(
+                (scope["method"], getattr(route, "path", "unmatched"), str(status)), time.perf_counter() - start
+            )
+
+
+# Set by the timed route handler; the endpoint wrapper appends its return time
+_ENDPOINT_RETURNED: ContextVar[Optional[List[float]]] = ContextVar("endpoint_returned", default=None)
+
+
+def timed_route_class(metrics: Metrics) -> type:
+    """
+    APIRoute subclass recording a 'response_serialization' stage for every route.
+
+    The stage runs from the endpoint returning to the response being built,
+    which covers response_model validation and JSON encoding.
+    """
+
+    class TimedRoute(APIRoute):
+        def get_route_handler(self):
+            call = self.dependant.call
+            if asyncio.iscoroutinefunction(call):
+                async def timed_call(*args, **kwargs):
+                    try:
+                        return await call(*args, **kwargs)
+                    finally:
+                        _mark_returned()
+            else:
+                def timed_call(*args, **kwargs):
+                    try:
+                        return call(*args, **kwargs)
+                    finally:
+                        _mark_returned()
+            self.dependant.call = timed_call
+
+            handler = super().get_route_handler()
+            labels = (self.path, "response_serialization")
+
+            async def timed_handler(request):
+                returned: List[float] = []
+                token = _ENDPOINT_RETURNED.set(returned)
+                try:
+                    response = await handler(request)
+                finally:
+                    _ENDPOINT_RETURNED.reset(token)
+                if returned:
+                    metrics.stages.observe(labels, time.perf_counter() - returned[0])
+                return response
+
+            return timed_handler
+
+    return TimedRoute
+
+
+def _mark_returned():
+    # A list rather than a value so sync endpoints, run in a copied context, can still report
+    returned = _ENDPOINT_RETURNED.get()
+    if returned is not None:
+        returned.append(time.perf_counter())
+
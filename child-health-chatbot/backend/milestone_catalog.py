@@ -0,0 +1,152 @@
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Fields stored in the parallel arrays; everything else lives in MilestoneText
+_CORE_FIELDS = ("milestone_id", "age_range_months", "domain", "red_flag")
+_TEXT_FIELDS = (
+    "subdomain", "milestone_description", "expected_response_type",
+    "assessment_method", "who_criteria", "options"
+)
+
+# Sentinel for an age_range_months entry without a 'typical' value
+_NO_TYPICAL = -1
+
+
+class MilestoneText:
+    """Descriptive, rarely-read fields of one milestone. None means the field was absent."""
+
+    __slots__ = _TEXT_FIELDS + ("extra",)
+
+    def __init__(self, milestone: Dict, interned: Dict):
+        for field in _TEXT_FIELDS:
+            value = milestone.get(field)
+            if isinstance(value, str):
+                value = sys.intern(value)
+            elif field == "options" and value is not None:
+                # Most milestones share the same Yes/No options; keep one copy
+                key = tuple((option["label"], option["value"]) for option in value)
+                value = interned.setdefault(key, key)
+            setattr(self, field, value)
+
+        extra = {k: v for k, v in milestone.items() if k not in _CORE_FIELDS and k not in _TEXT_FIELDS}
+        self.extra = extra or None
+
+
+class MilestoneCatalog:
+    """
+    Compact, read-only milestone catalog.
+
+    IDs, age ranges, domain codes and red-flag bits are kept in parallel arrays
+    indexed by catalog position; descriptions sit in __slots__ records. Milestone
+    dictionaries are only rebuilt (hydrated) when a response needs them.
+    """
+
+    __slots__ = (
+        "ids", "min_ages", "max_ages", "typical_ages", "domain_codes", "domain_names",
+        "red_flags", "texts", "position_by_id", "positions_by_id"
+    )
+
+    def __init__(self, milestones: Iterable[Dict] = ()):
+        """
+        Build the catalog from milestone dictionaries.
+
+        Args:
+            milestones: Milestone dictionaries in the milestones_data.json format
+        """
+        ids: List[str] = []
+        self.min_ages = array("h")
+        self.max_ages = array("h")
+        self.typical_ages = array("h")
+        self.domain_codes = array("B")
+        self.domain_names: List[str] = []
+        self.red_flags = bytearray()
+        self.texts: List[MilestoneText] = []
+
+        domain_code_by_name: Dict[str, int] = {}
+        interned: Dict = {}
+        for milestone in milestones:
+            ids.append(sys.intern(milestone["milestone_id"]))
+
+            age_range = milestone["age_range_months"]
+            self.min_ages.append(age_range["min"])
+            self.max_ages.append(age_range["max"])
+            self.typical_ages.append(age_range.get("typical", _NO_TYPICAL))
+
+            domain = milestone["domain"]
+            if domain not in domain_code_by_name:
+                domain_code_by_name[domain] = len(self.domain_names)
+                self.domain_names.append(sys.intern(domain))
+            self.domain_codes.append(domain_code_by_name[domain])
+
+            self.red_flags.append(1 if milestone.get("red_flag", False) else 0)
+            self.texts.append(MilestoneText(milestone, interned))
+
+        self.ids: Tuple[str, ...] = tuple(ids)
+        self.position_by_id: Dict[str, int] = {mid: position for position, mid in enumerate(self.ids)}
+        # The schema does not forbid a repeated milestone_id; completing it completes every entry
+        positions_by_id: Dict[str, List[int]] = {}
+        for position, mid in enumerate(self.ids):
+            positions_by_id.setdefault(mid, []).append(position)
+        self.positions_by_id: Dict[str, Tuple[int, ...]] = {
+            mid: tuple(positions) for mid, positions in positions_by_id.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def domain(self, position: int) -> str:
+        """Domain name of the milestone at a catalog position."""
+        return self.domain_names[self.domain_codes[position]]
+
+    def is_red_flag(self, position: int) -> bool:
+        return self.red_flags[position] == 1
+
+    def hydrate(self, position: int) -> Dict:
+        """
+        Rebuild the milestone dictionary at a catalog position.
+
+        Args:
+            position: Index into the catalog
+
+        Returns:
+            A new dictionary in the milestones_data.json format
+        """
+        age_range = {"min": self.min_ages[position], "max": self.max_ages[position]}
+        if self.typical_ages[position] != _NO_TYPICAL:
+            age_range["typical"] = self.typical_ages[position]
+
+        text = self.texts[position]
+        milestone = {
+            "milestone_id": self.ids[position],
+            "age_range_months": age_range,
+            "domain": self.domain(position),
+        }
+        for field in ("subdomain", "milestone_description", "expected_response_type", "assessment_method"):
+            value = getattr(text, field)
+            if value is not None:
+                milestone[field] = value
+        milestone["red_flag"] = self.is_red_flag(position)
+        if text.who_criteria is not None:
+            milestone["who_criteria"] = text.who_criteria
+        if text.options is not None:
+            milestone["options"] = [{"label": label, "value": value} for label, value in text.options]
+        if text.extra:
+            milestone.update(text.extra)
+        return milestone
+
+    def hydrate_many(self, positions: Iterable[int]) -> List[Dict]:
+        """Rebuild milestone dictionaries for several catalog positions."""
+        return [self.hydrate(position) for position in positions]
+
+    def to_dicts(self) -> List[Dict]:
+        """Rebuild the whole catalog as milestone dictionaries."""
+        return self.hydrate_many(range(len(self)))
+
+    def position(self, milestone_id: str) -> Optional[int]:
+        """Catalog position of a milestone ID (its last entry if repeated), or None if it is unknown."""
+        return self.position_by_id.get(milestone_id)
+
+    def positions(self, milestone_id: str) -> Tuple[int, ...]:
+        """Catalog positions of every entry with a milestone ID; empty if it is unknown."""
+        return self.positions_by_id.get(milestone_id, ())
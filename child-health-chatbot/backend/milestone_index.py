@@ -0,0 +1,89 @@
+from array import array
+from typing import Dict, List, Sequence, Union
+
+from milestone_catalog import MilestoneCatalog
+
+# A milestone stays "expected" for this many months past the end of its age range
+GRACE_MONTHS = 6
+
+
+class MilestoneIndex:
+    """
+    Per-month bucket index over a milestone catalog.
+
+    Each bucket holds the positions of the milestones expected at that age
+    (min <= age <= max + GRACE_MONTHS), so a lookup is a single list access
+    instead of a scan over the whole catalog. Buckets start at min_age, which
+    is below 0 when a catalog entry has a negative 'min', so negative ages get
+    the same milestones the scan gives them.
+    """
+
+    def __init__(
+        self,
+        catalog: Union[MilestoneCatalog, Sequence[Dict]],
+        grace_months: int = GRACE_MONTHS
+    ):
+        """
+        Build the index once at load time.
+
+        Args:
+            catalog: A MilestoneCatalog, or milestone dictionaries to build one from
+            grace_months: Months past 'max' a milestone remains expected
+        """
+        if not isinstance(catalog, MilestoneCatalog):
+            catalog = MilestoneCatalog(catalog)
+        self.catalog = catalog
+        self.grace_months = grace_months
+
+        min_age = min(min(catalog.min_ages, default=0), 0)
+        max_age = max(catalog.max_ages, default=-1 - grace_months) + grace_months
+        buckets = [array("I") for _ in range(max_age - min_age + 1)]
+        for position in range(len(catalog)):
+            for age in range(catalog.min_ages[position], catalog.max_ages[position] + grace_months + 1):
+                buckets[age - min_age].append(position)
+
+        self.min_age = min_age
+        self._max_age = max_age
+        self._buckets: List[array] = buckets
+        self._empty = array("I")
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    @property
+    def max_age(self) -> int:
+        """Oldest age (in months) for which any milestone is expected."""
+        return self._max_age
+
+    def positions(self, age_months: int) -> Sequence[int]:
+        """
+        Get catalog positions of the milestones expected for a given age.
+
+        Args:
+            age_months: Child's age in months
+
+        Returns:
+            Read-only sequence of catalog positions, in catalog order
+        """
+        if isinstance(age_months, int) and self.min_age <= age_months <= self._max_age:
+            return self._buckets[age_months - self.min_age]
+        if isinstance(age_months, int):
+            return self._empty
+        # Fractional ages do not map onto a bucket; fall back to a scan
+        catalog = self.catalog
+        return array("I", (
+            position for position in range(len(catalog))
+            if catalog.min_ages[position] <= age_months <= catalog.max_ages[position] + self.grace_months
+        ))
+
+    def expected(self, age_months: int) -> List[Dict]:
+        """
+        Get all milestones expected for a given age.
+
+        Args:
+            age_months: Child's age in months
+
+        Returns:
+            List of hydrated milestone dictionaries, in catalog order
+        """
+        return self.catalog.hydrate_many(self.positions(age_months))
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import tempfile
+from array import array
+from typing import Any, AsyncIterator, Iterable, Literal, Mapping, Optional
+
+from fastapi.responses import Response
+
+from milestone_catalog import MilestoneCatalog
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt; stdlib json gives the same bytes, slower
+    orjson = None
+
+# Accepted values of the ?fields= query parameter on the evaluation endpoints
+FIELDS_FULL = "full"
+FIELDS_IDS = "ids"
+MilestoneFields = Literal["full", "ids"]
+
+# NDJSONStreamResponse keeps up to this many unsent bytes in memory before spilling to disk
+NDJSON_SPOOL_BYTES = 1024 * 1024
+_SEND_CHUNK_BYTES = 64 * 1024
+
+
+def dumps(value: Any) -> bytes:
+    """Compact UTF-8 JSON, as orjson writes it."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON bytes with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class MilestoneFragments:
+    """
+    Every catalog milestone pre-encoded as JSON, built once per data snapshot.
+
+    Responses list milestones by joining these fragments instead of hydrating
+    dicts and re-encoding them per request. Fragments are stored back to back
+    in one buffer with an offset table, so the cost is the encoded size of the
+    catalog plus 8 bytes per milestone.
+    """
+
+    def __init__(self, catalog: MilestoneCatalog):
+        self._packed = {
+            FIELDS_FULL: self._pack(dumps(catalog.hydrate(position)) for position in range(len(catalog))),
+            FIELDS_IDS: self._pack(dumps(milestone_id) for milestone_id in catalog.ids),
+        }
+
+    @staticmethod
+    def _pack(fragments):
+        fragments = list(fragments)
+        offsets = array("Q", [0])
+        for fragment in fragments:
+            offsets.append(offsets[-1] + len(fragment))
+        return memoryview(b"".join(fragments)), offsets
+
+    def array(self, positions: Iterable[int], fields: str = FIELDS_FULL) -> bytes:
+        """
+        A JSON array of milestones.
+
+        Args:
+            positions: Catalog positions, in output order
+            fields: 'full' for milestone objects, 'ids' for milestone ID strings
+
+        Returns:
+            Encoded array, e.g. b'["M_6M_001","L_12M_002"]' for fields='ids'
+        """
+        buffer, offsets = self._packed[fields]
+        return b"[" + b",".join([buffer[offsets[p]:offsets[p + 1]] for p in positions]) + b"]"
+
+
+class EncodedJSONResponse(Response):
+    """
+    Response whose body is already-encoded JSON bytes.
+
+    Returning it from an endpoint skips FastAPI's response_model validation
+    and serialization; the response_model still documents the shape.
+    """
+
+    media_type = "application/json"
+
+
+class NDJSONStreamResponse(Response):
+    """
+    Newline-delimited JSON streamed from an async iterator of encoded lines.
+
+    Built for endpoints that produce results while still reading the request
+    body. Most HTTP clients only start reading the response once they have
+    sent the whole body, so lines pass through a spool that stays in memory
+    while the client keeps up and rolls over to a temporary file when it
+    does not. The iterator never waits on the client, and memory stays
+    bounded by spool_bytes whatever the client does.
+
+    Unlike StreamingResponse it does not listen for a client disconnect while
+    streaming; that listener reads from the same ASGI receive channel and
+    would swallow request body chunks the iterator is still consuming.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        spool_bytes: int = NDJSON_SPOOL_BYTES
+    ):
+        self.body_iterator = content
+        self.status_code = status_code
+        self.spool_bytes = spool_bytes
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_bytes)
+        read_pos = write_pos = 0
+        produced = asyncio.Event()
+        finished = False
+
+        async def produce():
+            nonlocal write_pos, finished
+            try:
+                async for chunk in self.body_iterator:
+                    spool.seek(write_pos)
+                    spool.write(chunk)
+                    write_pos += len(chunk)
+                    produced.set()
+            finally:
+                finished = True
+                produced.set()
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                await produced.wait()
+                produced.clear()
+                while read_pos < write_pos:
+                    spool.seek(read_pos)
+                    data = spool.read(min(write_pos - read_pos, _SEND_CHUNK_BYTES))
+                    read_pos += len(data)
+                    if read_pos == write_pos:
+                        # Caught up: reuse the spool from the start
+                        spool.seek(0)
+                        spool.truncate()
+                        read_pos = write_pos = 0
+                    await send({"type": "http.response.body", "body": data, "more_body": True})
+                if finished and read_pos == write_pos:
+                    break
+            # Re-raise anything the iterator raised
+            await producer
+        finally:
+            producer.cancel()
+            spool.close()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -0,0 +1,71 @@
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+GENERAL_DOMAIN = "general"
+DEFAULT_RECOMMENDATION = "Please consult a pediatrician for specific advice."
+
+
+class RecommendationIndex:
+    """
+    (domain, age in months) -> candidate recommendation texts.
+
+    General recommendations are merged into every domain's candidates ahead of
+    time, in file order, so a lookup is two list accesses and a random.choice.
+    Unknown domains fall back to the general-only candidates.
+    """
+
+    def __init__(self, recommendations: Sequence[Dict]):
+        """
+        Build the index once when recommendations.json is loaded.
+
+        Args:
+            recommendations: Entries with 'domain', 'min_age', 'max_age' and 'text'
+        """
+        max_age = max((rec["max_age"] for rec in recommendations), default=-1)
+        domains = {rec["domain"] for rec in recommendations} | {GENERAL_DOMAIN}
+
+        tables: Dict[str, List[List[str]]] = {
+            domain: [[] for _ in range(max_age + 1)] for domain in domains
+        }
+        for rec in recommendations:
+            targets = domains if rec["domain"] == GENERAL_DOMAIN else (rec["domain"],)
+            for age in range(max(rec["min_age"], 0), rec["max_age"] + 1):
+                for domain in targets:
+                    tables[domain][age].append(rec["text"])
+
+        self._tables: Dict[str, List[Tuple[str, ...]]] = {
+            domain: [tuple(bucket) for bucket in table] for domain, table in tables.items()
+        }
+
+    def candidates(self, domain: str, age_months: int) -> Tuple[str, ...]:
+        """
+        Get the recommendation texts relevant to a domain and age.
+
+        Args:
+            domain: Domain of concern (motor, language, social, general)
+            age_months: Child's age in months
+
+        Returns:
+            Tuple of recommendation texts, empty if nothing applies
+        """
+        table = self._tables.get(domain, self._tables[GENERAL_DOMAIN])
+        if isinstance(age_months, int) and 0 <= age_months < len(table):
+            return table[age_months]
+        return ()
+
+    def choose(self, domain: str, age_months: int, rng: Optional[random.Random] = None) -> str:
+        """
+        Pick one recommendation for a domain and age.
+
+        Args:
+            domain: Domain of concern
+            age_months: Child's age in months
+            rng: Optional seeded random.Random for reproducible picks
+
+        Returns:
+            Recommendation text, or a default referral message
+        """
+        candidates = self.candidates(domain, age_months)
+        if not candidates:
+            return DEFAULT_RECOMMENDATION
+        return (rng or random).choice(candidates)
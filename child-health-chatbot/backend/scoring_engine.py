@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from milestone_catalog import MilestoneCatalog
+from milestone_index import MilestoneIndex
+
+# Upper bound on child x milestone cells materialized at once (~16 MB of bools)
+MAX_MATRIX_CELLS = 16_000_000
+
+
+@dataclass
+class ChildScore:
+    """Scoring outcome for one child, expressed as catalog positions."""
+    status: str
+    completion_rate: float  # unrounded percentage
+    total_expected: int
+    total_completed: int
+    completed_positions: List[int]
+    missing_positions: List[int]
+    red_flag_positions: List[int]
+
+
+def determine_status(total_completed: int, total_expected: int, has_red_flags: bool) -> str:
+    """
+    Determine development status using the MCP card rules.
+
+    Args:
+        total_completed: Expected milestones the child has achieved
+        total_expected: Milestones expected for the child's age
+        has_red_flags: Whether any red-flag milestone is missing
+
+    Returns:
+        'No Data', 'On Track', 'Needs Support' or 'Referral Needed'
+    """
+    if total_expected == 0:
+        return 'No Data'
+    if has_red_flags:
+        return 'Referral Needed'
+    if total_completed == total_expected:
+        return 'On Track'
+    if 2 * total_completed >= total_expected:
+        return 'Needs Support'
+    return 'Referral Needed'
+
+
+def normalize_completed(completed_ids: Iterable[str]) -> FrozenSet[str]:
+    """Normalize completed milestone IDs into a frozenset for O(1) membership tests."""
+    if isinstance(completed_ids, frozenset):
+        return completed_ids
+    return frozenset(completed_ids)
+
+
+def partition_milestones(
+    catalog: MilestoneCatalog,
+    positions: Iterable[int],
+    completed_ids: Iterable[str]
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Split expected milestones into completed, missing and red-flag lists in one pass.
+
+    Args:
+        catalog: Catalog the positions refer to
+        positions: Catalog positions of the milestones expected for the child's age
+        completed_ids: IDs of milestones the child has achieved
+
+    Returns:
+        Tuple of (completed, missing, red_flags) catalog positions; red_flags is
+        the subset of missing milestones marked as red flags
+    """
+    completed_set = normalize_completed(completed_ids)
+    ids = catalog.ids
+    red_flag_bits = catalog.red_flags
+    completed: List[int] = []
+    missing: List[int] = []
+    red_flags: List[int] = []
+    for position in positions:
+        if ids[position] in completed_set:
+            completed.append(position)
+        else:
+            missing.append(position)
+            if red_flag_bits[position]:
+                red_flags.append(position)
+    return completed, missing, red_flags
+
+
+def score_child(index: MilestoneIndex, age_months: int, completed_ids: Iterable[str]) -> ChildScore:
+    """
+    Score one child against the age-bucketed index.
+
+    Args:
+        index: Milestone index for the loaded catalog
+        age_months: Child's age in months
+        completed_ids: IDs of milestones the child has achieved
+
+    Returns:
+        ChildScore with the same values BatchScorer gives for this child
+    """
+    expected_positions = index.positions(age_months)
+    completed, missing, red_flags = partition_milestones(index.catalog, expected_positions, completed_ids)
+    total_expected = len(expected_positions)
+    total_completed = len(completed)
+    return ChildScore(
+        status=determine_status(total_completed, total_expected, bool(red_flags)),
+        completion_rate=(total_completed / total_expected) * 100 if total_expected > 0 else 0.0,
+        total_expected=total_expected,
+        total_completed=total_completed,
+        completed_positions=completed,
+        missing_positions=missing,
+        red_flag_positions=red_flags,
+    )
+
+
+class BatchScorer:
+    """
+    Scores many children in one pass over a child x milestone completion matrix.
+
+    The per-age expected masks and the red-flag vector are built once from a
+    MilestoneIndex; each batch then only has to fill in the completion matrix.
+    """
+
+    def __init__(self, index: MilestoneIndex):
+        self.index = index
+        catalog = index.catalog
+
+        self.positions_by_id: Dict[str, Tuple[int, ...]] = catalog.positions_by_id
+        self.red_flag_mask = np.frombuffer(bytes(catalog.red_flags), dtype=np.uint8).astype(bool)
+
+        # One row per month from index.min_age plus a trailing all-False row for ages outside the catalog
+        self.age_masks = np.zeros((max(index.max_age - index.min_age + 1, 0) + 1, len(catalog)), dtype=bool)
+        for age in range(index.min_age, index.max_age + 1):
+            self.age_masks[age - index.min_age, np.array(index.positions(age), dtype=np.intp)] = True
+
+    def _age_rows(self, ages: Sequence[int]) -> np.ndarray:
+        ages = np.asarray(ages, dtype=np.int64)
+        out_of_range = (ages < self.index.min_age) | (ages > self.index.max_age)
+        return np.where(out_of_range, len(self.age_masks) - 1, ages - self.index.min_age)
+
+    def completion_matrix(self, completed_lists: Sequence[Iterable[str]]) -> np.ndarray:
+        """
+        Build the child x milestone boolean completion matrix.
+
+        Unknown milestone IDs are ignored; an ID repeated in the catalog marks
+        every entry that has it, as score_child does.
+        """
+        positions_by_id = self.positions_by_id
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, completed_ids in enumerate(completed_lists):
+            positions = [p for i in completed_ids if i in positions_by_id for p in positions_by_id[i]]
+            rows.extend([row] * len(positions))
+            cols.extend(positions)
+
+        matrix = np.zeros((len(completed_lists), len(self.index.catalog)), dtype=bool)
+        matrix[rows, cols] = True
+        return matrix
+
+    def score_many(self, ages: Sequence[int], completed_lists: Sequence[Iterable[str]]) -> List[ChildScore]:
+        """
+        Score a batch of children.
+
+        Args:
+            ages: Age in months for each child
+            completed_lists: Completed milestone IDs for each child
+
+        Returns:
+            One ChildScore per child, in input order
+        """
+        if len(ages) != len(completed_lists):
+            raise ValueError("ages and completed_lists must have the same length")
+
+        chunk_size = max(1, MAX_MATRIX_CELLS // max(1, len(self.index.catalog)))
+        scores: List[ChildScore] = []
+        for start in range(0, len(ages), chunk_size):
+            stop = start + chunk_size
+            scores.extend(self._score_chunk(ages[start:stop], completed_lists[start:stop]))
+        return scores
+
+    def _score_chunk(self, ages: Sequence[int], completed_lists: Sequence[Iterable[str]]) -> List[ChildScore]:
+        expected = self.age_masks[self._age_rows(ages)]
+        done = self.completion_matrix(completed_lists) & expected
+        missing = expected & ~done
+        red_flags = missing & self.red_flag_mask
+
+        totals_expected = expected.sum(axis=1)
+        totals_completed = done.sum(axis=1)
+        has_red_flags = red_flags.any(axis=1)
+
+        scores = []
+        for row in range(len(ages)):
+            total_expected = int(totals_expected[row])
+            total_completed = int(totals_completed[row])
+            completion_rate = (total_completed / total_expected) * 100 if total_expected > 0 else 0.0
+            scores.append(ChildScore(
+                status=determine_status(total_completed, total_expected, bool(has_red_flags[row])),
+                completion_rate=completion_rate,
+                total_expected=total_expected,
+                total_completed=total_completed,
+                completed_positions=np.flatnonzero(done[row]).tolist(),
+                missing_positions=np.flatnonzero(missing[row]).tolist(),
+                red_flag_positions=np.flatnonzero(red_flags[row]).tolist(),
+            ))
+        return scores
+
+
+class ScoringEngine:
+    """
+    The one scoring implementation behind /evaluate, /evaluate/batch and DevelopmentEvaluator.
+
+    Single children are scored with a set lookup over their age bucket; batches
+    go through the vectorized BatchScorer, whose matrices are built on first use
+    unless one is passed in. Both return ChildScore, which each surface turns
+    into its own response format.
+    """
+
+    def __init__(self, index: MilestoneIndex, batch_scorer: Optional[BatchScorer] = None):
+        self.index = index
+        self.catalog = index.catalog
+        self._batch_scorer = batch_scorer
+
+    @property
+    def batch_scorer(self) -> BatchScorer:
+        if self._batch_scorer is None:
+            # A concurrent first use may build it twice; both results are identical
+            self._batch_scorer = BatchScorer(self.index)
+        return self._batch_scorer
+
+    def score(self, age_months: int, completed_ids: Iterable[str]) -> ChildScore:
+        """Score one child (see score_child)."""
+        return score_child(self.index, age_months, completed_ids)
+
+    def score_many(self, ages: Sequence[int], completed_lists: Sequence[Iterable[str]]) -> List[ChildScore]:
+        """Score a batch of children (see BatchScorer.score_many)."""
+        return self.batch_scorer.score_many(ages, completed_lists)
+
+
+def status_counts(scores: Iterable[ChildScore]) -> Dict[str, int]:
+    """Count children per status."""
+    counts: Dict[str, int] = {}
+    for score in scores:
+        counts[score.status] = counts.get(score.status, 0) + 1
+    return counts
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# main opens its sync database at import; keep test runs out of data/child_sync.sqlite
+os.environ.setdefault("CHILD_SYNC_DB", os.path.join(tempfile.mkdtemp(prefix="child-sync-"), "child_sync.sqlite"))
@@ -0,0 +1,125 @@
+import gc
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from assessment_schema import (
+    ASSESSMENT_ADAPTER, error_path, validate_assessments, validate_assessments_json, validate_export
+)
+
+ROOT = Path(__file__).resolve().parents[3]
+SCHEMA = json.loads((ROOT / "mcp_milestones_schema.json").read_text())
+SAMPLE = json.loads((ROOT / "mcp_milestones_sample_data.json").read_text())["assessments"]
+
+
+def _resolve(schema, root):
+    ref = schema.get("$ref")
+    return root["$defs"][ref.rsplit("/", 1)[-1]] if ref else schema
+
+
+def _assert_mirrors(expected, actual, root, path="record"):
+    actual = _resolve(actual, root)
+    assert set(expected.get("required", [])) == set(actual.get("required", [])), path
+    for name, prop in expected.get("properties", {}).items():
+        assert name in actual["properties"], f"{path}.{name}"
+        mirrored = _resolve(actual["properties"][name], root)
+        if "enum" in prop:
+            assert sorted(prop["enum"]) == sorted(mirrored["enum"]), f"{path}.{name}"
+        for bound in ("minimum", "maximum"):
+            if bound in prop:
+                assert mirrored[bound] == prop[bound], f"{path}.{name}"
+        if prop.get("type") == "object":
+            _assert_mirrors(prop, mirrored, root, f"{path}.{name}")
+        if prop.get("type") == "array" and prop["items"].get("type") == "object":
+            _assert_mirrors(prop["items"], mirrored["items"], root, f"{path}.{name}[]")
+
+
+def test_typed_schema_mirrors_mcp_json_schema():
+    generated = ASSESSMENT_ADAPTER.json_schema()
+    _assert_mirrors(SCHEMA, generated, generated)
+
+
+def test_sample_data_is_valid():
+    valid, errors = validate_assessments(SAMPLE)
+    assert errors == [] and valid is SAMPLE
+
+
+def test_all_errors_reported_with_record_paths():
+    good = SAMPLE[0]
+    bad_milestone = {**good["milestones"][0], "domain": "cognitive"}
+    del bad_milestone["milestone_description"]
+    records = [
+        good,
+        {**good, "age_months": 40, "assessment_date": "2026-02-30"},
+        {**good, "age_months": "6"},
+        {**good, "milestones": [good["milestones"][0], bad_milestone]},
+    ]
+
+    valid, errors = validate_assessments(records, offset=100)
+
+    assert valid == [good]
+    assert sorted((error["path"], error["type"]) for error in errors) == [
+        ("assessments[101].age_months", "less_than_equal"),
+        ("assessments[101].assessment_date", "value_error"),
+        ("assessments[102].age_months", "int_type"),
+        ("assessments[103].milestones[1].domain", "literal_error"),
+        ("assessments[103].milestones[1].milestone_description", "missing"),
+    ]
+    assert {error["index"] for error in errors} == {101, 102, 103}
+
+
+def test_extra_properties_allowed_and_json_validation():
+    record = {**SAMPLE[0], "worker_id": "CHW_7"}
+    assert validate_assessments([record]) == ([record], [])
+    assert validate_assessments_json(json.dumps([record]).encode()) == []
+    errors = validate_assessments_json(json.dumps([{**record, "child_id": 7}]).encode(), prefix="upload")
+    assert [error["path"] for error in errors] == ["upload[0].child_id"]
+
+
+def test_malformed_json_reported_against_collection():
+    (error,) = validate_assessments_json(b"[{", prefix="upload")
+    assert error["index"] is None and error["path"] == "upload" and error["type"] == "json_invalid"
+    assert error_path(()) == "assessments"
+
+
+def test_validate_export_offsets_span_batches(tmp_path):
+    records = [SAMPLE[0]] * 5 + [{**SAMPLE[0], "age_months": -1}]
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps({"assessments": records}))
+
+    batches = list(validate_export(str(path), batch_size=4))
+
+    assert [len(valid) for valid, _ in batches] == [4, 1]
+    assert [error["path"] for _, errors in batches for error in errors] == ["assessments[5].age_months"]
+
+
+
+def test_gc_left_alone_unless_requested():
+    records = [SAMPLE[0]] * 50
+
+    def validate_repeatedly():
+        for _ in range(200):
+            validate_assessments(records)
+
+    assert gc.isenabled()
+    threads = [threading.Thread(target=validate_repeatedly) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert gc.isenabled()
+
+    assert validate_assessments(records, pause_gc=True)[1] == []
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        validate_assessments(records, pause_gc=True)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
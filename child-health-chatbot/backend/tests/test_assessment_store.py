@@ -0,0 +1,83 @@
+import pytest
+
+from assessment_store import AssessmentStore, milestone_achieved
+
+ASSESSMENTS = [
+    {"child_id": "C1", "assessment_date": "2026-02-05", "age_months": 6,
+     "milestones": [{"milestone_id": "M_6M_001"}, {"milestone_id": "L_6M_001", "achieved": False}]},
+    {"child_id": "C1", "assessment_date": "2026-08-05", "age_months": 12,
+     "milestones": [{"milestone_id": "L_6M_001", "response": "Yes"}, {"milestone_id": "M_12M_001", "response": "no"}]},
+    {"child_id": "C2", "assessment_date": "2026-03-01", "age_months": 9,
+     "milestones": [{"milestone_id": "M_9M_001"}]},
+]
+
+
+@pytest.fixture
+def store():
+    with AssessmentStore() as store:
+        store.insert_many(ASSESSMENTS)
+        yield store
+
+
+def test_achieved_flag_response_and_default():
+    assert milestone_achieved({"milestone_id": "X"})
+    assert not milestone_achieved({"milestone_id": "X", "achieved": False})
+    assert milestone_achieved({"milestone_id": "X", "response": " YES "})
+    assert not milestone_achieved({"milestone_id": "X", "response": "not_yet"})
+
+
+def test_latest_per_child_and_as_of(store):
+    assert store.latest_per_child() == [
+        {"child_id": "C1", "assessment_date": "2026-08-05", "age_months": 12},
+        {"child_id": "C2", "assessment_date": "2026-03-01", "age_months": 9},
+    ]
+    assert store.latest("C1", as_of="2026-06-01")["age_months"] == 6
+    assert store.latest("C2", as_of="2026-01-01") is None
+
+
+def test_trajectory_is_ordered_by_date(store):
+    assert [(row["assessment_date"], row["achieved"]) for row in store.trajectory("C1", "L_6M_001")] == [
+        ("2026-02-05", False), ("2026-08-05", True)
+    ]
+    assert len(store.trajectory("C1")) == 4
+    assert [row["child_id"] for row in store.milestone_history("M_9M_001")] == ["C2"]
+
+
+def test_child_data_accumulates_achieved_milestones(store):
+    child = store.child_data("C1")
+    assert child["age_months"] == 12
+    assert child["completed_milestones"] == ["L_6M_001", "M_6M_001"]
+    assert store.child_data("C1", as_of="2026-02-05")["completed_milestones"] == ["M_6M_001"]
+    assert store.child_data("missing") is None
+    assert store.all_child_data() == [child, store.child_data("C2")]
+
+
+def test_reinserting_same_date_replaces_assessment(store):
+    store.insert_many([{"child_id": "C2", "assessment_date": "2026-03-01", "age_months": 10, "milestones": []}])
+    assert len(store) == 3
+    assert store.child_data("C2")["age_months"] == 10
+    assert store.child_data("C2")["completed_milestones"] == []
+
+
+def test_invalid_date_writes_nothing(store):
+    with pytest.raises(ValueError):
+        store.insert_many([
+            {"child_id": "C3", "assessment_date": "2026-04-01", "age_months": 3, "milestones": []},
+            {"child_id": "C3", "assessment_date": "05/04/2026", "age_months": 4, "milestones": []},
+        ])
+    assert store.latest("C3") is None
+
+
+def test_indexes_used_for_child_and_milestone_queries(store):
+    plans = [
+        " ".join(str(row[-1]) for row in store.conn.execute("EXPLAIN QUERY PLAN " + query, params))
+        for query, params in [
+            ("SELECT assessment_date FROM assessments WHERE child_id = ? ORDER BY assessment_date DESC LIMIT 1", ("C1",)),
+            ("SELECT assessment_id FROM assessment_milestones WHERE milestone_id = ?", ("M_6M_001",)),
+        ]
+    ]
+    assert all("USING" in plan and "INDEX" in plan for plan in plans), plans
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,94 @@
+import io
+import json
+
+import pytest
+
+import assessment_stream
+from assessment_stream import AssessmentStream, iter_records, scan_array
+from milestone_catalog import MilestoneCatalog
+
+MILESTONE = {
+    "milestone_id": "M_6M_001", "age_range_months": {"min": 4, "max": 8, "typical": 6},
+    "domain": "motor", "milestone_description": "Sits without support", "red_flag": False,
+}
+EXPORT = {
+    "exported_at": "2026-10-01",
+    "meta": {"district": "North", "counts": [1, 2.5, -3e2]},
+    "assessments": [
+        {"child_id": "C1", "assessment_date": "2026-02-05", "age_months": 6,
+         "milestones": [MILESTONE, {**MILESTONE, "milestone_id": "X_UNKNOWN", "response": "no"}]},
+        {"child_id": "C2", "assessment_date": "2026-03-01", "age_months": 123456, "milestones": []},
+    ],
+    "trailer": 98765,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_scan_array_matches_json_load(chunk_size, indent):
+    text = json.dumps(EXPORT, indent=indent)
+    assert list(scan_array(io.StringIO(text), chunk_size=chunk_size)) == EXPORT["assessments"]
+
+
+def test_scan_array_bare_list_and_empty():
+    assert list(scan_array(io.StringIO(" [1, 22 ,{\"a\": [3]}] "), chunk_size=3)) == [1, 22, {"a": [3]}]
+    assert list(scan_array(io.StringIO("[]"))) == []
+    assert list(scan_array(io.StringIO('{"assessments": [ ]}'))) == []
+
+
+@pytest.mark.parametrize("text", ['{"other": []}', '{"assessments": [{"a": 1}', '[1 2]', ''])
+def test_scan_array_rejects_bad_input(text):
+    with pytest.raises(ValueError):
+        list(scan_array(io.StringIO(text), chunk_size=4))
+
+
+def _backend(name, monkeypatch):
+    if name == "ijson":
+        monkeypatch.setattr(assessment_stream, "ijson", pytest.importorskip("ijson"))
+    else:
+        monkeypatch.setattr(assessment_stream, "ijson", None)
+
+
+@pytest.mark.parametrize("backend", ["scanner", "ijson"])
+@pytest.mark.parametrize("bare", [False, True])
+def test_iter_records_backends_yield_identical_records(backend, bare, tmp_path, monkeypatch):
+    _backend(backend, monkeypatch)
+    records = EXPORT["assessments"] + [
+        {"child_id": "C3 \u00e9\u2603", "assessment_date": "2026-04-01", "age_months": 0.5,
+         "milestones": [{**MILESTONE, "achieved": True, "score": 1e-3, "notes": None}]},
+    ]
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(records if bare else {**EXPORT, "assessments": records}, indent=1))
+
+    # Exact types too: ijson must give floats, not Decimals, or records differ downstream
+    def typed(value):
+        if isinstance(value, dict):
+            return {key: typed(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [typed(item) for item in value]
+        return (type(value).__name__, value)
+
+    assert [typed(record) for record in iter_records(str(path), chunk_size=16)] == [typed(r) for r in records]
+
+
+def test_stream_replaces_milestone_bodies_with_catalog_ids(tmp_path, monkeypatch):
+    monkeypatch.setattr(assessment_stream, "ijson", None)
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(EXPORT))
+    catalog = MilestoneCatalog([MILESTONE])
+
+    stream = AssessmentStream(str(path), catalog, chunk_size=16)
+    first, second = list(stream)
+
+    assert first["milestones"] == [
+        {"milestone_id": "M_6M_001", "achieved": True},
+        {"milestone_id": "X_UNKNOWN", "achieved": False},
+    ]
+    assert first["completed_milestones"] == ["M_6M_001"]
+    assert first["completed_milestones"][0] is catalog.ids[0]
+    assert second["age_months"] == 123456 and second["milestones"] == []
+    assert (stream.records, stream.milestones, stream.unknown_milestones) == (2, 2, 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,103 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from assessment_stream import ndjson_batches
+from main import app
+from milestone_payloads import NDJSONStreamResponse
+
+client = TestClient(app)
+SAMPLE = json.loads(
+    (Path(__file__).resolve().parents[3] / "mcp_milestones_sample_data.json").read_text()
+)["assessments"]
+
+
+def _post(lines, fields="full"):
+    body = "\n".join(lines).encode()
+    response = client.post(f"/assessments/stream?fields={fields}", content=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_results_follow_input_lines_and_match_evaluate():
+    record = SAMPLE[-1]
+    *results, summary = _post([json.dumps(record), "", json.dumps(SAMPLE[0])])
+
+    assert [(r["line"], r["ok"], r["assessment_date"]) for r in results] == [
+        (1, True, record["assessment_date"]), (3, True, SAMPLE[0]["assessment_date"])
+    ]
+    expected = client.post("/evaluate", json={
+        "child_age_months": record["age_months"],
+        "completed_milestones": [m["milestone_id"] for m in record["milestones"]],
+        "child_name": record["child_id"],
+    }).json()
+    assert results[0]["evaluation"] == expected
+    assert summary["summary"]["records"] == 2 and summary["summary"]["valid"] == 2
+
+
+def test_invalid_lines_report_errors_and_do_not_stop_the_stream():
+    bad = {**SAMPLE[0], "age_months": 40}
+    results = _post(["{not json", json.dumps(bad), json.dumps([1]), json.dumps(SAMPLE[1])], fields="ids")
+
+    assert [r.get("ok") for r in results[:4]] == [False, False, False, True]
+    assert results[0]["errors"][0]["type"] == "json_invalid"
+    assert results[1]["errors"] == [{
+        "index": 2, "path": "line[2].age_months", "type": "less_than_equal",
+        "message": "Input should be less than or equal to 36",
+    }]
+    assert all(isinstance(m, str) for m in results[3]["evaluation"]["missing_milestones"])
+    assert results[4]["summary"]["invalid"] == 3
+
+
+def test_oversized_line_is_rejected(monkeypatch):
+    monkeypatch.setattr(main, "ASSESSMENT_STREAM_MAX_LINE", 64)
+    results = _post([json.dumps(SAMPLE[0]), "{}"])
+    assert results[0]["errors"][0]["type"] == "line_too_long"
+    assert results[1]["errors"][0]["path"] == "line[2].child_id"
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(chunks, max_line_bytes):
+    return [pair async for batch in ndjson_batches(chunks, max_line_bytes) for pair in batch]
+
+
+@pytest.mark.parametrize("size", [1, 3, 1000])
+def test_ndjson_batches_splits_across_chunks(size):
+    data = b'{"a":1}\n\n  \n{"b":2}\n' + b"x" * 20 + b'\n{"c":3}'
+    assert asyncio.run(_collect(_chunks(data, size), 10)) == [
+        (1, b'{"a":1}'), (4, b'{"b":2}'), (5, None), (6, b'{"c":3}')
+    ]
+
+
+def test_ndjson_response_spools_to_disk_when_client_lags():
+    lines = [f'{{"n":{i}}}\n'.encode() for i in range(2000)]
+
+    async def content():
+        for line in lines:
+            yield line
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+        await asyncio.sleep(0)
+
+    response = NDJSONStreamResponse(content(), spool_bytes=256)
+    asyncio.run(response({"type": "http"}, None, send))
+
+    assert sent[0]["type"] == "http.response.start"
+    assert b"".join(m.get("body", b"") for m in sent[1:]) == b"".join(lines)
+    assert sent[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import random
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app, DATA_STORE
+from milestone_index import MilestoneIndex
+from scoring_engine import BatchScorer, determine_status
+
+client = TestClient(app)
+
+
+def random_children(count, seed=7):
+    rng = random.Random(seed)
+    ids = list(DATA_STORE.current().catalog.ids)
+    return [
+        {
+            "child_age_months": rng.randint(0, 45),
+            "completed_milestones": rng.sample(ids, rng.randint(0, len(ids))) + ["UNKNOWN_ID"],
+            "child_name": f"Child {i}"
+        }
+        for i in range(count)
+    ]
+
+
+def test_batch_matches_single_evaluations():
+    children = random_children(60)
+    response = client.post("/evaluate/batch", json={"children": children})
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["total_children"] == len(children)
+    assert sum(body["status_counts"].values()) == len(children)
+    for child, result in zip(children, body["results"]):
+        assert result == client.post("/evaluate", json=child).json()
+
+    assert body["children_with_red_flags"] == sum(1 for r in body["results"] if r["red_flags"])
+
+
+def test_batch_rejects_empty_request():
+    response = client.post("/evaluate/batch", json={"children": []})
+    assert response.status_code == 422
+
+
+def test_scorer_chunks_large_batches(monkeypatch):
+    import scoring_engine
+    monkeypatch.setattr(scoring_engine, "MAX_MATRIX_CELLS", 1)
+
+    scorer = BatchScorer(MilestoneIndex(DATA_STORE.current().catalog))
+    children = random_children(5)
+    scores = scorer.score_many(
+        [c["child_age_months"] for c in children],
+        [c["completed_milestones"] for c in children]
+    )
+    assert len(scores) == len(children)
+
+
+@pytest.mark.parametrize("completed, expected, red_flags, status", [
+    (0, 0, False, "No Data"),
+    (3, 4, True, "Referral Needed"),
+    (4, 4, False, "On Track"),
+    (2, 4, False, "Needs Support"),
+    (1, 4, False, "Referral Needed"),
+])
+def test_determine_status(completed, expected, red_flags, status):
+    assert determine_status(completed, expected, red_flags) == status
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,105 @@
+import json
+import pytest
+
+from catalog_artifact import load_artifact, source_key, write_artifact
+from data_store import DataStore
+from milestone_catalog import MilestoneCatalog
+
+MILESTONES = [
+    {
+        "milestone_id": "M_6M_001",
+        "age_range_months": {"min": 4, "max": 8, "typical": 6},
+        "domain": "motor",
+        "subdomain": "gross_motor",
+        "milestone_description": "Sits without support",
+        "red_flag": True,
+        "options": [{"label": "Yes", "value": "yes"}, {"label": "No", "value": "no"}]
+    },
+    {
+        "milestone_id": "M_9M_001",
+        "age_range_months": {"min": 8, "max": 10},
+        "domain": "language",
+        "red_flag": False
+    }
+]
+RECOMMENDATIONS = [{"id": "rec_1", "domain": "motor", "min_age": 0, "max_age": 12, "text": "Tummy time"}]
+
+
+class CountingValidator:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw_data):
+        self.calls += 1
+        return iter(raw_data)
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    milestones = tmp_path / "milestones.json"
+    recommendations = tmp_path / "recommendations.json"
+    milestones.write_text(json.dumps(MILESTONES))
+    recommendations.write_text(json.dumps(RECOMMENDATIONS))
+    return milestones, recommendations, tmp_path / "catalog.pkl"
+
+
+def test_round_trip_preserves_catalog(tmp_path):
+    catalog = MilestoneCatalog(MILESTONES)
+    path = str(tmp_path / "catalog.pkl")
+    write_artifact(path, "key", catalog)
+
+    loaded = load_artifact(path, "key")
+    assert loaded.to_dicts() == catalog.to_dicts()
+    assert loaded.position("M_9M_001") == 1
+    assert load_artifact(path, "other-key") is None
+    assert load_artifact(str(tmp_path / "missing.pkl"), "key") is None
+
+
+def test_corrupt_artifact_is_ignored(tmp_path):
+    path = tmp_path / "catalog.pkl"
+    path.write_bytes(b"not a pickle")
+    assert load_artifact(str(path), "key") is None
+
+
+def test_source_key_covers_schema():
+    raw = json.dumps(MILESTONES).encode()
+    assert source_key(raw, "v1") == source_key(raw, "v1")
+    assert source_key(raw, "v1") != source_key(raw, "v2")
+    assert source_key(raw, "v1") != source_key(raw + b" ", "v1")
+
+
+def test_second_worker_skips_validation(data_files):
+    milestones, recommendations, artifact = data_files
+
+    first = CountingValidator()
+    store = DataStore(str(milestones), str(recommendations), first, artifact_path=str(artifact))
+    assert first.calls == 1
+    assert store.catalog_source == "validated"
+    assert artifact.exists()
+
+    second = CountingValidator()
+    store = DataStore(str(milestones), str(recommendations), second, artifact_path=str(artifact))
+    assert second.calls == 0
+    assert store.catalog_source == "artifact"
+    assert store.current().catalog.to_dicts() == MilestoneCatalog(MILESTONES).to_dicts()
+
+
+def test_changed_data_or_schema_revalidates(data_files):
+    milestones, recommendations, artifact = data_files
+    DataStore(str(milestones), str(recommendations), CountingValidator(), artifact_path=str(artifact))
+
+    validator = CountingValidator()
+    store = DataStore(
+        str(milestones), str(recommendations), validator,
+        artifact_path=str(artifact), schema_fingerprint="new-schema"
+    )
+    assert validator.calls == 1
+
+    milestones.write_text(json.dumps(MILESTONES[:1]))
+    store.reload()
+    assert validator.calls == 2
+    assert len(store.current().catalog) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
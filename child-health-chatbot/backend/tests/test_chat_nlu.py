@@ -0,0 +1,46 @@
+import pytest
+
+from chat_nlu import detect_intent, extract_age_from_message, parse_message, score_domains
+
+
+@pytest.mark.parametrize("message, age", [
+    ("My child is 10 months old but not crawling yet", 10),
+    ("My 12-month-old cannot stand alone", 12),
+    ("My child is 24 months and only says 10 words", 24),
+    ("She is 2 years old", 24),
+    ("My 2-year-old is not talking much", 24),
+    ("My son is 1.5 years and not walking", 18),
+    ("He is 1 year 6 months old", 18),
+    ("बच्चा १० महीने का है", 10),
+    ("मेरा बच्चा 2 साल का है", 24),
+    ("Is it normal that he doesn't walk?", None),
+])
+def test_extract_age(message, age):
+    assert extract_age_from_message(message) == age
+
+
+@pytest.mark.parametrize("message, domain", [
+    ("My child is 10 months old but not crawling yet", "motor"),
+    ("My 2-year-old is not TALKING much", "language"),
+    ("She doesn't smile or laugh at us", "social"),
+    ("When should we visit the doctor?", "general"),
+    # Weighted: two strong social keywords beat one weak motor keyword
+    ("He won't smile or laugh when I hold him", "social"),
+])
+def test_detect_intent(message, domain):
+    assert detect_intent(message) == domain
+
+
+def test_ties_follow_domain_priority():
+    scores = score_domains("not walking or talking")
+    assert scores["motor"] == scores["language"]
+    assert detect_intent("not walking or talking") == "motor"
+
+
+def test_parse_message_combines_both():
+    message = "My 2-year-old is not talking much"
+    assert parse_message(message) == (extract_age_from_message(message), detect_intent(message))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
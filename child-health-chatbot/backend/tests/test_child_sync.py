@@ -0,0 +1,207 @@
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from child_sync import ChildSyncStore, StaleVersion
+from main import CHILD_SYNC, COMPUTE_POOL, DATA_STORE, SYNC_POOL, app
+from milestone_catalog import MilestoneCatalog
+from milestone_index import MilestoneIndex
+from scoring_engine import score_child
+
+CATALOG = MilestoneCatalog([
+    {"milestone_id": "M_1", "age_range_months": {"min": 0, "max": 6}, "domain": "motor", "red_flag": False},
+    {"milestone_id": "M_2", "age_range_months": {"min": 0, "max": 6}, "domain": "motor", "red_flag": True},
+    {"milestone_id": "L_1", "age_range_months": {"min": 4, "max": 12}, "domain": "language", "red_flag": True},
+    {"milestone_id": "S_1", "age_range_months": {"min": 10, "max": 20}, "domain": "social"},
+])
+INDEX = MilestoneIndex(CATALOG, grace_months=0)
+
+client = TestClient(app)
+
+
+def test_deltas_match_full_rescoring():
+    store = ChildSyncStore()
+    rng = random.Random(7)
+    ids = list(CATALOG.ids) + ["UNKNOWN"]
+    completed = set(rng.sample(ids, 2))
+    age = 5
+    version, _, score = store.sync("c", 1, INDEX, None, age, completed)
+    assert score == score_child(INDEX, age, completed)
+
+    for _ in range(200):
+        added = set(rng.sample(ids, rng.randint(0, 2)))
+        removed = set(rng.sample(ids, rng.randint(0, 2))) - added
+        new_age = rng.choice([None, None, None, rng.randint(-1, 25)])
+        age = age if new_age is None else new_age
+        completed = (completed - removed) | added
+        version, reported_age, score = store.sync("c", 1, INDEX, version, new_age, added, removed)
+        assert reported_age == age
+        assert score == score_child(INDEX, age, completed)
+
+    assert store.rescores < 100  # deltas without an age change are applied incrementally
+
+
+def test_stale_or_unknown_token_is_rejected():
+    store = ChildSyncStore()
+    first, _, _ = store.sync("c", 1, INDEX, None, 5, ["M_1"])
+    second, _, _ = store.sync("c", 1, INDEX, first, None, ["M_2"])
+
+    with pytest.raises(StaleVersion) as stale:
+        store.sync("c", 1, INDEX, first, None, ["L_1"])
+    assert stale.value.current == second
+    with pytest.raises(StaleVersion) as unknown:
+        store.sync("other", 1, INDEX, second, None)
+    assert unknown.value.current is None
+    # Tokens come from the state itself, not from the store that issued them
+    assert ChildSyncStore().sync("c", 1, INDEX, None, 5, ["M_1"])[0] == first
+
+
+def test_catalog_reload_rescores_from_stored_ids():
+    store = ChildSyncStore()
+    version, _, _ = store.sync("c", 1, INDEX, None, 5, ["M_1", "S_1"])
+    reloaded = MilestoneIndex(CATALOG, grace_months=10)
+    _, _, score = store.sync("c", 2, reloaded, version, None)
+    assert score == score_child(reloaded, 5, ["M_1", "S_1"])
+
+
+def test_full_sync_requires_age_and_lru_evicts():
+    store = ChildSyncStore(maxsize=2)
+    with pytest.raises(ValueError):
+        store.sync("a", 1, INDEX, None, None, ["M_1"])
+    versions = {child: store.sync(child, 1, INDEX, None, 5)[0] for child in ("a", "b", "c")}
+    assert len(store) == 3
+    assert store.stats()["cached"] == 2 and store.stats()["evictions"] == 1
+
+    # An evicted child is rebuilt from the database
+    _, _, score = store.sync("a", 1, INDEX, versions["a"], None, ["M_1"])
+    assert score == score_child(INDEX, 5, ["M_1"]) and store.stats()["rebuilds"] == 1
+
+
+def test_rejected_delta_leaves_state_unchanged(monkeypatch):
+    store = ChildSyncStore()
+    version, _, _ = store.sync("c", 1, INDEX, None, 5, ["M_1"])
+    monkeypatch.setattr("child_sync.MAX_COMPLETED_PER_CHILD", 2)
+
+    with pytest.raises(ValueError):
+        store.sync("c", 1, INDEX, version, None, ["M_2", "L_1"])
+    _, _, score = store.sync("c", 1, INDEX, version, None, ["M_2"])
+    assert score == score_child(INDEX, 5, ["M_1", "M_2"])
+
+
+def test_workers_sharing_a_database_accept_each_others_tokens(tmp_path):
+    path = str(tmp_path / "sync.sqlite")
+    workers = [ChildSyncStore(path), ChildSyncStore(path)]
+    rng = random.Random(11)
+    ids = list(CATALOG.ids)
+    completed = {"M_1"}
+    version, _, _ = workers[0].sync("c", 1, INDEX, None, 5, completed)
+
+    for i in range(50):
+        added = set(rng.sample(ids, rng.randint(0, 2)))
+        removed = set(rng.sample(ids, rng.randint(0, 2))) - added
+        completed = (completed - removed) | added
+        # Requests land on either worker, as behind uvicorn --workers
+        version, _, score = rng.choice(workers).sync("c", 1, INDEX, version, None, added, removed)
+        assert score == score_child(INDEX, 5, completed)
+    assert sum(worker.stats()["stale"] for worker in workers) == 0
+
+    # Two devices holding the same token: once one changed the state, the other's delta is stale on any worker
+    version = workers[0].sync("c", 1, INDEX, None, 5, ["M_1"])[0]
+    workers[0].sync("c", 1, INDEX, version, None, ["S_1"])
+    with pytest.raises(StaleVersion):
+        workers[1].sync("c", 1, INDEX, version, None, ["L_1"])
+
+    # A restarted worker keeps accepting the current token
+    current = workers[1].sync("c", 1, INDEX, None, 12, ["L_1"])[0]
+    assert ChildSyncStore(path).sync("c", 1, INDEX, current, None, ["S_1"])[1] == 12
+
+
+_PROCESS_STORE = None
+
+
+def _sync_in_process(path, *args):
+    global _PROCESS_STORE
+    if _PROCESS_STORE is None:
+        _PROCESS_STORE = ChildSyncStore(path)
+    version, _, score = _PROCESS_STORE.sync(args[0], 1, INDEX, *args[1:])
+    return version, score
+
+
+def test_deltas_succeed_across_worker_processes(tmp_path):
+    path = str(tmp_path / "sync.sqlite")
+    context = multiprocessing.get_context("spawn")
+    workers = [ProcessPoolExecutor(max_workers=1, mp_context=context) for _ in range(2)]
+    try:
+        version, _ = workers[0].submit(_sync_in_process, path, "c", None, 5, ["M_1"]).result()
+        completed = {"M_1"}
+        for i, (added, removed) in enumerate([(["M_2"], []), (["L_1"], ["M_1"]), ([], ["M_2"]), (["M_1", "M_2"], [])]):
+            version, score = workers[(i + 1) % 2].submit(_sync_in_process, path, "c", version, None, added, removed).result()
+            completed = (completed - set(removed)) | set(added)
+            assert score == score_child(INDEX, 5, completed)
+    finally:
+        for worker in workers:
+            worker.shutdown()
+
+
+def test_repeated_catalog_id_matches_full_rescoring():
+    catalog = MilestoneCatalog([
+        {"milestone_id": "M_DUP", "age_range_months": {"min": 0, "max": 6}, "domain": "motor", "red_flag": True},
+        {"milestone_id": "M_1", "age_range_months": {"min": 0, "max": 6}, "domain": "motor"},
+        {"milestone_id": "M_DUP", "age_range_months": {"min": 3, "max": 9}, "domain": "motor", "red_flag": True},
+    ])
+    index = MilestoneIndex(catalog, grace_months=0)
+    store = ChildSyncStore()
+    version, _, score = store.sync("child", 1, index, None, 4, ["M_1"])
+    assert score == score_child(index, 4, ["M_1"]) and len(score.red_flag_positions) == 2
+
+    version, _, score = store.sync("child", 1, index, version, None, added=["M_DUP"])
+    assert score == score_child(index, 4, ["M_1", "M_DUP"]) and score.status == "On Track"
+    version, _, score = store.sync("child", 1, index, version, 8, removed=["M_DUP"])
+    assert score == score_child(index, 8, ["M_1"])
+
+
+def test_waiting_syncs_leave_the_evaluation_pool_free():
+    expected = [m["milestone_id"] for m in DATA_STORE.current().milestone_index.expected(12)]
+    responses = []
+    # Stands in for another sync, or another worker, holding the store
+    with CHILD_SYNC._lock:
+        request = threading.Thread(target=lambda: responses.append(client.post(
+            "/children/queued-child/sync", json={"child_age_months": 12, "added": expected}
+        )))
+        request.start()
+        deadline = time.monotonic() + 5
+        while SYNC_POOL.stats()["pending"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert SYNC_POOL.stats()["pending"] == 1
+        assert COMPUTE_POOL.stats()["pending"] == 0
+    request.join(5)
+    assert responses[0].status_code == 200
+
+
+def test_sync_endpoint_round_trip():
+    expected = [m["milestone_id"] for m in DATA_STORE.current().milestone_index.expected(12)]
+    first = client.post("/children/test-child/sync?fields=ids", json={
+        "child_age_months": 12, "added": expected[:1], "child_name": "Aarav"
+    })
+    assert first.status_code == 200
+    evaluation = first.json()["evaluation"]
+    assert evaluation["total_completed"] == 1 and evaluation["missing_milestones"] == expected[1:]
+
+    delta = client.post("/children/test-child/sync", json={"version": first.json()["version"], "added": expected[1:]})
+    assert delta.status_code == 200
+    assert delta.json()["evaluation"]["result"] == "On Track"
+
+    stale = client.post("/children/test-child/sync", json={"version": first.json()["version"], "removed": expected})
+    assert stale.status_code == 409
+    assert stale.json()["detail"]["version"] == delta.json()["version"]
+
+    assert client.post("/children/new-child/sync", json={"added": []}).status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from compute_pool import ComputePool, PoolSaturated, percentiles
+from main import app, EVALUATION_CACHE
+
+client = TestClient(app)
+
+
+def test_identical_keys_share_one_computation():
+    pool = ComputePool(max_workers=2, max_pending=8)
+    release = threading.Event()
+    calls = []
+
+    def work(value):
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(pool.run("same", work, 21)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(scenario()) == [42] * 5
+    assert calls == [21]
+    stats = pool.stats()
+    assert stats["submitted"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["pending"] == 0
+    pool.shutdown()
+
+
+def test_finished_key_is_computed_again():
+    pool = ComputePool(max_workers=1, max_pending=4)
+    assert pool.submit("k", lambda: 1).result(5) == 1
+    assert pool.submit("k", lambda: 2).result(5) == 2
+    assert pool.stats()["coalesced"] == 0
+    pool.shutdown()
+
+
+def test_rejects_when_pending_limit_reached():
+    pool = ComputePool(max_workers=1, max_pending=2)
+    release = threading.Event()
+    first = pool.submit("held", release.wait, 5)
+    second = pool.submit(None, release.wait, 5)
+
+    with pytest.raises(PoolSaturated):
+        pool.submit(None, release.wait, 5)
+    # Joining an in-flight computation does not need a new slot
+    assert pool.submit("held", release.wait, 5) is first
+
+    release.set()
+    first.result(5)
+    second.result(5)
+    assert pool.stats()["rejected"] == 1
+    assert pool.submit(None, lambda: "ok").result(5) == "ok"
+    pool.shutdown()
+
+
+def test_percentiles_nearest_rank():
+    samples = list(range(1, 101))
+    result = percentiles(samples, points=(50, 99))
+    assert result == {"p50": 51, "p99": 99}
+    assert percentiles([]) == {"p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0}
+
+
+def test_evaluate_returns_503_when_pool_saturated(monkeypatch):
+    EVALUATION_CACHE.clear()
+    busy = ComputePool(max_workers=1, max_pending=1)
+    release = threading.Event()
+    busy.submit(None, release.wait, 5)
+    monkeypatch.setattr(main, "COMPUTE_POOL", busy)
+
+    response = client.post("/evaluate", json={"child_age_months": 12, "completed_milestones": []})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    release.set()
+    busy.shutdown()
+
+
+def test_pool_stats_endpoint():
+    client.post("/evaluate/batch", json={"children": [{"child_age_months": 12, "completed_milestones": []}]})
+    stats = client.get("/evaluate/pool").json()
+    assert stats["submitted"] >= 1
+    assert set(stats["latency_ms"]) == {"p50", "p90", "p95", "p99"}
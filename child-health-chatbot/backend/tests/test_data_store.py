@@ -0,0 +1,97 @@
+import json
+import time
+import pytest
+from fastapi.testclient import TestClient
+
+from data_store import DataStore
+from main import app
+
+MILESTONE = {
+    "milestone_id": "M_6M_001",
+    "age_range_months": {"min": 4, "max": 8, "typical": 6},
+    "domain": "motor",
+    "red_flag": False
+}
+RECOMMENDATION = {"id": "rec_1", "domain": "motor", "min_age": 0, "max_age": 12, "text": "Tummy time"}
+
+
+def validate(raw_data):
+    for item in raw_data:
+        if "milestone_id" not in item:
+            raise ValueError("milestone_id is required")
+        yield item
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    milestones = tmp_path / "milestones.json"
+    recommendations = tmp_path / "recommendations.json"
+    milestones.write_text(json.dumps([MILESTONE]))
+    recommendations.write_text(json.dumps([RECOMMENDATION]))
+    return milestones, recommendations
+
+
+def test_reload_swaps_in_new_version(data_files):
+    milestones, recommendations = data_files
+    swapped = []
+    store = DataStore(str(milestones), str(recommendations), validate, on_swap=swapped.append)
+    in_flight = store.current()
+
+    milestones.write_text(json.dumps([MILESTONE, dict(MILESTONE, milestone_id="M_6M_002")]))
+    snapshot = store.reload()
+
+    assert snapshot.version == 2
+    assert store.current() is snapshot
+    assert swapped == [snapshot]
+    assert len(snapshot.catalog) == 2
+    # A request that grabbed the old snapshot still sees the old data
+    assert len(in_flight.catalog) == 1
+
+
+def test_unchanged_content_keeps_snapshot(data_files):
+    store = DataStore(str(data_files[0]), str(data_files[1]), validate)
+    before = store.current()
+    assert store.reload() is before
+
+
+def test_invalid_data_keeps_old_snapshot(data_files):
+    milestones, recommendations = data_files
+    store = DataStore(str(milestones), str(recommendations), validate)
+    before = store.current()
+
+    milestones.write_text(json.dumps([{"domain": "motor"}]))
+    with pytest.raises(ValueError):
+        store.reload()
+
+    assert store.current() is before
+    assert "milestone_id is required" in store.status()["last_error"]
+
+
+def test_watcher_reloads_changed_files(data_files):
+    milestones, recommendations = data_files
+    store = DataStore(str(milestones), str(recommendations), validate)
+    store.start_watching(0.01)
+    try:
+        recommendations.write_text(json.dumps([RECOMMENDATION, dict(RECOMMENDATION, id="rec_2")]))
+        deadline = time.time() + 5
+        while store.current().version == 1 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        store.stop_watching()
+
+    assert store.current().version == 2
+    assert len(store.current().recommendations) == 2
+
+
+def test_admin_reload_endpoint(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    client = TestClient(app)
+
+    assert client.post("/admin/reload").status_code == 403
+    response = client.post("/admin/reload", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 202
+    assert response.json()["version"] >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app, DATA_STORE
+
+client = TestClient(app)
+
+
+def test_evaluate_all_completed_is_on_track():
+    expected_ids = [m["milestone_id"] for m in DATA_STORE.current().milestone_index.expected(12)]
+    response = client.post("/evaluate", json={
+        "child_age_months": 12,
+        "completed_milestones": expected_ids,
+        "child_name": "Aarav"
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["result"] == "On Track"
+    assert body["total_expected"] == len(expected_ids)
+    assert body["total_completed"] == len(expected_ids)
+    assert body["missing_milestones"] == []
+
+
+def test_evaluate_missing_red_flag_needs_referral():
+    expected = DATA_STORE.current().milestone_index.expected(24)
+    red_flag_ids = {m["milestone_id"] for m in expected if m["red_flag"]}
+    assert red_flag_ids, "Test data should contain red-flag milestones at 24 months"
+
+    completed = [m["milestone_id"] for m in expected if not m["red_flag"]]
+    response = client.post("/evaluate", json={
+        "child_age_months": 24,
+        "completed_milestones": completed
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["result"] == "Referral Needed"
+    assert {m["milestone_id"] for m in body["red_flags"]} == red_flag_ids
+
+
+def test_evaluate_age_without_data():
+    response = client.post("/evaluate", json={
+        "child_age_months": 500,
+        "completed_milestones": []
+    })
+    assert response.status_code == 200
+    assert response.json()["result"] == "No Data"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from evaluation_cache import EvaluationCache
+from main import app, EVALUATION_CACHE
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    cache = EvaluationCache(maxsize=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = EvaluationCache(maxsize=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 0
+
+
+def test_clear_counts_invalidation():
+    cache = EvaluationCache()
+    cache.put("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_evaluate_hits_cache_for_same_normalized_input():
+    EVALUATION_CACHE.clear()
+    before = EVALUATION_CACHE.stats()
+
+    first = client.post("/evaluate", json={
+        "child_age_months": 12, "completed_milestones": ["M_9M_001", "M_6M_001"], "child_name": "Aarav"
+    }).json()
+    # Same set in a different order, with a duplicate and a different name
+    second = client.post("/evaluate", json={
+        "child_age_months": 12, "completed_milestones": ["M_6M_001", "M_9M_001", "M_6M_001"], "child_name": "Priya"
+    }).json()
+
+    stats = client.get("/evaluate/cache").json()
+    assert stats["hits"] == before["hits"] + 1
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["catalog_version"]
+
+    assert first["message"] == "Evaluation complete for Aarav."
+    assert second["message"] == "Evaluation complete for Priya."
+    assert {k: v for k, v in first.items() if k != "message"} == \
+        {k: v for k, v in second.items() if k != "message"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,58 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from load_test import check_thresholds, drive, make_children, make_requests, summarize
+from bench_startup import make_milestones
+from main import app
+
+RESULT = {
+    "mode": "inproc", "milestones": 1000, "endpoint": "evaluate", "errors": 0,
+    "p95_ms": 120.0, "throughput_rps": 80.0, "rss_mb": 200.0,
+}
+
+
+def test_children_only_complete_expected_milestones():
+    milestones = make_milestones(200)
+    by_id = {m["milestone_id"]: m for m in milestones}
+    for child in make_children(milestones, 50):
+        for milestone_id in child["completed_milestones"]:
+            assert by_id[milestone_id]["age_range_months"]["min"] <= child["child_age_months"]
+
+
+def test_batch_requests_carry_batch_size_children():
+    children = make_children(make_milestones(50), 30)
+    requests = make_requests("batch", children, 3, batch_size=10)
+    assert [len(body["children"]) for _, body in requests] == [10, 10, 10]
+
+
+def test_thresholds_match_on_named_fields_only():
+    rules = [
+        {"max_errors": 0},
+        {"endpoint": "evaluate", "max_p95_ms": 100},
+        {"endpoint": "chat", "max_p95_ms": 1},
+        {"milestones": 1000, "min_throughput_rps": 100, "max_rss_mb": 500},
+    ]
+    assert check_thresholds([RESULT], rules) == [
+        "inproc evaluate @ 1000 milestones: p95_ms 120.0 > 100",
+        "inproc evaluate @ 1000 milestones: throughput_rps 80.0 < 100",
+    ]
+
+
+def test_drive_against_app_in_process():
+    requests = [("/evaluate", {"child_age_months": 12, "completed_milestones": []})] * 20
+    requests += [("/api/chat", {"message": "My 12-month-old is not walking", "seed": 1})] * 5
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await drive(client, requests, concurrency=4)
+
+    result = summarize("inproc", 20, "mixed", 4, asyncio.run(run()), rss_mb=0)
+    assert result["requests"] == 25
+    assert result["errors"] == 0
+    assert 0 < result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+from chat_nlu import parse_message
+from main import app, EVALUATION_CACHE
+from metrics import NULL_SPAN, Histogram, Metrics
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Test latency.", ("route",), buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(("/a",), seconds)
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Test latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 3.65',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    histogram = Histogram("h", "Help.", ("path",), buckets=(1.0,))
+    histogram.observe(('say "hi"\\',), 0.5)
+    assert 'h_count{path="say \\"hi\\"\\\\"} 1' in histogram.render()
+
+
+def test_disabled_metrics_record_nothing():
+    metrics = Metrics(enabled=False)
+    assert metrics.span("/evaluate", "milestone_filtering") is NULL_SPAN
+    assert metrics.stage_timer("/api/chat") is None
+    with metrics.span("/evaluate", "milestone_filtering"):
+        pass
+    assert metrics.stages.snapshot() == {}
+
+
+def test_parse_message_spans_do_not_change_result():
+    metrics = Metrics()
+    message = "My 18 month old is not walking"
+    assert parse_message(message, metrics.stage_timer("/api/chat")) == parse_message(message)
+    assert set(metrics.stages.snapshot()) == {("/api/chat", "age_extraction"), ("/api/chat", "intent_detection")}
+
+
+def test_metrics_endpoint_exposes_request_and_stage_histograms():
+    EVALUATION_CACHE.clear()
+    client.post("/evaluate", json={"child_age_months": 12, "completed_milestones": []})
+    client.post("/api/chat", json={"message": "My 12 month old is not walking", "seed": 1})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="POST",route="/evaluate",status="200"}' in body
+    for endpoint, stage in [
+        ("/evaluate", "milestone_filtering"),
+        ("/evaluate", "response_serialization"),
+        ("/api/chat", "age_extraction"),
+        ("/api/chat", "intent_detection"),
+        ("/api/chat", "recommendation_lookup"),
+    ]:
+        assert f'request_stage_duration_seconds_count{{endpoint="{endpoint}",stage="{stage}"}}' in body
+
+
+def test_unmatched_paths_share_one_label():
+    client.get("/no-such-page")
+    assert 'route="unmatched",status="404"' in client.get("/metrics").text
@@ -0,0 +1,53 @@
+import json
+import pytest
+from pathlib import Path
+
+from milestone_catalog import MilestoneCatalog
+
+# Path to the data file
+DATA_FILE_PATH = Path("data/milestones_data.json")
+
+
+@pytest.fixture(scope="module")
+def milestones():
+    with open(DATA_FILE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_hydrate_round_trips_every_milestone(milestones):
+    catalog = MilestoneCatalog(milestones)
+    assert len(catalog) == len(milestones)
+    assert catalog.to_dicts() == milestones
+
+
+def test_parallel_arrays(milestones):
+    catalog = MilestoneCatalog(milestones)
+    for position, milestone in enumerate(milestones):
+        assert catalog.ids[position] == milestone["milestone_id"]
+        assert catalog.position(milestone["milestone_id"]) == position
+        assert catalog.min_ages[position] == milestone["age_range_months"]["min"]
+        assert catalog.max_ages[position] == milestone["age_range_months"]["max"]
+        assert catalog.domain(position) == milestone["domain"]
+        assert catalog.is_red_flag(position) == milestone["red_flag"]
+
+
+def test_identical_options_are_stored_once(milestones):
+    catalog = MilestoneCatalog(milestones)
+    distinct = {id(text.options) for text in catalog.texts}
+    assert len(distinct) == 1
+
+
+def test_absent_fields_are_not_invented():
+    sparse = {
+        "milestone_id": "M_X",
+        "age_range_months": {"min": 1, "max": 2},
+        "domain": "motor",
+        "red_flag": True,
+        "notes": "kept as an extra field"
+    }
+    assert MilestoneCatalog([sparse]).hydrate(0) == sparse
+    assert MilestoneCatalog([sparse]).position("UNKNOWN") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,57 @@
+import json
+import pytest
+from pathlib import Path
+
+from milestone_index import MilestoneIndex
+
+# Path to the data file
+DATA_FILE_PATH = Path("data/milestones_data.json")
+
+
+def linear_scan(milestones, age_months):
+    """Reference implementation: the original full-catalog scan."""
+    return [
+        m for m in milestones
+        if m["age_range_months"]["min"] <= age_months <= m["age_range_months"]["max"] + 6
+    ]
+
+
+@pytest.fixture(scope="module")
+def milestones():
+    with open(DATA_FILE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_index_matches_linear_scan(milestones):
+    """Every monthly bucket must contain exactly what the full scan returns, in order."""
+    index = MilestoneIndex(milestones)
+    for age in range(-2, index.max_age + 10):
+        assert index.expected(age) == linear_scan(milestones, age), f"Mismatch at {age} months"
+
+
+def test_fractional_age_falls_back_to_scan(milestones):
+    index = MilestoneIndex(milestones)
+    assert index.expected(12.5) == linear_scan(milestones, 12.5)
+
+
+def test_negative_ages_match_linear_scan():
+    """Negative 'min' values and negative child ages keep the scan's semantics."""
+    milestones = [
+        {"milestone_id": "PRE_1", "age_range_months": {"min": -3, "max": -1}, "domain": "motor", "red_flag": False},
+        {"milestone_id": "M_1", "age_range_months": {"min": -1, "max": 2}, "domain": "motor", "red_flag": False},
+        {"milestone_id": "M_2", "age_range_months": {"min": 0, "max": 4}, "domain": "motor", "red_flag": False},
+    ]
+    index = MilestoneIndex(milestones)
+    assert index.min_age == -3
+    for age in range(-6, index.max_age + 3):
+        assert index.expected(age) == linear_scan(milestones, age), f"Mismatch at {age} months"
+
+
+def test_empty_catalog():
+    index = MilestoneIndex([])
+    assert len(index) == 0
+    assert index.expected(12) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import milestone_payloads
+from main import app, DATA_STORE, EVALUATION_CACHE, EvaluationResponse
+from milestone_payloads import MilestoneFragments, dumps
+
+client = TestClient(app)
+
+
+def test_fragments_match_hydrated_milestones():
+    catalog = DATA_STORE.current().catalog
+    fragments = MilestoneFragments(catalog)
+    positions = [3, 0, len(catalog) - 1]
+
+    assert json.loads(fragments.array(positions)) == catalog.hydrate_many(positions)
+    assert json.loads(fragments.array(positions, "ids")) == [catalog.ids[p] for p in positions]
+    assert fragments.array([]) == b"[]"
+
+
+def test_stdlib_fallback_encodes_like_orjson(monkeypatch):
+    value = {"milestone_description": "बच्चा बैठता है", "red_flag": True, "rate": 66.7, "options": []}
+    encoded = dumps(value)
+    monkeypatch.setattr(milestone_payloads, "orjson", None)
+    assert dumps(value) == encoded
+
+
+def test_evaluate_body_matches_response_model():
+    EVALUATION_CACHE.clear()
+    snapshot = DATA_STORE.current()
+    expected_ids = [m["milestone_id"] for m in snapshot.milestone_index.expected(24)]
+    completed = expected_ids[::3]
+
+    response = client.post("/evaluate", json={
+        "child_age_months": 24, "completed_milestones": completed, "child_name": "Meera \"M\""
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    score = snapshot.scoring.score(24, completed)
+    expected = EvaluationResponse(
+        result=score.status, completion_rate=round(score.completion_rate, 1),
+        total_expected=score.total_expected, total_completed=score.total_completed,
+        missing_milestones=snapshot.catalog.hydrate_many(score.missing_positions),
+        red_flags=snapshot.catalog.hydrate_many(score.red_flag_positions),
+        recommendations=["Please consult a health worker."],
+        message='Evaluation complete for Meera "M".'
+    )
+    assert response.json() == json.loads(expected.model_dump_json())
+
+
+def test_fields_ids_returns_milestone_ids_only():
+    full = client.post("/evaluate", json={"child_age_months": 24, "completed_milestones": []}).json()
+    ids = client.post("/evaluate?fields=ids", json={"child_age_months": 24, "completed_milestones": []}).json()
+
+    assert ids["missing_milestones"] == [m["milestone_id"] for m in full["missing_milestones"]]
+    assert ids["red_flags"] == [m["milestone_id"] for m in full["red_flags"]]
+    assert {k: v for k, v in ids.items() if k not in ("missing_milestones", "red_flags")} == \
+        {k: v for k, v in full.items() if k not in ("missing_milestones", "red_flags")}
+
+
+def test_batch_fields_ids():
+    children = [
+        {"child_age_months": 12, "completed_milestones": [], "child_name": "A"},
+        {"child_age_months": 500, "completed_milestones": [], "child_name": "B"},
+    ]
+    body = client.post("/evaluate/batch?fields=ids", json={"children": children}).json()
+    assert body["total_children"] == 2
+    assert all(isinstance(m, str) for m in body["results"][0]["missing_milestones"])
+    assert body["results"][1]["result"] == "No Data"
+    assert body["results"][1]["recommendations"] == []
+
+
+def test_unknown_fields_value_rejected():
+    response = client.post("/evaluate?fields=names", json={"child_age_months": 12, "completed_milestones": []})
+    assert response.status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
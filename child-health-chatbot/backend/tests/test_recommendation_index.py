@@ -0,0 +1,62 @@
+import json
+import random
+import pytest
+from pathlib import Path
+from fastapi.testclient import TestClient
+
+from main import app
+from recommendation_index import DEFAULT_RECOMMENDATION, RecommendationIndex
+
+# Path to the data file
+DATA_FILE_PATH = Path("data/recommendations.json")
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def recommendations():
+    with open(DATA_FILE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def linear_scan(recommendations, domain, age_months):
+    """Reference implementation: the original scan with its general fallback."""
+    relevant = [
+        rec["text"] for rec in recommendations
+        if rec["domain"] in (domain, "general") and rec["min_age"] <= age_months <= rec["max_age"]
+    ]
+    if not relevant:
+        relevant = [
+            rec["text"] for rec in recommendations
+            if rec["domain"] == "general" and rec["min_age"] <= age_months <= rec["max_age"]
+        ]
+    return tuple(relevant)
+
+
+@pytest.mark.parametrize("domain", ["motor", "language", "social", "general", "unknown"])
+def test_candidates_match_linear_scan(recommendations, domain):
+    index = RecommendationIndex(recommendations)
+    for age in range(-1, 80):
+        assert index.candidates(domain, age) == linear_scan(recommendations, domain, age), (domain, age)
+
+
+def test_seeded_choice_is_reproducible(recommendations):
+    index = RecommendationIndex(recommendations)
+    first = index.choose("motor", 8, random.Random(3))
+    assert first == index.choose("motor", 8, random.Random(3))
+    assert first in index.candidates("motor", 8)
+
+
+def test_no_candidates_returns_default():
+    index = RecommendationIndex([])
+    assert index.choose("motor", 8) == DEFAULT_RECOMMENDATION
+
+
+def test_chat_seed_makes_response_reproducible():
+    query = {"message": "My 8 month old is not crawling", "seed": 11}
+    responses = {client.post("/api/chat", json=query).json()["response"] for _ in range(5)}
+    assert len(responses) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from milestone_catalog import MilestoneCatalog
+from milestone_index import MilestoneIndex
+from scoring_engine import ScoringEngine, normalize_completed, partition_milestones
+
+CATALOG = MilestoneCatalog([
+    {"milestone_id": "M_1", "age_range_months": {"min": 0, "max": 6}, "domain": "motor", "red_flag": False},
+    {"milestone_id": "M_2", "age_range_months": {"min": 0, "max": 6}, "domain": "motor", "red_flag": True},
+    {"milestone_id": "L_1", "age_range_months": {"min": 0, "max": 6}, "domain": "language", "red_flag": True},
+    {"milestone_id": "S_1", "age_range_months": {"min": 0, "max": 6}, "domain": "social"},
+])
+
+
+def test_partition_single_pass_matches_list_semantics():
+    completed_ids = ["M_1", "L_1", "NOT_EXPECTED"]
+    completed, missing, red_flags = partition_milestones(CATALOG, range(4), completed_ids)
+
+    assert completed == [p for p in range(4) if CATALOG.ids[p] in completed_ids]
+    assert missing == [p for p in range(4) if CATALOG.ids[p] not in completed_ids]
+    assert red_flags == [1]
+
+
+def test_partition_only_considers_expected_positions():
+    completed, missing, red_flags = partition_milestones(CATALOG, [0, 3], [])
+    assert completed == []
+    assert missing == [0, 3]
+    assert red_flags == []
+
+
+def test_partition_accepts_prebuilt_frozenset():
+    completed_ids = normalize_completed(["M_2"])
+    assert normalize_completed(completed_ids) is completed_ids
+
+    completed, missing, red_flags = partition_milestones(CATALOG, range(4), completed_ids)
+    assert [CATALOG.ids[p] for p in completed] == ["M_2"]
+    assert [CATALOG.ids[p] for p in red_flags] == ["L_1"]
+
+
+def test_single_and_batch_scoring_agree():
+    engine = ScoringEngine(MilestoneIndex(CATALOG))
+    rng = random.Random(3)
+    ages = [rng.randint(-2, 9) for _ in range(50)]
+    completed_lists = [rng.sample(CATALOG.ids, rng.randint(0, 4)) + ["UNKNOWN"] for _ in ages]
+
+    batch = engine.score_many(ages, completed_lists)
+    assert batch == [engine.score(age, ids) for age, ids in zip(ages, completed_lists)]
+    assert {score.status for score in batch} >= {"No Data", "Referral Needed"}
+
+
+def test_repeated_milestone_id_scores_every_entry():
+    # One ID on two entries with different age ranges; both count once it is completed
+    catalog = MilestoneCatalog([
+        {"milestone_id": "M_1", "age_range_months": {"min": 0, "max": 6}, "domain": "motor"},
+        {"milestone_id": "M_DUP", "age_range_months": {"min": 0, "max": 3}, "domain": "motor", "red_flag": True},
+        {"milestone_id": "M_DUP", "age_range_months": {"min": 2, "max": 6}, "domain": "motor"},
+    ])
+    assert catalog.positions("M_DUP") == (1, 2)
+    engine = ScoringEngine(MilestoneIndex(catalog))
+    ages = [0, 3, 3, 9, 14]
+    completed_lists = [["M_DUP"], ["M_DUP"], ["M_1"], ["M_DUP", "M_1"], []]
+
+    batch = engine.score_many(ages, completed_lists)
+    assert batch == [engine.score(age, ids) for age, ids in zip(ages, completed_lists)]
+    assert batch[1].completed_positions == [1, 2]
+    assert batch[2].red_flag_positions == [1]
+
+
+def test_batch_scoring_covers_negative_ages():
+    catalog = MilestoneCatalog([
+        {"milestone_id": "PRE_1", "age_range_months": {"min": -2, "max": -1}, "domain": "motor", "red_flag": True},
+        {"milestone_id": "M_1", "age_range_months": {"min": 0, "max": 3}, "domain": "motor"},
+    ])
+    engine = ScoringEngine(MilestoneIndex(catalog, grace_months=0))
+    ages = list(range(-4, 6))
+    completed_lists = [["M_1"]] * len(ages)
+
+    batch = engine.score_many(ages, completed_lists)
+    assert batch == [engine.score(age, ids) for age, ids in zip(ages, completed_lists)]
+    assert [score.status for score in batch[:3]] == ["No Data", "No Data", "Referral Needed"]
+
+
+def test_batch_scorer_built_lazily():
+    engine = ScoringEngine(MilestoneIndex(CATALOG))
+    engine.score(3, ["M_1"])
+    assert engine._batch_scorer is None
+    engine.score_many([3], [["M_1"]])
+    assert engine._batch_scorer is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
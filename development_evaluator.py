@@ -1,7 +1,20 @@
 import json
-from typing import List, Dict, Tuple
+import sys
+from typing import Iterator, List, Dict, Tuple
 from pathlib import Path
 
+# Shared milestone lookup code lives with the FastAPI backend. Appended rather
+# than prepended so backend modules never shadow a caller's own top-level modules.
+BACKEND_DIR = Path(__file__).resolve().parent / "child-health-chatbot" / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.append(str(BACKEND_DIR))
+
+from assessment_store import AssessmentStore
+from assessment_stream import AssessmentStream
+from milestone_catalog import MilestoneCatalog
+from milestone_index import MilestoneIndex
+from scoring_engine import ChildScore, ScoringEngine, status_counts
+
 
 class DevelopmentEvaluator:
     """
@@ -16,7 +29,9 @@ class DevelopmentEvaluator:
             milestones_file: Path to JSON file containing milestone data
             recommendations_file: Path to JSON file containing activity recommendations
         """
-        self.milestones_data = []
+        self.catalog = MilestoneCatalog()
+        self.milestone_index = MilestoneIndex(self.catalog)
+        self.scoring = ScoringEngine(self.milestone_index)
         self.stimulation_activities = {}
         
         # Load milestones
@@ -32,8 +47,9 @@ class DevelopmentEvaluator:
         """Load milestones from JSON file."""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                self.milestones_data = json.load(f)
-            print(f"✅ Loaded {len(self.milestones_data)} milestones from {filepath}")
+                self.catalog = MilestoneCatalog(json.load(f))
+            self._build_indexes()
+            print(f"✅ Loaded {len(self.catalog)} milestones from {filepath}")
         except FileNotFoundError:
             print(f"⚠️ Warning: Milestones file not found at {filepath}. Using defaults.")
             self.load_default_milestones()
@@ -74,7 +90,7 @@ class DevelopmentEvaluator:
     def load_default_milestones(self):
         """Load default milestone data if no file is provided."""
         # Sample milestones for demonstration
-        self.milestones_data = [
+        self.catalog = MilestoneCatalog([
             {
                 "milestone_id": "M_6M_001",
                 "age_range_months": {"min": 4, "max": 8, "typical": 6},
@@ -123,8 +139,20 @@ class DevelopmentEvaluator:
                 "milestone_description": "Combines two words together",
                 "red_flag": True
             }
-        ]
-        print(f"✅ Loaded {len(self.milestones_data)} default milestones")
+        ])
+        self._build_indexes()
+        print(f"✅ Loaded {len(self.catalog)} default milestones")
+    
+    def _build_indexes(self):
+        """Rebuild lookup structures after milestone data changes."""
+        self.milestone_index = MilestoneIndex(self.catalog)
+        # Shared with the FastAPI backend; batch matrices are only built if evaluate_many is used
+        self.scoring = ScoringEngine(self.milestone_index)
+    
+    @property
+    def milestones_data(self) -> List[Dict]:
+        """All milestones as dictionaries, hydrated from the compact catalog."""
+        return self.catalog.to_dicts()
     
     def get_expected_milestones(self, age_months: int) -> List[Dict]:
         """
@@ -136,14 +164,8 @@ class DevelopmentEvaluator:
         Returns:
             List of milestone dictionaries
         """
-        expected = []
-        for milestone in self.milestones_data:
-            # Include milestone if age is within or past the typical age
-            if age_months >= milestone["age_range_months"]["min"]:
-                # Only include if age is within reasonable range
-                if age_months <= milestone["age_range_months"]["max"] + 6:
-                    expected.append(milestone)
-        return expected
+        # Milestones are bucketed by month when loaded, so this is a single lookup
+        return self.milestone_index.expected(age_months)
     
     def evaluate_development(self, child_data: Dict) -> Dict:
         """
@@ -167,16 +189,132 @@ class DevelopmentEvaluator:
                 - message: str - Summary message for parents
         """
         age_months = child_data.get('age_months')
-        completed_milestone_ids = child_data.get('completed_milestones', [])
-        child_name = child_data.get('child_name', 'Your child')
         
         if not age_months:
             raise ValueError("age_months is required in child_data")
         
-        # Get expected milestones for this age
-        expected_milestones = self.get_expected_milestones(age_months)
+        score = self.scoring.score(age_months, child_data.get('completed_milestones', []))
+        return self._result_from_score(child_data, score)
+    
+    def evaluate_many(self, children: List[Dict]) -> Dict:
+        """
+        Evaluate a batch of children in one vectorized pass.
         
-        if not expected_milestones:
+        Args:
+            children: List of child_data dictionaries, as for evaluate_development
+                
+        Returns:
+            Dictionary containing:
+                - results: List[Dict] - One evaluate_development-style result per child
+                - total_children: int - Number of children evaluated
+                - status_counts: Dict[str, int] - Children per status
+                - children_with_red_flags: int - Children missing a critical milestone
+        """
+        for child_data in children:
+            if not child_data.get('age_months'):
+                raise ValueError("age_months is required in child_data")
+        
+        scores = self.scoring.score_many(
+            [child_data['age_months'] for child_data in children],
+            [child_data.get('completed_milestones', []) for child_data in children]
+        )
+        
+        return {
+            'results': [self._result_from_score(child_data, score) for child_data, score in zip(children, scores)],
+            'total_children': len(children),
+            'status_counts': status_counts(scores),
+            'children_with_red_flags': sum(1 for score in scores if score.red_flag_positions)
+        }
+    
+    def evaluate_from_store(self, store: AssessmentStore, child_id: str, as_of: str = None) -> Dict:
+        """
+        Evaluate a child from their stored assessment history.
+        
+        Args:
+            store: Assessment store holding the child's assessments
+            child_id: Child to evaluate
+            as_of: Evaluate as of this date (YYYY-MM-DD) instead of the latest assessment
+            
+        Returns:
+            evaluate_development result, plus child_id and assessment_date
+            
+        Raises:
+            KeyError: If the store has no assessment for the child
+        """
+        child_data = store.child_data(child_id, as_of)
+        if child_data is None:
+            raise KeyError(f"No assessments stored for child '{child_id}'")
+        return {
+            'child_id': child_id,
+            'assessment_date': child_data['assessment_date'],
+            **self.evaluate_development(child_data)
+        }
+    
+    def evaluate_store(self, store: AssessmentStore, as_of: str = None) -> Dict:
+        """
+        Evaluate every child in an assessment store at their latest assessment.
+        
+        Args:
+            store: Assessment store to evaluate
+            as_of: Only consider assessments on or before this date (YYYY-MM-DD)
+            
+        Returns:
+            evaluate_many result; each entry in results also has child_id and assessment_date
+        """
+        children = [child_data for child_data in store.all_child_data(as_of) if child_data['age_months']]
+        evaluation = self.evaluate_many(children)
+        for child_data, result in zip(children, evaluation['results']):
+            result['child_id'] = child_data['child_id']
+            result['assessment_date'] = child_data['assessment_date']
+        return evaluation
+    
+    def evaluate_export(self, path: str, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Evaluate every assessment in an export file, streaming it in constant memory.
+    
+        Each assessment is evaluated on its own milestones (unlike evaluate_store,
+        which accumulates a child's history); assessments with age_months 0 are skipped.
+    
+        Args:
+            path: Export in the mcp_milestones_sample_data.json format
+            batch_size: Assessments scored per evaluate_many call
+    
+        Yields:
+            evaluate_development results, plus child_id and assessment_date
+        """
+        batch = []
+        for assessment in AssessmentStream(path, self.catalog):
+            if not assessment['age_months']:
+                continue
+            batch.append(assessment)
+            if len(batch) >= batch_size:
+                yield from self._evaluate_assessments(batch)
+                batch = []
+        if batch:
+            yield from self._evaluate_assessments(batch)
+    
+    def _evaluate_assessments(self, assessments: List[Dict]) -> List[Dict]:
+        """evaluate_many results for assessment records, tagged with child_id and assessment_date."""
+        results = self.evaluate_many(assessments)['results']
+        for assessment, result in zip(assessments, results):
+            result['child_id'] = assessment['child_id']
+            result['assessment_date'] = assessment['assessment_date']
+        return results
+    
+    def _result_from_score(self, child_data: Dict, score: ChildScore) -> Dict:
+        """
+        Build the evaluation result for a child from its ChildScore.
+        
+        Args:
+            child_data: The child_data dictionary that was scored
+            score: Scoring engine output for that child
+            
+        Returns:
+            evaluate_development-style result dictionary
+        """
+        age_months = child_data['age_months']
+        
+        if score.status == 'No Data':
             return {
                 'status': 'No Data',
                 'completion_rate': 0.0,
@@ -188,68 +326,26 @@ class DevelopmentEvaluator:
                 'message': f"No milestone data available for {age_months} months."
             }
         
-        # Calculate completion
-        total_expected = len(expected_milestones)
-        completed_milestones = [m for m in expected_milestones 
-                               if m['milestone_id'] in completed_milestone_ids]
-        total_completed = len(completed_milestones)
-        completion_rate = (total_completed / total_expected) * 100 if total_expected > 0 else 0
-        
-        # Identify missing milestones
-        missing_milestones = [m for m in expected_milestones 
-                             if m['milestone_id'] not in completed_milestone_ids]
-        
-        # Identify red flags
-        red_flags = [m for m in missing_milestones if m.get('red_flag', False)]
-        
-        # Determine status
-        status = self._determine_status(completion_rate, red_flags)
-        
-        # Get recommendations
-        recommendations = self._get_recommendations(
-            status, missing_milestones, completed_milestones, age_months
-        )
-        
-        # Generate message
-        message = self._generate_message(
-            child_name, age_months, status, completion_rate, 
-            total_completed, total_expected, red_flags
-        )
+        completed_milestones = self.catalog.hydrate_many(score.completed_positions)
+        missing_milestones = self.catalog.hydrate_many(score.missing_positions)
+        red_flags = self.catalog.hydrate_many(score.red_flag_positions)
         
         return {
-            'status': status,
-            'completion_rate': round(completion_rate, 1),
-            'total_expected': total_expected,
-            'total_completed': total_completed,
+            'status': score.status,
+            'completion_rate': round(score.completion_rate, 1),
+            'total_expected': score.total_expected,
+            'total_completed': score.total_completed,
             'missing_milestones': missing_milestones,
             'red_flags': red_flags,
-            'recommendations': recommendations,
-            'message': message
+            'recommendations': self._get_recommendations(
+                score.status, missing_milestones, completed_milestones, age_months
+            ),
+            'message': self._generate_message(
+                child_data.get('child_name', 'Your child'), age_months, score.status,
+                score.completion_rate, score.total_completed, score.total_expected, red_flags
+            )
         }
     
-    def _determine_status(self, completion_rate: float, red_flags: List[Dict]) -> str:
-        """
-        Determine development status based on completion rate and red flags.
-        
-        Args:
-            completion_rate: Percentage of milestones completed
-            red_flags: List of critical milestones missed
-            
-        Returns:
-            Status string
-        """
-        # Red flag takes priority
-        if red_flags:
-            return 'Referral Needed'
-        
-        # Check completion rate
-        if completion_rate == 100:
-            return 'On Track'
-        elif completion_rate >= 50:
-            return 'Needs Support'
-        else:
-            return 'Referral Needed'
-    
     def _get_recommendations(
         self, 
         status: str, 
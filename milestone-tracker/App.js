@@ -19,6 +19,8 @@ const { width } = Dimensions.get('window');
 const STORAGE_KEY = '@milestone_responses';
 const LANGUAGE_KEY = '@language_preference';
 const VIDEO_UPLOADS_KEY = '@video_uploads';
+const CHILD_ID_KEY = '@child_id';
+const SYNC_STATE_KEY = '@sync_state';
 
 // API Configuration
 const API_BASE_URL = 'http://localhost:8000';  // Change to your computer's IP for physical device testing
@@ -261,38 +263,78 @@ export default function App() {
     }
   };
 
+  const getChildId = async () => {
+    let childId = await AsyncStorage.getItem(CHILD_ID_KEY);
+    if (!childId) {
+      childId = `child-${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+      await AsyncStorage.setItem(CHILD_ID_KEY, childId);
+    }
+    return childId;
+  };
+
+  const postSync = (childId, body) => fetch(
+    `${API_BASE_URL}/children/${encodeURIComponent(childId)}/sync?fields=ids`,
+    {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ ...body, child_name: 'Your Child' }),
+    }
+  );
+
+  // Sends only the milestones changed since the last sync. Falls back to a
+  // full sync on the first run, or when the server no longer has this
+  // child's state (409).
+  const syncEvaluation = async (completedIds, ageMonths) => {
+    const childId = await getChildId();
+    const syncStateJson = await AsyncStorage.getItem(SYNC_STATE_KEY);
+    const syncState = syncStateJson ? JSON.parse(syncStateJson) : null;
+
+    let response = null;
+    if (syncState) {
+      const synced = new Set(syncState.completed);
+      const current = new Set(completedIds);
+      const delta = {
+        version: syncState.version,
+        added: completedIds.filter(id => !synced.has(id)),
+        removed: syncState.completed.filter(id => !current.has(id)),
+      };
+      if (syncState.ageMonths !== ageMonths) {
+        delta.child_age_months = ageMonths;
+      }
+      response = await postSync(childId, delta);
+    }
+    if (!response || response.status === 409) {
+      response = await postSync(childId, {
+        child_age_months: ageMonths,
+        added: completedIds,
+      });
+    }
+
+    if (!response.ok) {
+      throw new Error('Network response was not ok');
+    }
+
+    const data = await response.json();
+    await AsyncStorage.setItem(SYNC_STATE_KEY, JSON.stringify({
+      version: data.version,
+      ageMonths,
+      completed: completedIds,
+    }));
+    return data.evaluation;
+  };
+
   const evaluateProgress = async () => {
     setIsEvaluating(true);
     setEvaluationResult(null);
 
     try {
-      // Get completed milestone IDs for the current age
-      const currentMilestones = sampleMilestones.filter(
-        m => m.age_range_months.typical === selectedAge
-      );
-
-      const completedMilestoneIds = currentMilestones
-        .filter(m => milestoneResponses[m.milestone_id] === true)
-        .map(m => m.milestone_id);
-
-      // Make API call to backend
-      const response = await fetch(`${API_BASE_URL}/evaluate`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          child_age_months: selectedAge,
-          completed_milestones: completedMilestoneIds,
-          child_name: 'Your Child'
-        }),
-      });
-
-      if (!response.ok) {
-        throw new Error('Network response was not ok');
-      }
+      // The server keeps the child's milestones, so only changes are sent
+      const completedMilestoneIds = Object.keys(milestoneResponses)
+        .filter(id => milestoneResponses[id] === true);
 
-      const data = await response.json();
+      const data = await syncEvaluation(completedMilestoneIds, selectedAge);
       setEvaluationResult(data);
 
       // Show appropriate alert based on result
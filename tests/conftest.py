@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLE_CSV = ROOT / "video_metadata.csv"
+
+
+@pytest.fixture(autouse=True)
+def salt_and_workdir(tmp_path, monkeypatch):
+    """Every test gets a fixed salt and runs in its own directory, so mapping files never land in the repo."""
+    monkeypatch.setenv("VIDEO_HASH_SALT", "test-salt")
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """
+    Build a metadata CSV and a video directory.
+
+    Returns:
+        Function taking metadata rows and {filename: bytes} contents, and
+        returning (csv_path, video_directory)
+    """
+    def build(rows, contents=None):
+        videos = tmp_path / "videos"
+        videos.mkdir(exist_ok=True)
+        for name, data in (contents or {}).items():
+            (videos / name).write_bytes(data)
+        csv_path = tmp_path / "metadata.csv"
+        pd.DataFrame(rows, columns=["filename", "child_age", "milestone_id", "label"]).to_csv(csv_path, index=False)
+        return str(csv_path), str(videos)
+
+    return build
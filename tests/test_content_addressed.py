@@ -0,0 +1,123 @@
+import errno
+import json
+
+import pytest
+
+import video_dataset_manager
+from video_dataset_manager import DeidentificationManifest, VideoDatasetManager, hash_file_content
+
+ROWS = [
+    ("a.mp4", 6, "M_6M_001", "achieved"),
+    ("b.mp4", 9, "L_9M_001", "achieved"),
+    ("c.mp4", 12, "S_12M_001", "not_achieved"),
+]
+CONTENTS = {"a.mp4": b"same video", "b.mp4": b"same video", "c.mp4": b"other video"}
+
+
+@pytest.fixture
+def manager(dataset):
+    csv_path, videos = dataset(ROWS, CONTENTS)
+    return VideoDatasetManager(csv_path, videos)
+
+
+def deidentify(manager, **kwargs):
+    return manager.deidentify_files(dry_run=False, deterministic=True, workers=4, **kwargs)
+
+
+def test_names_are_content_hashes(manager, tmp_path):
+    mapping = deidentify(manager, output_directory="copies")
+
+    assert mapping["a.mp4"] == mapping["b.mp4"] == hash_file_content(tmp_path / "videos" / "a.mp4", "test-salt") + ".mp4"
+    assert mapping["c.mp4"] != mapping["a.mp4"]
+    assert sorted(path.name for path in (tmp_path / "copies").iterdir()) == sorted(set(mapping.values()))
+    assert json.loads((tmp_path / "video_mapping.json").read_text()) == mapping
+    assert manager.df["hashed_filename"].tolist() == [mapping[name] for name in manager.df["filename"]]
+
+
+def test_identical_files_transferred_once(manager, tmp_path, monkeypatch):
+    destinations = []
+    transfer_file = manager._transfer_file
+
+    def spy(original, hashed, *args):
+        destinations.append(hashed)
+        return transfer_file(original, hashed, *args)
+
+    monkeypatch.setattr(manager, "_transfer_file", spy)
+    mapping = deidentify(manager, output_directory="copies")
+
+    assert sorted(destinations) == sorted(set(mapping.values()))
+    assert (tmp_path / "copies" / mapping["b.mp4"]).read_bytes() == b"same video"
+
+
+def test_identical_files_renamed_in_place(manager, tmp_path):
+    mapping = deidentify(manager)
+
+    assert sorted(path.name for path in (tmp_path / "videos").iterdir()) == sorted(set(mapping.values()))
+    assert (tmp_path / "videos" / mapping["a.mp4"]).read_bytes() == b"same video"
+
+
+def test_failed_copy_keeps_existing_destination(manager, tmp_path, monkeypatch):
+    copies = tmp_path / "copies"
+    copies.mkdir()
+    (copies / "abc.mp4").write_bytes(b"complete copy")
+
+    def failing_copy(source, dest, hardlink=False):
+        dest.write_bytes(b"half")
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(video_dataset_manager, "fast_copy", failing_copy)
+    monkeypatch.setattr(video_dataset_manager, "RETRY_BACKOFF_SECONDS", 0)
+    status, message, _ = manager._transfer_file("a.mp4", "abc.mp4", str(copies), retries=1)
+
+    assert status == "error" and "I/O error" in message
+    assert [path.name for path in copies.iterdir()] == ["abc.mp4"]
+    assert (copies / "abc.mp4").read_bytes() == b"complete copy"
+
+
+def test_rerun_skips_unchanged_files(manager, tmp_path, monkeypatch):
+    first = deidentify(manager, output_directory="copies")
+    hashed = []
+    monkeypatch.setattr(
+        video_dataset_manager, "hash_file_content", lambda path, salt: hashed.append(path.name) or hash_file_content(path, salt)
+    )
+
+    assert deidentify(manager, output_directory="copies") == first
+    assert hashed == []
+
+    # A lost copy is restored from the manifest without re-hashing; a changed file is re-hashed
+    (tmp_path / "copies" / first["c.mp4"]).unlink()
+    (tmp_path / "videos" / "b.mp4").write_bytes(b"edited video")
+    second = deidentify(manager, output_directory="copies")
+
+    assert hashed == ["b.mp4"]
+    assert second["c.mp4"] == first["c.mp4"] and (tmp_path / "copies" / first["c.mp4"]).exists()
+    assert second["b.mp4"] != first["b.mp4"]
+
+
+def test_failed_run_resumes(manager, tmp_path, monkeypatch):
+    transfer_file = manager._transfer_file
+    monkeypatch.setattr(
+        manager, "_transfer_file",
+        lambda original, *args: ("error", "disk full", 0) if original == "c.mp4" else transfer_file(original, *args)
+    )
+    with pytest.raises(RuntimeError, match="1 files failed"):
+        deidentify(manager, output_directory="copies")
+    assert not (tmp_path / "video_mapping.json").exists()
+    with DeidentificationManifest("deidentification_manifest.sqlite", "test-salt") as manifest:
+        assert sorted(manifest.entries()) == ["a.mp4", "b.mp4"]
+
+    monkeypatch.undo()
+    monkeypatch.setenv("VIDEO_HASH_SALT", "test-salt")
+    monkeypatch.chdir(tmp_path)
+    assert sorted(deidentify(manager, output_directory="copies")) == ["a.mp4", "b.mp4", "c.mp4"]
+
+
+def test_salt_change_discards_manifest(manager):
+    deidentify(manager, output_directory="copies")
+
+    with DeidentificationManifest("deidentification_manifest.sqlite", "new-salt") as manifest:
+        assert len(manifest) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import SAMPLE_CSV
+from video_dataset_manager import VideoDatasetManager
+
+
+def test_duplicate_rows_get_distinct_names():
+    manager = VideoDatasetManager(str(SAMPLE_CSV), load=False)
+    rows = pd.Series(["clip.mp4"] * 1000), pd.Series([6] * 1000), pd.Series(["M_6M_001"] * 1000)
+
+    first = manager.hashed_filenames(*rows)
+    second = manager.hashed_filenames(*rows)
+
+    assert first.nunique() == 1000
+    assert not set(first) & set(second)
+    assert first.str.fullmatch(r"[0-9a-f]{16}\.mp4").all()
+    assert manager.hashed_filenames(rows[0][:0], rows[1][:0], rows[2][:0]).empty
+
+
+def test_stream_matches_in_memory_layout(tmp_path):
+    manager = VideoDatasetManager(str(SAMPLE_CSV), load=False)
+
+    counts = manager.deidentify_stream(output_csv="out.csv", chunksize=7)
+
+    expected = pd.read_csv(SAMPLE_CSV)
+    out = pd.read_csv("out.csv")
+    assert counts["rows"] == len(expected) and counts["chunks"] == -(-len(expected) // 7)
+    assert list(out.columns) == list(expected.columns) + ["hashed_filename", "original_filename"]
+    assert out["original_filename"].tolist() == expected["filename"].tolist()
+    assert (out["filename"] == out["hashed_filename"]).all() and out["filename"].is_unique
+
+    mapping = json.loads((tmp_path / "video_mapping.json").read_text())
+    assert mapping == dict(zip(out["original_filename"], out["filename"]))
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_stream_transfers_files(dataset, tmp_path):
+    csv_path, videos = dataset(
+        [("a.mp4", 6, "M_6M_001", "achieved"), ("b.mp4", 9, "L_9M_001", "achieved"),
+         ("gone.mp4", 12, "S_12M_001", "achieved")],
+        {"a.mp4": b"aaa", "b.mp4": b"bbb"}
+    )
+    manager = VideoDatasetManager(csv_path, videos, load=False)
+
+    counts = manager.deidentify_stream(output_csv="out.csv", output_directory="copies", dry_run=False, chunksize=2)
+
+    assert (counts["copied"], counts["missing"], counts["error"]) == (2, 1, 0)
+    mapping = json.loads((tmp_path / "video_mapping.json").read_text())
+    assert (tmp_path / "copies" / mapping["a.mp4"]).read_bytes() == b"aaa"
+    assert (tmp_path / "copies" / mapping["b.mp4"]).read_bytes() == b"bbb"
+
+
+def test_stream_failure_publishes_nothing(dataset, tmp_path, monkeypatch):
+    csv_path, videos = dataset([("a.mp4", 6, "M_6M_001", "achieved")], {"a.mp4": b"aaa"})
+    manager = VideoDatasetManager(csv_path, videos, load=False)
+    monkeypatch.setattr(manager, "_transfer_file", lambda *args: ("error", "disk full", 0))
+
+    with pytest.raises(RuntimeError, match="1 files failed"):
+        manager.deidentify_stream(output_csv="out.csv", output_directory="copies", dry_run=False)
+
+    assert not (tmp_path / "out.csv").exists() and not (tmp_path / "video_mapping.json").exists()
+    assert list(json.loads((tmp_path / "video_mapping.json.partial").read_text())) == ["a.mp4"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,121 @@
+import errno
+import json
+import os
+
+import pytest
+
+import video_dataset_manager
+from video_dataset_manager import VideoDatasetManager, fast_copy
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.mp4"
+    path.write_bytes(os.urandom(256 * 1024))
+    os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    return path
+
+
+def test_fast_copy_copies_content_and_metadata(source, tmp_path):
+    dest = tmp_path / "dest.mp4"
+    dest.write_bytes(b"stale")
+
+    assert fast_copy(source, dest) in ("reflink", "copy_file_range", "copy")
+    assert dest.read_bytes() == source.read_bytes()
+    assert dest.stat().st_mtime_ns == source.stat().st_mtime_ns
+    assert not os.path.samefile(source, dest)
+
+
+def test_fast_copy_hardlink(source, tmp_path):
+    dest = tmp_path / "dest.mp4"
+    dest.write_bytes(b"stale")
+
+    assert fast_copy(source, dest, hardlink=True) == "hardlink"
+    assert os.path.samefile(source, dest)
+
+
+def test_fast_copy_falls_back_to_buffered_copy(source, tmp_path, monkeypatch):
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "link", unsupported)
+    monkeypatch.setattr(video_dataset_manager, "_reflink", lambda src, dst: False)
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    dest = tmp_path / "dest.mp4"
+
+    assert fast_copy(source, dest, hardlink=True) == "copy"
+    assert dest.read_bytes() == source.read_bytes()
+
+
+def test_fast_copy_raises_real_errors(source, tmp_path, monkeypatch):
+    def broken(*args):
+        raise OSError(errno.EIO, "I/O error")
+
+    monkeypatch.setattr(os, "link", broken)
+    with pytest.raises(OSError, match="I/O error"):
+        fast_copy(source, tmp_path / "dest.mp4", hardlink=True)
+
+
+@pytest.fixture
+def manager(dataset):
+    rows = [(f"v{i}.mp4", 6, "M_6M_001", "achieved") for i in range(20)] + [("gone.mp4", 9, "L_9M_001", "achieved")]
+    csv_path, videos = dataset(rows, {f"v{i}.mp4": f"video {i}".encode() for i in range(20)})
+    return VideoDatasetManager(csv_path, videos)
+
+
+def test_transfer_retries_transient_errors(manager, tmp_path, monkeypatch):
+    attempts = []
+
+    def flaky_copy(source, dest, hardlink=False):
+        attempts.append(source.name)
+        if attempts.count(source.name) == 1:
+            raise OSError(errno.EIO, "I/O error")
+        return fast_copy(source, dest, hardlink)
+
+    monkeypatch.setattr(video_dataset_manager, "fast_copy", flaky_copy)
+    monkeypatch.setattr(video_dataset_manager, "RETRY_BACKOFF_SECONDS", 0)
+    (tmp_path / "copies").mkdir()
+
+    assert manager._transfer_file("v0.mp4", "h0.mp4", "copies", retries=1)[0] == "copied"
+    assert manager._transfer_file("v1.mp4", "h1.mp4", "copies", retries=0)[:2] == ("error", "[Errno 5] I/O error")
+    assert manager._transfer_file("gone.mp4", "h2.mp4", "copies", retries=3)[0] == "missing"
+    assert attempts == ["v0.mp4", "v0.mp4", "v1.mp4"]
+    assert sorted(path.name for path in (tmp_path / "copies").iterdir()) == ["h0.mp4"]
+
+
+def test_transfer_files_report(manager, tmp_path):
+    pairs = [(f"v{i}.mp4", f"h{i}.mp4") for i in range(20)] + [("gone.mp4", "h20.mp4")]
+
+    report = manager.transfer_files(pairs, "copies", workers=4)
+
+    assert (report["copied"], report["missing"], report["error"]) == (20, 1, 0)
+    assert report["bytes"] == sum(len(f"video {i}") for i in range(20))
+    assert sorted(report["transferred"]) == sorted(pairs[:20])
+    assert (tmp_path / "copies" / "h7.mp4").read_bytes() == b"video 7"
+
+
+def test_deidentify_files_in_parallel(manager, tmp_path):
+    mapping = manager.deidentify_files(dry_run=False, workers=4)
+
+    renamed = {path.name for path in (tmp_path / "videos").iterdir()}
+    assert renamed == {mapping[f"v{i}.mp4"] for i in range(20)}
+    assert json.loads((tmp_path / "video_mapping.json").read_text()) == mapping
+
+
+def test_failed_transfer_keeps_recovery_mapping(manager, tmp_path, monkeypatch):
+    transfer_file = manager._transfer_file
+    monkeypatch.setattr(
+        manager, "_transfer_file",
+        lambda original, *args: ("error", "disk full", 0) if original == "v3.mp4" else transfer_file(original, *args)
+    )
+
+    with pytest.raises(RuntimeError, match="1 of 21 files failed"):
+        manager.deidentify_files(output_directory="copies", dry_run=False, workers=4)
+
+    assert not (tmp_path / "video_mapping.json").exists()
+    recovered = json.loads((tmp_path / "video_mapping.json.partial").read_text())
+    assert sorted(recovered) == sorted(f"v{i}.mp4" for i in range(20) if i != 3)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
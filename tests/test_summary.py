@@ -0,0 +1,97 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from video_dataset_manager import VideoDatasetManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    rng = np.random.default_rng(7)
+    rows = 5000
+    milestones = [f"{prefix}_{age}M_{n:03d}" for prefix in "MLSx" for age in (6, 12, 24) for n in range(1, 4)]
+    ages = rng.integers(0, 40, rows).astype(float)
+    ages[rng.random(rows) < 0.02] = np.nan
+    df = pd.DataFrame({
+        "filename": [f"video_{i:05d}.mp4" for i in range(rows)],
+        "child_age": ages,
+        "milestone_id": rng.choice(milestones, rows),
+        "label": rng.choice(["achieved", "not_achieved", None], rows, p=[0.6, 0.35, 0.05]),
+    })
+    df.loc[rng.random(rows) < 0.01, "filename"] = None
+    csv_path = tmp_path / "metadata.csv"
+    df.to_csv(csv_path, index=False)
+    return VideoDatasetManager(str(csv_path))
+
+
+def baseline_summary(manager):
+    """The per-row apply / value_counts statistics the vectorized summary replaced."""
+    df = manager.df.copy()
+    df["age_group"] = df["child_age"].apply(manager.categorize_age_group)
+    df["domain"] = df["milestone_id"].apply(manager.extract_domain)
+    crosstab = pd.crosstab(df["age_group"], df["domain"])
+    return {
+        "total_videos": len(df),
+        "age_distribution": df["age_group"].value_counts().to_dict(),
+        "domain_distribution": df["domain"].value_counts().to_dict(),
+        "label_distribution": df["label"].value_counts().to_dict(),
+        "age_domain_crosstab": {domain: column.to_dict() for domain, column in crosstab.items()},
+        "top_milestones": list(df["milestone_id"].value_counts().head(10).items()),
+        "data_quality": {
+            "missing_filename": int(df["filename"].isna().sum()),
+            "missing_age": int(df["child_age"].isna().sum()),
+            "missing_milestone_id": int(df["milestone_id"].isna().sum()),
+        },
+    }
+
+
+def test_matches_baseline(manager):
+    summary = manager.compute_summary()
+    expected = baseline_summary(manager)
+
+    top_milestones = list(summary.pop("top_milestones").items())
+    assert top_milestones == expected.pop("top_milestones")
+    assert summary == expected
+    assert list(summary["age_distribution"]) == [label for _, label in manager.AGE_GROUPS]
+    assert summary["data_quality"]["missing_filename"] > 0 and summary["data_quality"]["missing_age"] > 0
+
+
+def test_vectorized_helpers_match_scalar_versions(manager):
+    ages = pd.Series([0, 6, 6.5, 12, 13, 30, 31, 99, np.nan, -1])
+    milestones = pd.Series(["M_6M_001", "l_9M_001", "S", "X_1", "", None])
+
+    assert manager.categorize_age_groups(ages).tolist() == [manager.categorize_age_group(age) for age in ages]
+    assert manager.extract_domains(milestones).tolist() == ["motor", "language", "social", "unknown", "unknown", "unknown"]
+
+
+def test_json_output(manager, tmp_path):
+    summary = manager.generate_summary_report("report.txt", output_format="json")
+
+    saved = json.loads((tmp_path / "report.json").read_text())
+    assert saved.pop("generated_at")
+    assert saved == summary
+    report = (tmp_path / "report.txt").read_text()
+    assert f"Total Videos: {summary['total_videos']}" in report and "TOP 10 MILESTONES" in report
+
+
+def test_parquet_output(manager, tmp_path):
+    pytest.importorskip("pyarrow")
+    summary = manager.generate_summary_report("report.txt", output_format="parquet")
+
+    table = pd.read_parquet(tmp_path / "report.parquet")
+    assert list(table.columns) == ["metric", "key", "sub_key", "count"]
+    rows = {(metric, key, sub_key): count for metric, key, sub_key, count in table.itertuples(index=False)}
+    assert rows[("total_videos", "", "")] == summary["total_videos"]
+    assert rows[("age_distribution", "0-6m", "")] == summary["age_distribution"]["0-6m"]
+    assert rows[("age_domain_crosstab", "motor", "7-12m")] == summary["age_domain_crosstab"]["motor"]["7-12m"]
+
+
+def test_unknown_output_format(manager):
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        manager.generate_summary_report(output_format="xml")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from conftest import SAMPLE_CSV
+from video_dataset_manager import VideoDatasetManager
+
+APPENDED = "video_026.mp4,9,L_9M_001,achieved\nvideo_027.mp4,,S_6M_001,\nvideo_028.mp4,40,M_6M_001,not_achieved\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "metadata.csv"
+    path.write_bytes(SAMPLE_CSV.read_bytes())
+    return path
+
+
+def full_summary(path):
+    summary = VideoDatasetManager(str(path)).compute_summary()
+    return summary, list(summary["top_milestones"].items())
+
+
+def assert_same(summary, path):
+    expected, top_milestones = full_summary(path)
+    assert summary == expected and list(summary["top_milestones"].items()) == top_milestones
+
+
+def test_first_update_matches_full_summary(csv_path, tmp_path):
+    manager = VideoDatasetManager(str(csv_path), load=False)
+
+    assert_same(manager.update_summary_state("state.json"), csv_path)
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["rows"] == 25 and state["offset"] == csv_path.stat().st_size
+
+
+def test_appended_rows_are_read_once(csv_path, monkeypatch):
+    manager = VideoDatasetManager(str(csv_path), load=False)
+    manager.update_summary_state("state.json")
+    with open(csv_path, "a") as f:
+        f.write(APPENDED)
+
+    offsets = []
+    read_appended = manager.store.read_appended
+    monkeypatch.setattr(
+        manager.store, "read_appended", lambda offset, block_bytes: offsets.append(offset) or read_appended(offset, block_bytes)
+    )
+    summary = manager.update_summary_state("state.json", block_bytes=40)
+
+    assert offsets == [len(SAMPLE_CSV.read_bytes())]
+    assert summary["total_videos"] == 28 and summary["data_quality"]["missing_age"] == 1
+    assert_same(summary, csv_path)
+
+    # Nothing new: nothing parsed
+    assert manager.update_summary_state("state.json") == summary
+
+
+@pytest.mark.parametrize("rewrite", [
+    lambda text: text.replace("video_025.mp4,36,S_36M_001,achieved", "video_025.mp4,12,M_12M_001,achieved"),
+    lambda text: text[: text.index("video_020")],
+])
+def test_rewritten_file_is_rebuilt(csv_path, rewrite, capsys):
+    manager = VideoDatasetManager(str(csv_path), load=False)
+    manager.update_summary_state("state.json")
+    csv_path.write_text(rewrite(csv_path.read_text()))
+
+    summary = manager.update_summary_state("state.json")
+
+    assert "rebuilding" in capsys.readouterr().out
+    assert_same(summary, csv_path)
+
+
+def test_config_change_is_rebuilt(csv_path, capsys):
+    VideoDatasetManager(str(csv_path), load=False).update_summary_state("state.json")
+    manager = VideoDatasetManager(str(csv_path), load=False)
+    manager.AGE_GROUPS = [(12, "0-12m"), (None, "13-36m")]
+
+    summary = manager.update_summary_state("state.json")
+
+    assert "different file or configuration" in capsys.readouterr().out
+    assert summary["age_distribution"] == {"0-12m": 12, "13-36m": 13}
+
+
+def test_unreadable_state_is_rebuilt(csv_path, tmp_path):
+    (tmp_path / "state.json").write_text("{not json")
+    manager = VideoDatasetManager(str(csv_path), load=False)
+
+    assert_same(manager.update_summary_state("state.json"), csv_path)
+
+
+def test_report_from_state(csv_path, tmp_path):
+    manager = VideoDatasetManager(str(csv_path), load=False)
+
+    summary = manager.generate_summary_report("report.txt", state_path="state.json")
+
+    assert (tmp_path / "state.json").exists() and "Total Videos: 25" in (tmp_path / "report.txt").read_text()
+    assert_same(summary, csv_path)
+
+
+def test_parquet_metadata_is_rejected(tmp_path):
+    manager = VideoDatasetManager(str(tmp_path / "metadata.parquet"), load=False)
+
+    with pytest.raises(ValueError, match="need CSV metadata"):
+        manager.update_summary_state("state.json")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
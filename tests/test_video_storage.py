@@ -0,0 +1,139 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import video_storage
+from conftest import SAMPLE_CSV
+from video_dataset_manager import VideoDatasetManager
+from video_storage import CsvStore, MetadataStore, ParquetStore, apply_filters, apply_schema, open_store
+
+FILTERS = [("child_age", ">", 6), ("child_age", "<=", 24), ("label", "in", ["achieved"])]
+
+
+def rows(df):
+    return df.astype(object).values.tolist()
+
+
+@pytest.fixture
+def metadata():
+    return pd.read_csv(SAMPLE_CSV)
+
+
+def test_store_must_implement_every_method():
+    class Incomplete(MetadataStore):
+        def read(self, columns=None, filters=None):
+            return pd.DataFrame()
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete("x.csv")
+    with pytest.raises(TypeError, match="abstract"):
+        MetadataStore("x.csv")
+
+
+def test_open_store_by_extension():
+    assert isinstance(open_store("a.csv"), CsvStore)
+    assert isinstance(open_store("a.PARQUET"), ParquetStore) and isinstance(open_store("a.pq"), ParquetStore)
+    # Anything pd.read_csv can parse was accepted before the Parquet backend existed
+    assert isinstance(open_store("a.txt"), CsvStore) and isinstance(open_store("metadata"), CsvStore)
+    with pytest.raises(ValueError, match="Unsupported metadata format"):
+        open_store("a.xlsx", strict=True)
+
+
+def test_apply_schema(metadata):
+    typed = apply_schema(metadata)
+
+    assert typed["milestone_id"].dtype == "category" and typed["label"].dtype == "category"
+    assert typed["child_age"].dtype == "Int8"
+    assert rows(typed) == rows(metadata)
+    # Fractional or out-of-range ages are left as they are, not rounded
+    assert apply_schema(pd.DataFrame({"child_age": [6.5, 12]}))["child_age"].tolist() == [6.5, 12]
+    assert apply_schema(pd.DataFrame({"child_age": [300]}))["child_age"].dtype == np.int64
+
+
+def test_apply_filters(metadata):
+    expected = metadata[(metadata["child_age"] > 6) & (metadata["child_age"] <= 24) & (metadata["label"] == "achieved")]
+
+    assert apply_filters(metadata, FILTERS).equals(expected)
+    assert apply_filters(metadata, None) is metadata
+    assert len(apply_filters(metadata, [("milestone_id", "not in", ["M_9M_001"])])) == len(metadata) - 2
+
+
+def test_csv_read_projection_and_filters(metadata):
+    store = CsvStore(str(SAMPLE_CSV))
+
+    assert store.read().equals(metadata)
+    assert list(store.read(columns=["filename"]).columns) == ["filename"]
+    filtered = store.read(columns=["filename"], filters=FILTERS)
+    assert filtered["filename"].tolist() == apply_filters(metadata, FILTERS)["filename"].tolist()
+    assert filtered.index.equals(pd.RangeIndex(len(filtered)))
+
+
+def test_csv_iter_batches(metadata):
+    batches = list(CsvStore(str(SAMPLE_CSV)).iter_batches(batch_size=10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert pd.concat(batches).equals(metadata)
+
+
+def test_parquet_round_trip(metadata, tmp_path):
+    pytest.importorskip("pyarrow")
+    store = ParquetStore(str(tmp_path / "metadata.parquet"))
+    store.write(metadata)
+
+    typed = store.read()
+    assert typed.dtypes.to_dict() == apply_schema(metadata).dtypes.to_dict()
+    assert rows(typed) == rows(metadata)
+
+    filtered = store.read(columns=["filename", "child_age"], filters=FILTERS)
+    assert filtered["filename"].tolist() == apply_filters(metadata, FILTERS)["filename"].tolist()
+    assert list(filtered.columns) == ["filename", "child_age"]
+
+    batches = list(store.iter_batches(batch_size=10))
+    assert [batch.index[0] for batch in batches] == [0, 10, 20]
+    assert pd.concat(batches)["filename"].tolist() == metadata["filename"].tolist()
+
+
+def test_manager_loads_parquet_by_age_group(metadata, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "metadata.parquet"
+    ParquetStore(str(path)).write(metadata)
+
+    manager = VideoDatasetManager(str(path), load=False)
+    manager.load_data(columns=["filename", "child_age"], age_group="7-12m")
+
+    assert manager.df["child_age"].tolist() == [age for age in metadata["child_age"] if 6 < age <= 12]
+    with pytest.raises(ValueError, match="Unknown age group"):
+        manager.age_group_filters("2-3y")
+
+
+def test_manager_reads_unknown_extensions_as_csv(metadata, tmp_path):
+    path = tmp_path / "metadata.txt"
+    path.write_bytes(SAMPLE_CSV.read_bytes())
+
+    manager = VideoDatasetManager(str(path))
+
+    assert manager.df["filename"].tolist() == metadata["filename"].tolist()
+
+
+def test_convert_cli_rejects_unknown_extensions(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["video_storage.py", str(SAMPLE_CSV), str(tmp_path / "metadata.xlsx")])
+
+    with pytest.raises(SystemExit):
+        video_storage.main()
+    assert not (tmp_path / "metadata.xlsx").exists()
+
+
+def test_convert_cli(metadata, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    destination = tmp_path / "metadata.parquet"
+    monkeypatch.setattr(sys, "argv", ["video_storage.py", str(SAMPLE_CSV), str(destination)])
+
+    video_storage.main()
+
+    assert ParquetStore(str(destination)).read()["filename"].tolist() == metadata["filename"].tolist()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,29 +1,258 @@
+import numpy as np
 import pandas as pd
+import argparse
+import errno
 import hashlib
+import hmac
 import os
+import secrets
 import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
 
+from video_storage import CsvStore, Filter, open_store
+
 # Load environment variables
 load_dotenv()
 
+# Parallel copy stage defaults (overridable per call)
+DEFAULT_COPY_WORKERS = int(os.getenv("VIDEO_COPY_WORKERS", "8"))
+DEFAULT_COPY_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.5
+PROGRESS_INTERVAL_SECONDS = 5.0
+
+DEFAULT_MANIFEST_PATH = "deidentification_manifest.sqlite"
+
+DEFAULT_SUMMARY_STATE_PATH = "summary_state.json"
+# Bump when the layout of the persisted summary state changes
+SUMMARY_STATE_FORMAT = 1
+
+# ioctl(FICLONE): copy-on-write clone on btrfs/XFS; from <linux/fs.h>
+_FICLONE = 0x40049409
+# errnos meaning "this fast path is not available here", not "the copy failed"
+_FAST_PATH_UNAVAILABLE = {
+    errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS,
+    errno.EBADF, errno.EPERM, errno.EMLINK, errno.EACCES
+}
+
+
+def _reflink(src, dst) -> bool:
+    """Clone src into dst without copying data; False if the filesystem can't."""
+    try:
+        import fcntl
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except (ImportError, OSError) as e:
+        if isinstance(e, OSError) and e.errno not in _FAST_PATH_UNAVAILABLE:
+            raise
+        return False
+
+
+def _copy_range(src, dst) -> bool:
+    """In-kernel copy with os.copy_file_range; False if unsupported before any byte moved."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(src.fileno(), dst.fileno(), 64 * 1024 * 1024)
+        except OSError as e:
+            if copied == 0 and e.errno in _FAST_PATH_UNAVAILABLE:
+                return False
+            raise
+        if n == 0:
+            return True
+        copied += n
+
+
+def fast_copy(source: Path, dest: Path, hardlink: bool = False) -> str:
+    """
+    Copy one file using the cheapest mechanism the filesystem supports.
+    
+    Tries, in order: os.link (only if hardlink=True, since the copy then shares
+    the original's inode), a reflink clone, os.copy_file_range, and finally a
+    buffered copy. File metadata is copied like shutil.copy2.
+    
+    Args:
+        source: File to copy
+        dest: Destination path (overwritten if it exists)
+        hardlink: Allow hard-linking when source and dest share a filesystem
+        
+    Returns:
+        The mechanism used: "hardlink", "reflink", "copy_file_range" or "copy"
+    """
+    if hardlink:
+        try:
+            if dest.exists():
+                dest.unlink()
+            os.link(source, dest)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _FAST_PATH_UNAVAILABLE:
+                raise
+    
+    with open(source, 'rb') as src, open(dest, 'wb') as dst:
+        if _reflink(src, dst):
+            method = "reflink"
+        elif _copy_range(src, dst):
+            method = "copy_file_range"
+        else:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+            method = "copy"
+    shutil.copystat(source, dest)
+    return method
+
+
+def hash_file_content(path: Path, salt: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Salted, deterministic hash of a file's content, read in chunks.
+    
+    Args:
+        path: File to hash
+        salt: Secret salt (HMAC key)
+        chunk_size: Bytes read per chunk; memory use is independent of file size
+        
+    Returns:
+        First 16 hex characters of HMAC-SHA256(salt, content)
+    """
+    digest = hmac.new(salt.encode('utf-8'), digestmod=hashlib.sha256)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+class _Progress:
+    """Prints files done, bytes and throughput at most every `interval` seconds."""
+    
+    def __init__(self, total: int, interval: float = PROGRESS_INTERVAL_SECONDS):
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+    
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+    
+    def update(self, nbytes: int):
+        self.done += 1
+        self.bytes += nbytes
+        now = time.perf_counter()
+        if now - self._last >= self.interval or self.done == self.total:
+            self._last = now
+            elapsed = now - self.start
+            throughput = self.bytes / elapsed / 1e6 if elapsed else 0.0
+            print(f"   📦 {self.done}/{self.total} files | {self.bytes / 1e6:.1f} MB | {throughput:.1f} MB/s")
+
+
+class DeidentificationManifest:
+    """
+    Persistent SQLite record of files de-identified by content hash.
+    
+    Stores original → hashed filename with the source size and mtime, so a
+    re-run can skip every file that has not changed since it was processed.
+    Entries are discarded if VIDEO_HASH_SALT changes, since every hashed name
+    would change with it.
+    """
+    
+    def __init__(self, path: str, salt: str):
+        """
+        Open (or create) the manifest.
+        
+        Args:
+            path: SQLite database file
+            salt: Current VIDEO_HASH_SALT
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                original_filename TEXT PRIMARY KEY,
+                hashed_filename TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                processed_at TEXT NOT NULL
+            );
+        """)
+        
+        # Keyed fingerprint: detects a salt change without storing anything derived from it alone
+        fingerprint = hmac.new(salt.encode('utf-8'), b"deidentification-manifest", hashlib.sha256).hexdigest()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'salt_fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            if row is not None:
+                print(f"⚠️ Warning: VIDEO_HASH_SALT changed; discarding {len(self)} manifest entries")
+            with self.conn:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('salt_fingerprint', ?)", (fingerprint,)
+                )
+    
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    
+    def entries(self) -> Dict[str, Tuple[str, int, int]]:
+        """All entries as original_filename -> (hashed_filename, size, mtime_ns)."""
+        return {
+            original: (hashed, size, mtime_ns)
+            for original, hashed, size, mtime_ns in self.conn.execute(
+                "SELECT original_filename, hashed_filename, size, mtime_ns FROM files"
+            )
+        }
+    
+    def record(self, rows: List[Tuple[str, str, int, int]]):
+        """Insert or update (original_filename, hashed_filename, size, mtime_ns) rows in one transaction."""
+        processed_at = datetime.now().isoformat()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files (original_filename, hashed_filename, size, mtime_ns, processed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [row + (processed_at,) for row in rows]
+            )
+    
+    def close(self):
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class VideoDatasetManager:
     """Manages annotated child development video datasets with privacy protection."""
     
-    def __init__(self, csv_path: str, video_directory: str = None):
+    # (upper bound in months, label); ages above the last bound fall in the last group
+    AGE_GROUPS = [(6, "0-6m"), (12, "7-12m"), (18, "13-18m"), (24, "19-24m"), (30, "25-30m"), (None, "31-36m")]
+    # First letter of milestone_id -> domain
+    DOMAIN_PREFIXES = {'M': 'motor', 'L': 'language', 'S': 'social'}
+    # Dimensions the summary counts are grouped by
+    SUMMARY_KEYS = ['age_group', 'domain', 'label', 'milestone_id']
+    
+    def __init__(self, csv_path: str, video_directory: str = None, load: bool = True):
         """
         Initialize the dataset manager.
         
         Args:
-            csv_path: Path to CSV file with video metadata
+            csv_path: Path to the video metadata (.csv, or .parquet for columnar storage)
             video_directory: Directory containing video files (optional)
+            load: Read the whole table into memory now; pass False when only
+                  using the streaming methods (e.g. deidentify_stream) or to
+                  call load_data with a projection or filter
         """
         self.csv_path = csv_path
+        self.store = open_store(csv_path)
         self.video_directory = video_directory
         self.df = None
         self.mapping_file = "video_mapping.json"
@@ -37,21 +266,54 @@ class VideoDatasetManager:
                 "Example: VIDEO_HASH_SALT=your-random-secret-salt-here"
             )
         
-        self.load_data()
+        if load:
+            self.load_data()
     
-    def load_data(self):
-        """Load video metadata from CSV file."""
+    def load_data(self, columns: Optional[List[str]] = None, age_group: Optional[str] = None,
+                  filters: Optional[List[Filter]] = None):
+        """
+        Load video metadata from the storage backend.
+        
+        With Parquet, the projection and filters are pushed down to the reader,
+        so unneeded columns and row groups are never decoded.
+        
+        Args:
+            columns: Only load these columns (None for all)
+            age_group: Only load rows in this age group, e.g. "7-12m"
+            filters: Extra ANDed (column, op, value) row filters
+        """
+        filters = list(filters or [])
+        if age_group is not None:
+            filters.extend(self.age_group_filters(age_group))
         try:
-            self.df = pd.read_csv(self.csv_path)
+            self.df = self.store.read(columns=columns, filters=filters)
             print(f"✅ Loaded {len(self.df)} video records from {self.csv_path}")
             print(f"\nColumns: {list(self.df.columns)}")
         except FileNotFoundError:
-            print(f"❌ Error: CSV file not found at {self.csv_path}")
+            print(f"❌ Error: Metadata file not found at {self.csv_path}")
             raise
         except Exception as e:
-            print(f"❌ Error loading CSV: {e}")
+            print(f"❌ Error loading metadata: {e}")
             raise
     
+    def age_group_filters(self, age_group: str) -> List[Filter]:
+        """
+        Row filters selecting one age group, matching categorize_age_group.
+        
+        Rows with a missing age are not selected (categorize_age_group would
+        put them in the last group).
+        
+        Raises:
+            ValueError: If age_group is not one of AGE_GROUPS
+        """
+        lower = None
+        for upper, label in self.AGE_GROUPS:
+            if label == age_group:
+                filters = [] if lower is None else [('child_age', '>', lower)]
+                return filters + ([] if upper is None else [('child_age', '<=', upper)])
+            lower = upper
+        raise ValueError(f"Unknown age group: {age_group}")
+    
     def generate_hash(self, filename: str, child_age: int, milestone_id: str) -> str:
         """
         Generate a salted unique hash for de-identification.
@@ -71,21 +333,258 @@ class VideoDatasetManager:
         hash_object = hashlib.sha256(unique_string.encode('utf-8'))
         return hash_object.hexdigest()[:16]  # Use first 16 characters
     
-    def deidentify_files(self, output_directory: str = None, dry_run: bool = True) -> Dict[str, str]:
+    def generate_hashes(self, filenames: pd.Series, child_ages: pd.Series, milestone_ids: pd.Series) -> pd.Series:
+        """
+        Vectorized generate_hash for a whole column of rows.
+        
+        The salted strings are built with column-wise string concatenation and
+        one timestamp per call; only the SHA-256 itself runs per row. Each row
+        also gets a random nonce, so rows are still salted individually and
+        repeated rows within one call get distinct names, as with per-row
+        timestamps in generate_hash.
+        
+        Args:
+            filenames: Original filenames
+            child_ages: Children's ages in months
+            milestone_ids: Milestone identifiers
+            
+        Returns:
+            Series of 16-character hash strings aligned with the inputs
+        """
+        timestamp = datetime.now().isoformat()
+        nonces = os.urandom(8 * len(filenames)).hex()
+        unique_strings = (
+            f"{self.salt}_" + filenames.astype(str) + "_" + child_ages.astype(str)
+            + "_" + milestone_ids.astype(str) + f"_{timestamp}_"
+            + pd.Series([nonces[i:i + 16] for i in range(0, len(nonces), 16)], index=filenames.index, dtype=str)
+        )
+        sha256 = hashlib.sha256
+        return pd.Series(
+            [sha256(value.encode('utf-8')).hexdigest()[:16] for value in unique_strings],
+            index=filenames.index,
+            dtype=object
+        )
+    
+    def hashed_filenames(self, filenames: pd.Series, child_ages: pd.Series, milestone_ids: pd.Series) -> pd.Series:
+        """Hashed filenames for a column of rows, preserving each file's extension."""
+        extensions = pd.Series([Path(name).suffix for name in filenames.astype(str)], index=filenames.index, dtype=object)
+        return self.generate_hashes(filenames, child_ages, milestone_ids) + extensions
+    
+    def _transfer_file(
+        self,
+        original_filename: str,
+        hashed_filename: str,
+        output_directory: Optional[str],
+        hardlink: bool = False,
+        retries: int = 0
+    ) -> Tuple[str, str, int]:
+        """
+        Copy (to output_directory) or rename (in place) one video file, retrying transient errors.
+        
+        A copy is written under a name private to this call and then renamed
+        over dest_path, so dest_path only ever holds a complete file and a
+        failed copy never removes a file some other transfer wrote there.
+        
+        Returns:
+            Tuple of (status, message, bytes); status is "copied", "renamed", "missing" or "error"
+        """
+        source_path = Path(self.video_directory) / original_filename
+        dest_path = Path(output_directory or self.video_directory) / hashed_filename
+        temp_path = dest_path.with_name(f".{hashed_filename}.{secrets.token_hex(4)}.partial")
+        
+        for attempt in range(retries + 1):
+            try:
+                size = source_path.stat().st_size
+                if output_directory:
+                    try:
+                        method = fast_copy(source_path, temp_path, hardlink=hardlink)
+                        os.replace(temp_path, dest_path)
+                    finally:
+                        # Already gone after the replace, unless dest_path was a hard link to the same file
+                        temp_path.unlink(missing_ok=True)
+                    return "copied", f"Copied to {dest_path} ({method})", size
+                source_path.rename(dest_path)
+                return "renamed", f"Renamed to {dest_path}", size
+            except FileNotFoundError:
+                # Nothing to retry: the source does not exist
+                if not source_path.exists():
+                    return "missing", f"File not found at {source_path}", 0
+                error = f"Destination directory missing for {dest_path}"
+            except Exception as e:
+                error = str(e)
+            if attempt < retries:
+                time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        return "error", error, 0
+    
+    def _settle_duplicate(
+        self,
+        original_filename: str,
+        hashed_filename: str,
+        output_directory: Optional[str]
+    ) -> Tuple[str, str, int]:
+        """
+        Finish a file whose hashed name was already transferred for another file with the same content.
+        
+        A copy needs nothing more. In place, the file is renamed over the
+        existing one, which holds identical content, so its original name is gone.
+        
+        Returns:
+            Tuple of (status, message, bytes) as in _transfer_file; status is
+            "duplicate", "renamed", "missing" or "error"
+        """
+        dest_path = Path(output_directory or self.video_directory) / hashed_filename
+        if output_directory:
+            return "duplicate", f"Same content as {dest_path}", 0
+        source_path = Path(self.video_directory) / original_filename
+        try:
+            size = source_path.stat().st_size
+            os.replace(source_path, dest_path)
+        except FileNotFoundError:
+            return "missing", f"File not found at {source_path}", 0
+        except OSError as e:
+            return "error", str(e), 0
+        return "renamed", f"Renamed to {dest_path} (same content)", size
+    
+    def transfer_files(
+        self,
+        pairs: List[Tuple[str, str]],
+        output_directory: str = None,
+        workers: int = DEFAULT_COPY_WORKERS,
+        retries: int = DEFAULT_COPY_RETRIES,
+        hardlink: bool = False,
+        progress_interval: float = PROGRESS_INTERVAL_SECONDS
+    ) -> Dict:
+        """
+        Copy or rename many video files on a thread pool.
+        
+        Copies are I/O bound, so threads overlap them well; each file is
+        retried up to `retries` times with exponential backoff. Progress and
+        throughput are printed every `progress_interval` seconds.
+        
+        Each destination is written by one task only. Pairs sharing a hashed
+        filename (content-addressed names of identical files) are settled with
+        _settle_duplicate after the first of them transferred.
+        
+        Args:
+            pairs: (original_filename, hashed_filename) pairs
+            output_directory: Directory to copy files to (if None, renames in place)
+            workers: Number of concurrent copy workers
+            retries: Extra attempts per file after a failure
+            hardlink: Allow os.link instead of copying when on the same filesystem
+            progress_interval: Seconds between progress lines
+            
+        Returns:
+            Report with counts per status, bytes, seconds, the transferred pairs
+            and a list of (original_filename, error) failures
+        """
+        if output_directory:
+            Path(output_directory).mkdir(parents=True, exist_ok=True)
+        
+        report = {
+            "copied": 0, "renamed": 0, "duplicate": 0, "missing": 0, "error": 0, "bytes": 0, "seconds": 0.0,
+            "transferred": [], "failures": []
+        }
+        if not pairs:
+            return report
+        
+        first_by_dest = {}
+        duplicates = []
+        for original, hashed in pairs:
+            if hashed in first_by_dest:
+                duplicates.append((original, hashed))
+            else:
+                first_by_dest[hashed] = original
+        
+        progress = _Progress(len(pairs), progress_interval)
+        
+        def record(original: str, hashed: str, status: str, message: str, size: int):
+            report[status] += 1
+            report["bytes"] += size
+            if status == "error":
+                report["failures"].append((original, message))
+                print(f"   ❌ Error: {original}: {message}")
+            elif status == "missing":
+                print(f"   ⚠️ Warning: {message}")
+            else:
+                report["transferred"].append((original, hashed))
+            progress.update(size)
+        
+        transferred = set()
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="video-copy") as pool:
+            futures = {
+                pool.submit(self._transfer_file, original, hashed, output_directory, hardlink, retries): (original, hashed)
+                for hashed, original in first_by_dest.items()
+            }
+            for future in as_completed(futures):
+                original, hashed = futures[future]
+                status, message, size = future.result()
+                if status in ("copied", "renamed"):
+                    transferred.add(hashed)
+                record(original, hashed, status, message, size)
+        
+        for original, hashed in duplicates:
+            if hashed not in transferred:
+                record(original, hashed, "error", f"{first_by_dest[hashed]}, with the same hashed name, was not transferred", 0)
+            elif original == first_by_dest[hashed]:
+                # The same file listed twice
+                record(original, hashed, "duplicate", "", 0)
+            else:
+                record(original, hashed, *self._settle_duplicate(original, hashed, output_directory))
+        
+        report["seconds"] = progress.elapsed
+        return report
+    
+    def _save_recovery_mapping(self, transferred: List[Tuple[str, str]]) -> str:
+        """After a failed transfer, record which files were already moved so they can be traced back."""
+        recovery_path = f"{self.mapping_file}.partial"
+        with open(recovery_path, 'w') as f:
+            json.dump(dict(transferred), f, indent=2)
+        return recovery_path
+    
+    def deidentify_files(
+        self,
+        output_directory: str = None,
+        dry_run: bool = True,
+        workers: int = DEFAULT_COPY_WORKERS,
+        retries: int = DEFAULT_COPY_RETRIES,
+        hardlink: bool = False,
+        deterministic: bool = False,
+        manifest_path: str = DEFAULT_MANIFEST_PATH
+    ) -> Dict[str, str]:
         """
         De-identify video files by renaming them to unique salted hashes.
         
+        Files are copied or renamed by a worker pool after all hashes are
+        generated. The mapping file is only written once every transfer succeeded.
+        
         Args:
             output_directory: Directory to save de-identified files (if None, renames in place)
             dry_run: If True, only shows what would be renamed without actually doing it
+            workers: Number of concurrent copy workers
+            retries: Extra attempts per file after a failure
+            hardlink: Allow os.link instead of copying when on the same filesystem
+            deterministic: Name files by a salted hash of their content instead of a
+                           timestamped hash, and skip files recorded as unchanged in
+                           the manifest (requires video_directory)
+            manifest_path: SQLite manifest used when deterministic=True
             
         Returns:
             Dictionary mapping original filenames to hashed filenames
+            
+        Raises:
+            RuntimeError: If any file could not be copied or renamed; the files
+                          already moved are listed in '<mapping_file>.partial'
         """
+        if deterministic:
+            return self._deidentify_content_addressed(
+                output_directory, dry_run, workers, retries, hardlink, manifest_path
+            )
+        
         if self.video_directory is None:
             print("⚠️ Warning: No video directory specified. Only generating hash mappings.")
         
         mapping = {}
+        pairs = []
         
         print(f"\n{'🔍 DRY RUN - ' if dry_run else '🔒 '}De-identifying files with salted SHA-256...")
         print(f"🔐 Using SALT from environment variable")
@@ -110,29 +609,20 @@ class VideoDatasetManager:
             
             print(f"{idx + 1}. {original_filename} → {hashed_filename}")
             
-            # Actually rename files if not dry run and directory exists
-            if not dry_run and self.video_directory:
-                source_path = Path(self.video_directory) / original_filename
-                
-                if output_directory:
-                    dest_dir = Path(output_directory)
-                    dest_dir.mkdir(parents=True, exist_ok=True)
-                    dest_path = dest_dir / hashed_filename
-                else:
-                    dest_path = Path(self.video_directory) / hashed_filename
-                
-                if source_path.exists():
-                    try:
-                        if output_directory:
-                            shutil.copy2(source_path, dest_path)
-                            print(f"   ✅ Copied to {dest_path}")
-                        else:
-                            source_path.rename(dest_path)
-                            print(f"   ✅ Renamed to {dest_path}")
-                    except Exception as e:
-                        print(f"   ❌ Error: {e}")
-                else:
-                    print(f"   ⚠️ Warning: File not found at {source_path}")
+            pairs.append((original_filename, hashed_filename))
+        
+        # Actually copy or rename files if not dry run and directory exists
+        if not dry_run and self.video_directory:
+            print(f"\n🚚 Transferring {len(pairs)} files with {workers} workers...")
+            report = self.transfer_files(pairs, output_directory, workers=workers, retries=retries, hardlink=hardlink)
+            if report["failures"]:
+                recovery_path = self._save_recovery_mapping(report["transferred"])
+                raise RuntimeError(
+                    f"{len(report['failures'])} of {len(pairs)} files failed to transfer; "
+                    f"mapping not written. Files already transferred are listed in {recovery_path}"
+                )
+            print(f"✅ {report['copied']} copied, {report['renamed']} renamed, "
+                  f"{report['missing']} missing in {report['seconds']:.1f}s")
         
         # Save mapping to JSON file
         mapping_path = Path(self.mapping_file)
@@ -145,6 +635,289 @@ class VideoDatasetManager:
         
         return mapping
     
+    def _hash_file(
+        self,
+        original_filename: str,
+        known_hashed: Optional[str],
+        retries: int
+    ) -> Tuple[str, Optional[str], int, int, str]:
+        """
+        Content-hash one file, unless its hashed name is already known.
+        
+        Returns:
+            Tuple of (status, hashed_filename, size, mtime_ns, message); status is
+            "hashed", "missing" or "error"
+        """
+        source_path = Path(self.video_directory) / original_filename
+        try:
+            stat = source_path.stat()
+        except FileNotFoundError:
+            return "missing", None, 0, 0, f"File not found at {source_path}"
+        
+        hashed_filename = known_hashed
+        error = ""
+        for attempt in range(retries + 1):
+            if hashed_filename is not None:
+                break
+            try:
+                hashed_filename = hash_file_content(source_path, self.salt) + Path(original_filename).suffix
+            except OSError as e:
+                error = str(e)
+                if attempt < retries:
+                    time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        if hashed_filename is None:
+            return "error", None, 0, 0, error
+        return "hashed", hashed_filename, stat.st_size, stat.st_mtime_ns, ""
+    
+    def _deidentify_content_addressed(
+        self,
+        output_directory: Optional[str],
+        dry_run: bool,
+        workers: int,
+        retries: int,
+        hardlink: bool,
+        manifest_path: str
+    ) -> Dict[str, str]:
+        """
+        deidentify_files(deterministic=True): content-addressed names and a resumable manifest.
+        
+        A file whose size and mtime match its manifest entry and whose
+        de-identified copy exists is skipped without being read. A file that is
+        unchanged but whose copy is gone is copied again without re-hashing.
+        Everything else is hashed on the worker pool, then transferred with
+        transfer_files, which writes each content hash's file once however many
+        identical files share it.
+        """
+        if not self.video_directory:
+            raise ValueError("deterministic=True hashes file contents and requires a video_directory")
+        
+        print(f"\n{'🔍 DRY RUN - ' if dry_run else '🔒 '}De-identifying files by salted content hash...")
+        print("🔐 Using SALT from environment variable")
+        print("-" * 60)
+        
+        dest_dir = Path(output_directory or self.video_directory)
+        if output_directory and not dry_run:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+        
+        hashed_by_index = {}
+        failures = []
+        counts = {"unchanged": 0, "hashed": 0, "copied": 0, "renamed": 0, "duplicate": 0, "missing": 0, "error": 0}
+        
+        with DeidentificationManifest(manifest_path, self.salt) as manifest:
+            known = manifest.entries()
+            todo = []
+            for idx, original_filename in zip(self.df.index, self.df['filename']):
+                entry = known.get(original_filename)
+                if entry is not None:
+                    hashed_filename, size, mtime_ns = entry
+                    try:
+                        stat = (Path(self.video_directory) / original_filename).stat()
+                        unchanged = stat.st_size == size and stat.st_mtime_ns == mtime_ns
+                    except FileNotFoundError:
+                        # Renamed in place by an earlier run
+                        stat, unchanged = None, True
+                    if unchanged and (dest_dir / hashed_filename).exists():
+                        hashed_by_index[idx] = hashed_filename
+                        counts["unchanged"] += 1
+                        continue
+                    todo.append((idx, original_filename, hashed_filename if unchanged and stat else None))
+                else:
+                    todo.append((idx, original_filename, None))
+            
+            print(f"♻️  {counts['unchanged']} unchanged files skipped; processing {len(todo)} with {workers} workers...")
+            
+            hashed = {}
+            progress = _Progress(len(todo))
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="video-hash") as pool:
+                futures = {
+                    pool.submit(self._hash_file, original_filename, known_hashed, retries): (idx, original_filename)
+                    for idx, original_filename, known_hashed in todo
+                }
+                for future in as_completed(futures):
+                    idx, original_filename = futures[future]
+                    status, hashed_filename, size, mtime_ns, message = future.result()
+                    if status == "error":
+                        counts["error"] += 1
+                        failures.append((original_filename, message))
+                        print(f"   ❌ Error: {original_filename}: {message}")
+                    elif status == "missing":
+                        counts["missing"] += 1
+                        print(f"   ⚠️ Warning: {message}")
+                    else:
+                        hashed[idx] = (original_filename, hashed_filename, size, mtime_ns)
+                    progress.update(size)
+            
+            if dry_run:
+                counts["hashed"] = len(hashed)
+                hashed_by_index.update((idx, entry[1]) for idx, entry in hashed.items())
+            else:
+                # Sorted by row so the first row with a given content is the one copied or renamed
+                pairs = [(hashed[idx][0], hashed[idx][1]) for idx in sorted(hashed)]
+                report = self.transfer_files(pairs, output_directory, workers=workers, retries=retries, hardlink=hardlink)
+                for status in ("copied", "renamed", "duplicate", "missing", "error"):
+                    counts[status] += report[status]
+                failures.extend(report["failures"])
+                done = set(report["transferred"])
+                hashed_by_index.update(
+                    (idx, entry[1]) for idx, entry in hashed.items() if (entry[0], entry[1]) in done
+                )
+                
+                # Record successes even if other files failed, so the next run resumes from here
+                manifest.record([entry for entry in hashed.values() if (entry[0], entry[1]) in done])
+        
+        self.df['hashed_filename'] = pd.Series(hashed_by_index, dtype=object)
+        mapping = {
+            original_filename: hashed_by_index[idx]
+            for idx, original_filename in zip(self.df.index, self.df['filename'])
+            if idx in hashed_by_index
+        }
+        
+        if failures:
+            recovery_path = self._save_recovery_mapping(list(mapping.items()))
+            raise RuntimeError(
+                f"{len(failures)} files failed; mapping not written. Completed files are recorded in "
+                f"{manifest_path} and listed in {recovery_path}; re-run to retry the rest"
+            )
+        
+        with open(self.mapping_file, 'w') as f:
+            json.dump(mapping, f, indent=2)
+        
+        print(f"\n✅ Mapping saved to {self.mapping_file}")
+        print(f"📊 {counts['unchanged']} unchanged, {counts['copied']} copied, {counts['renamed']} renamed, "
+              f"{counts['duplicate']} duplicates, {counts['hashed']} hashed (dry run), {counts['missing']} missing "
+              f"in {progress.elapsed:.1f}s")
+        print("🔐 Security: Salted content hashing (HMAC-SHA256) enabled")
+        
+        return mapping
+    
+    def iter_chunks(self, chunksize: int = 50_000) -> Iterator[pd.DataFrame]:
+        """
+        Read the metadata lazily, chunksize rows at a time.
+        
+        Args:
+            chunksize: Rows per chunk; bounds memory use regardless of file size
+            
+        Yields:
+            DataFrames with a RangeIndex continuing across chunks
+        """
+        if not os.path.exists(self.csv_path):
+            print(f"❌ Error: Metadata file not found at {self.csv_path}")
+            raise FileNotFoundError(self.csv_path)
+        yield from self.store.iter_batches(batch_size=chunksize)
+    
+    def deidentify_stream(
+        self,
+        output_csv: str = "deidentified_dataset.csv",
+        output_directory: str = None,
+        dry_run: bool = True,
+        chunksize: int = 50_000,
+        workers: int = DEFAULT_COPY_WORKERS,
+        retries: int = DEFAULT_COPY_RETRIES,
+        hardlink: bool = False
+    ) -> Dict[str, int]:
+        """
+        Streaming version of deidentify_files + save_deidentified_csv for large exports.
+        
+        Reads the CSV in chunks, hashes each chunk column-wise and appends the
+        rows to the output CSV and mapping file as it goes, so memory stays
+        bounded by chunksize rather than the dataset size. Progress is printed
+        once per chunk instead of once per row. Both outputs are written to
+        '.partial' files and only renamed into place once every chunk succeeded.
+        
+        Args:
+            output_csv: Path of the de-identified CSV to write
+            output_directory: Directory to copy de-identified files to (if None, renames in place)
+            dry_run: If True, hashes and writes outputs but leaves video files untouched
+            chunksize: Rows read per chunk
+            workers: Number of concurrent copy workers per chunk
+            retries: Extra attempts per file after a failure
+            hardlink: Allow os.link instead of copying when on the same filesystem
+            
+        Returns:
+            Dictionary of counts: rows, chunks, and copied/renamed/missing/error file operations
+            
+        Raises:
+            RuntimeError: If any file could not be copied or renamed. Processing stops
+                          after that chunk, no outputs are published, and the mapping
+                          of every row hashed so far is kept in '<mapping_file>.partial'
+        """
+        if self.video_directory is None:
+            print("⚠️ Warning: No video directory specified. Only generating hash mappings.")
+        
+        print(f"\n{'🔍 DRY RUN - ' if dry_run else '🔒 '}Streaming de-identification in chunks of {chunksize} rows...")
+        print("🔐 Using SALT from environment variable")
+        print("-" * 60)
+        
+        counts = {"rows": 0, "chunks": 0, "copied": 0, "renamed": 0, "missing": 0, "error": 0}
+        csv_partial = f"{output_csv}.partial"
+        mapping_partial = f"{self.mapping_file}.partial"
+        keep_mapping_partial = False
+        
+        try:
+            with open(csv_partial, 'w', newline='', encoding='utf-8') as csv_file, \
+                    open(mapping_partial, 'w', encoding='utf-8') as mapping_file:
+                mapping_file.write("{")
+                first_entry = True
+                
+                for chunk in self.iter_chunks(chunksize):
+                    hashed = self.hashed_filenames(chunk['filename'], chunk['child_age'], chunk['milestone_id'])
+                    
+                    # Same layout as save_deidentified_csv
+                    out = chunk.copy()
+                    out['hashed_filename'] = hashed
+                    out['original_filename'] = out['filename']
+                    out['filename'] = hashed
+                    out.to_csv(csv_file, index=False, header=counts["chunks"] == 0)
+                    
+                    # Same layout as json.dump(mapping, indent=2); a filename repeated
+                    # in the CSV appears twice and the last entry wins when loaded
+                    entries = [
+                        f'\n  {json.dumps(str(original))}: {json.dumps(new)}'
+                        for original, new in zip(chunk['filename'], hashed)
+                    ]
+                    if entries:
+                        mapping_file.write(("" if first_entry else ",") + ",".join(entries))
+                        first_entry = False
+                    
+                    if not dry_run and self.video_directory:
+                        report = self.transfer_files(
+                            list(zip(chunk['filename'], hashed)), output_directory,
+                            workers=workers, retries=retries, hardlink=hardlink
+                        )
+                        for status in ("copied", "renamed", "missing", "error"):
+                            counts[status] += report[status]
+                    
+                    counts["rows"] += len(chunk)
+                    counts["chunks"] += 1
+                    print(f"   ✅ Chunk {counts['chunks']}: {counts['rows']} rows processed")
+                    if counts["error"]:
+                        break
+                
+                mapping_file.write("\n}" if not first_entry else "}")
+            
+            if counts["error"]:
+                # Files may already have been renamed; keep the mapping so they can be traced back
+                keep_mapping_partial = True
+                raise RuntimeError(
+                    f"{counts['error']} files failed to transfer; outputs not written. "
+                    f"Mapping of the rows processed so far is in {mapping_partial}"
+                )
+            
+            os.replace(csv_partial, output_csv)
+            os.replace(mapping_partial, self.mapping_file)
+        finally:
+            for partial in (csv_partial, mapping_partial):
+                if os.path.exists(partial) and not (partial == mapping_partial and keep_mapping_partial):
+                    os.remove(partial)
+        
+        print(f"\n✅ De-identified dataset saved to {output_csv}")
+        print(f"✅ Mapping saved to {self.mapping_file}")
+        print(f"📊 Total files processed: {counts['rows']}")
+        if counts["missing"]:
+            print(f"⚠️ Files not found: {counts['missing']}")
+        
+        return counts
+    
     def categorize_age_group(self, age_months: int) -> str:
         """
         Categorize age into groups.
@@ -155,18 +928,9 @@ class VideoDatasetManager:
         Returns:
             Age group label
         """
-        if age_months <= 6:
-            return "0-6m"
-        elif age_months <= 12:
-            return "7-12m"
-        elif age_months <= 18:
-            return "13-18m"
-        elif age_months <= 24:
-            return "19-24m"
-        elif age_months <= 30:
-            return "25-30m"
-        else:
-            return "31-36m"
+        for upper_bound, label in self.AGE_GROUPS:
+            if upper_bound is None or age_months <= upper_bound:
+                return label
     
     def extract_domain(self, milestone_id: str) -> str:
         """
@@ -183,44 +947,275 @@ class VideoDatasetManager:
             return "unknown"
         
         prefix = milestone_id[0].upper()
-        domain_map = {
-            'M': 'motor',
-            'L': 'language',
-            'S': 'social'
-        }
-        return domain_map.get(prefix, 'unknown')
+        return self.DOMAIN_PREFIXES.get(prefix, 'unknown')
     
-    def generate_summary_report(self, output_file: str = "dataset_summary_report.txt") -> Dict:
+    def categorize_age_groups(self, ages: pd.Series) -> pd.Series:
         """
-        Generate a comprehensive summary report of the dataset.
+        Vectorized categorize_age_group for a whole column.
+        
+        Returns:
+            Ordered categorical Series, so age groups sort youngest first
+        """
+        bounds = [-float("inf")] + [upper for upper, _ in self.AGE_GROUPS[:-1]] + [float("inf")]
+        labels = [label for _, label in self.AGE_GROUPS]
+        groups = pd.cut(pd.to_numeric(ages, errors='coerce'), bins=bounds, labels=labels, right=True, ordered=True)
+        # categorize_age_group puts anything that fails every comparison (e.g. NaN) in the last group
+        return groups.fillna(labels[-1])
+    
+    def extract_domains(self, milestone_ids: pd.Series) -> pd.Series:
+        """
+        Vectorized extract_domain for a whole column.
+        
+        Milestone IDs repeat heavily, so the prefix map runs once per distinct
+        ID and the result is broadcast back through the factorized codes.
+        """
+        codes, uniques = pd.factorize(milestone_ids)
+        # Code -1 (missing ID) indexes the trailing 'unknown'
+        domains = np.array([self.extract_domain(str(milestone_id)) for milestone_id in uniques] + ['unknown'], dtype=object)
+        return pd.Series(domains[codes], index=milestone_ids.index, dtype=object)
+    
+    @staticmethod
+    def _ranked_counts(grouped: pd.DataFrame, level: str) -> pd.Series:
+        """
+        Roll grouped counts up to one level, most frequent first.
+        
+        Ties keep first-appearance order in the CSV, matching value_counts().
+        """
+        rolled = grouped.groupby(level=level, observed=True).agg(count=('count', 'sum'), first_row=('first_row', 'min'))
+        rolled = rolled.sort_values(['count', 'first_row'], ascending=[False, True], kind='stable')
+        return rolled['count']
+    
+    def _group_counts(self, age_groups: pd.Series, domains: pd.Series, df: pd.DataFrame, first_row: int = 0) -> pd.DataFrame:
+        """Group rows by SUMMARY_KEYS into (count, first_row), the table every distribution is rolled up from."""
+        labels = df['label'] if 'label' in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+        # Categorical keys let the groupby work on integer codes instead of hashing strings
+        frame = pd.DataFrame({
+            'age_group': age_groups,
+            'domain': domains.astype('category'),
+            'label': labels.astype('category'),
+            'milestone_id': df['milestone_id'].astype('category'),
+            'first_row': np.arange(first_row, first_row + len(df)),
+        })
+        return frame.groupby(self.SUMMARY_KEYS, observed=True, dropna=False, sort=False).agg(
+            count=('first_row', 'size'), first_row=('first_row', 'min')
+        )
+    
+    def aggregate_rows(self, df: pd.DataFrame, first_row: int = 0) -> pd.DataFrame:
+        """
+        Grouped counts for a batch of rows.
         
         Args:
-            output_file: Path to save the summary report
+            df: Metadata rows
+            first_row: Dataset row number of df's first row (keeps tie order across batches)
             
+        Returns:
+            DataFrame indexed by SUMMARY_KEYS with 'count' and 'first_row' columns
+        """
+        return self._group_counts(
+            self.categorize_age_groups(df['child_age']), self.extract_domains(df['milestone_id']), df, first_row
+        )
+    
+    @staticmethod
+    def merge_counts(*grouped: pd.DataFrame) -> pd.DataFrame:
+        """Combine grouped counts from several batches into one table."""
+        combined = pd.concat(grouped)
+        return combined.groupby(level=VideoDatasetManager.SUMMARY_KEYS, dropna=False, sort=False).agg(
+            count=('count', 'sum'), first_row=('first_row', 'min')
+        )
+    
+    @staticmethod
+    def data_quality_counts(df: pd.DataFrame) -> Dict[str, int]:
+        return {
+            'missing_filename': int(df['filename'].isna().sum()),
+            'missing_age': int(df['child_age'].isna().sum()),
+            'missing_milestone_id': int(df['milestone_id'].isna().sum())
+        }
+    
+    def summarize_counts(self, grouped: pd.DataFrame, total_videos: int, data_quality: Dict[str, int]) -> Dict:
+        """
+        Roll grouped counts up into the summary statistics.
+        
+        The per-dimension distributions and the age × domain cross-tabulation
+        are roll-ups of the small grouped table, not passes over the rows.
+        """
+        # Youngest first, whichever order the groups were seen in
+        age_order = [label for _, label in self.AGE_GROUPS]
+        age_distribution = grouped.groupby(level='age_group', observed=True)['count'].sum()
+        age_distribution = age_distribution.reindex([age for age in age_order if age in age_distribution.index])
+        domain_distribution = self._ranked_counts(grouped, 'domain')
+        label_distribution = self._ranked_counts(grouped, 'label')
+        label_distribution = label_distribution[label_distribution.index.notna()]
+        milestone_distribution = self._ranked_counts(grouped, 'milestone_id')
+        milestone_distribution = milestone_distribution[milestone_distribution.index.notna()]
+        
+        age_domain_crosstab = (
+            grouped.groupby(level=['age_group', 'domain'], observed=True)['count'].sum()
+            .unstack('domain', fill_value=0)
+            .sort_index(axis=1)
+        )
+        age_domain_crosstab = age_domain_crosstab.reindex(age_distribution.index)
+        
+        return {
+            'total_videos': total_videos,
+            'age_distribution': {str(k): int(v) for k, v in age_distribution.items()},
+            'domain_distribution': {k: int(v) for k, v in domain_distribution.items()},
+            'label_distribution': {k: int(v) for k, v in label_distribution.items()},
+            'age_domain_crosstab': {
+                domain: {str(age): int(count) for age, count in column.items()}
+                for domain, column in age_domain_crosstab.items()
+            },
+            'top_milestones': {k: int(v) for k, v in milestone_distribution.head(10).items()},
+            'data_quality': data_quality
+        }
+    
+    def compute_summary(self) -> Dict:
+        """
+        Compute every distribution in the summary from one grouped aggregation.
+        
+        The rows are grouped once by (age_group, domain, label, milestone_id) and
+        everything else is rolled up from that table. Also adds 'age_group' and
+        'domain' columns to the DataFrame.
+        
         Returns:
             Dictionary containing summary statistics
         """
-        # Add age groups and domains to DataFrame
-        self.df['age_group'] = self.df['child_age'].apply(self.categorize_age_group)
-        self.df['domain'] = self.df['milestone_id'].apply(self.extract_domain)
+        self.df['age_group'] = self.categorize_age_groups(self.df['child_age'])
+        self.df['domain'] = self.extract_domains(self.df['milestone_id'])
+        grouped = self._group_counts(self.df['age_group'], self.df['domain'], self.df)
+        return self.summarize_counts(grouped, len(self.df), self.data_quality_counts(self.df))
+    
+    def _summary_state_config(self) -> List:
+        """Settings baked into stored counts; a change invalidates the state."""
+        return [[upper, label] for upper, label in self.AGE_GROUPS] + [sorted(self.DOMAIN_PREFIXES.items())]
+    
+    def _load_summary_state(self, state_path: str) -> Optional[Dict]:
+        """Return the stored state if it still describes a prefix of the current CSV, else None."""
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Warning: Ignoring unreadable summary state {state_path}: {e}")
+            return None
         
-        # Calculate statistics
-        total_videos = len(self.df)
+        expected = {
+            'format': SUMMARY_STATE_FORMAT,
+            'source': os.path.abspath(self.csv_path),
+            'config': json.loads(json.dumps(self._summary_state_config())),
+        }
+        if any(state.get(key) != value for key, value in expected.items()):
+            print("⚠️ Warning: Summary state was built for a different file or configuration; rebuilding")
+            return None
+        if self.store.fingerprint(state['offset']) != state['fingerprint']:
+            print("⚠️ Warning: Metadata file was rewritten since the summary state was saved; rebuilding")
+            return None
+        return state
+    
+    def update_summary_state(self, state_path: str = DEFAULT_SUMMARY_STATE_PATH, block_bytes: int = 32 * 1024 * 1024) -> Dict:
+        """
+        Bring the persisted summary state up to date and return the summary.
         
-        # Age group distribution
-        age_distribution = self.df['age_group'].value_counts().sort_index()
+        The state holds the grouped counts (by age group, domain, label and
+        milestone), data-quality counts and the byte offset of the last row
+        already counted. Only rows appended after that offset are read, so the
+        cost is O(new rows). The state is rebuilt from scratch if it is missing,
+        was built for another file or configuration, or the file was rewritten
+        rather than appended to.
         
-        # Domain distribution
-        domain_distribution = self.df['domain'].value_counts()
+        Args:
+            state_path: JSON file holding the aggregate state
+            block_bytes: Bytes of new rows parsed at a time
+            
+        Returns:
+            Dictionary containing summary statistics, as compute_summary
+            
+        Raises:
+            ValueError: If the metadata is not stored as CSV
+        """
+        if not isinstance(self.store, CsvStore):
+            raise ValueError("Incremental summaries need CSV metadata: appended rows are located by byte offset")
         
-        # Label distribution
-        label_distribution = self.df['label'].value_counts() if 'label' in self.df.columns else None
+        state = self._load_summary_state(state_path)
+        if state is None:
+            grouped, total_videos, offset = None, 0, None
+            data_quality = {'missing_filename': 0, 'missing_age': 0, 'missing_milestone_id': 0}
+        else:
+            grouped = pd.DataFrame(state['counts'], columns=self.SUMMARY_KEYS + ['count', 'first_row']).set_index(self.SUMMARY_KEYS)
+            total_videos, offset, data_quality = state['rows'], state['offset'], state['data_quality']
+        
+        new_rows = 0
+        for chunk, offset in self.store.read_appended(offset, block_bytes):
+            batch = self.aggregate_rows(chunk, first_row=total_videos)
+            grouped = batch if grouped is None else self.merge_counts(grouped, batch)
+            for key, count in self.data_quality_counts(chunk).items():
+                data_quality[key] += count
+            total_videos += len(chunk)
+            new_rows += len(chunk)
+        if offset is None:
+            offset = self.store.header()[1]
+        if grouped is None:
+            grouped = self.aggregate_rows(pd.DataFrame(columns=['filename', 'child_age', 'milestone_id', 'label']))
+        
+        counts = grouped.reset_index()
+        counts = counts.astype(object).where(counts.notna(), None)
+        state = {
+            'format': SUMMARY_STATE_FORMAT,
+            'source': os.path.abspath(self.csv_path),
+            'config': self._summary_state_config(),
+            'offset': offset,
+            'fingerprint': self.store.fingerprint(offset),
+            'rows': total_videos,
+            'data_quality': data_quality,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'counts': counts.values.tolist(),
+        }
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, default=int)
+        os.replace(tmp_path, state_path)
+        print(f"✅ Summary state updated with {new_rows} new rows ({total_videos} total) in {state_path}")
+        
+        return self.summarize_counts(grouped, total_videos, data_quality)
+    
+    def generate_summary_report(
+        self,
+        output_file: str = "dataset_summary_report.txt",
+        output_format: str = "text",
+        state_path: Optional[str] = None
+    ) -> Dict:
+        """
+        Generate a comprehensive summary report of the dataset.
         
-        # Cross-tabulation: Age group vs Domain
-        age_domain_crosstab = pd.crosstab(self.df['age_group'], self.df['domain'])
+        Args:
+            output_file: Path to save the summary report
+            output_format: "text" for the report only, or "json"/"parquet" to also
+                           write the statistics next to it (same name, new suffix)
+            state_path: Build the report from this persisted summary state,
+                        reading only rows appended since the last update
+                        (see update_summary_state) instead of the loaded DataFrame
+            
+        Returns:
+            Dictionary containing summary statistics
+        """
+        if output_format not in ("text", "json", "parquet"):
+            raise ValueError(f"Unsupported output format: {output_format} (expected text, json or parquet)")
         
-        # Milestone distribution
-        milestone_distribution = self.df['milestone_id'].value_counts()
+        summary = self.update_summary_state(state_path) if state_path else self.compute_summary()
+        total_videos = summary['total_videos']
+        
+        age_domain_crosstab = pd.DataFrame(summary['age_domain_crosstab'])
+        age_domain_crosstab.index.name = 'age_group'
+        age_domain_crosstab.columns.name = 'domain'
+        
+        def distribution_lines(distribution: Dict, keys) -> List[str]:
+            lines = []
+            for key in keys:
+                count = distribution[key]
+                percentage = (count / total_videos) * 100
+                bar = "█" * int(percentage / 2)
+                lines.append(f"{key:>10} | {count:>4} videos ({percentage:>5.1f}%) {bar}")
+            return lines
         
         # Generate report
         report_lines = []
@@ -232,38 +1227,26 @@ class VideoDatasetManager:
         report_lines.append(f"Security: Salted SHA-256 hashing enabled")
         report_lines.append("")
         
-        # Age Group Distribution
+        # Age Group Distribution (youngest first)
         report_lines.append("-" * 70)
         report_lines.append("📊 DISTRIBUTION BY AGE GROUP")
         report_lines.append("-" * 70)
-        for age_group in sorted(age_distribution.index):
-            count = age_distribution[age_group]
-            percentage = (count / total_videos) * 100
-            bar = "█" * int(percentage / 2)
-            report_lines.append(f"{age_group:>10} | {count:>4} videos ({percentage:>5.1f}%) {bar}")
+        report_lines.extend(distribution_lines(summary['age_distribution'], summary['age_distribution']))
         report_lines.append("")
         
         # Domain Distribution
         report_lines.append("-" * 70)
         report_lines.append("🎯 DISTRIBUTION BY DOMAIN")
         report_lines.append("-" * 70)
-        for domain in sorted(domain_distribution.index):
-            count = domain_distribution[domain]
-            percentage = (count / total_videos) * 100
-            bar = "█" * int(percentage / 2)
-            report_lines.append(f"{domain:>10} | {count:>4} videos ({percentage:>5.1f}%) {bar}")
+        report_lines.extend(distribution_lines(summary['domain_distribution'], sorted(summary['domain_distribution'])))
         report_lines.append("")
         
         # Label Distribution
-        if label_distribution is not None:
+        if summary['label_distribution']:
             report_lines.append("-" * 70)
             report_lines.append("✅ DISTRIBUTION BY LABEL")
             report_lines.append("-" * 70)
-            for label in sorted(label_distribution.index):
-                count = label_distribution[label]
-                percentage = (count / total_videos) * 100
-                bar = "█" * int(percentage / 2)
-                report_lines.append(f"{label:>10} | {count:>4} videos ({percentage:>5.1f}%) {bar}")
+            report_lines.extend(distribution_lines(summary['label_distribution'], sorted(summary['label_distribution'])))
             report_lines.append("")
         
         # Age Group vs Domain Cross-tabulation
@@ -277,7 +1260,7 @@ class VideoDatasetManager:
         report_lines.append("-" * 70)
         report_lines.append("🏆 TOP 10 MILESTONES BY VIDEO COUNT")
         report_lines.append("-" * 70)
-        for idx, (milestone, count) in enumerate(milestone_distribution.head(10).items(), 1):
+        for idx, (milestone, count) in enumerate(summary['top_milestones'].items(), 1):
             report_lines.append(f"{idx:>2}. {milestone:>15} | {count:>4} videos")
         report_lines.append("")
         
@@ -285,13 +1268,10 @@ class VideoDatasetManager:
         report_lines.append("-" * 70)
         report_lines.append("🔍 DATA QUALITY CHECKS")
         report_lines.append("-" * 70)
-        missing_filename = self.df['filename'].isna().sum()
-        missing_age = self.df['child_age'].isna().sum()
-        missing_milestone = self.df['milestone_id'].isna().sum()
-        
-        report_lines.append(f"Missing filenames:     {missing_filename}")
-        report_lines.append(f"Missing ages:          {missing_age}")
-        report_lines.append(f"Missing milestone_ids: {missing_milestone}")
+        quality = summary['data_quality']
+        report_lines.append(f"Missing filenames:     {quality['missing_filename']}")
+        report_lines.append(f"Missing ages:          {quality['missing_age']}")
+        report_lines.append(f"Missing milestone_ids: {quality['missing_milestone_id']}")
         report_lines.append("")
         
         report_lines.append("=" * 70)
@@ -306,24 +1286,48 @@ class VideoDatasetManager:
         
         print(f"\n✅ Summary report saved to {output_file}")
         
-        # Return statistics as dictionary
-        summary = {
-            'total_videos': total_videos,
-            'age_distribution': age_distribution.to_dict(),
-            'domain_distribution': domain_distribution.to_dict(),
-            'label_distribution': label_distribution.to_dict() if label_distribution is not None else {},
-            'age_domain_crosstab': age_domain_crosstab.to_dict(),
-            'top_milestones': milestone_distribution.head(10).to_dict()
-        }
+        if output_format == "json":
+            self._save_summary_json(summary, str(Path(output_file).with_suffix(".json")))
+        elif output_format == "parquet":
+            self._save_summary_parquet(summary, str(Path(output_file).with_suffix(".parquet")))
         
         return summary
     
+    def _save_summary_json(self, summary: Dict, output_path: str):
+        """Write the summary statistics as JSON for dashboards."""
+        payload = {'generated_at': datetime.now().isoformat(timespec='seconds'), **summary}
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        print(f"✅ Summary statistics saved to {output_path}")
+    
+    def _save_summary_parquet(self, summary: Dict, output_path: str):
+        """
+        Write the summary statistics as one long-format Parquet table.
+        
+        Columns: metric (e.g. "age_distribution"), key, sub_key (the age group
+        for the cross-tabulation, otherwise empty) and count.
+        """
+        rows = []
+        for metric in ('age_distribution', 'domain_distribution', 'label_distribution', 'top_milestones', 'data_quality'):
+            rows.extend((metric, key, "", count) for key, count in summary[metric].items())
+        for domain, column in summary['age_domain_crosstab'].items():
+            rows.extend(('age_domain_crosstab', domain, age_group, count) for age_group, count in column.items())
+        rows.append(('total_videos', "", "", summary['total_videos']))
+        
+        table = pd.DataFrame(rows, columns=['metric', 'key', 'sub_key', 'count']).astype({'count': 'int64'})
+        try:
+            table.to_parquet(output_path, index=False)
+        except ImportError as e:
+            print(f"❌ Error: Parquet output needs pyarrow (pip install pyarrow): {e}")
+            raise
+        print(f"✅ Summary statistics saved to {output_path}")
+    
     def save_deidentified_csv(self, output_path: str = "deidentified_dataset.csv"):
         """
         Save the de-identified dataset to a new CSV file.
         
         Args:
-            output_path: Path to save the de-identified CSV
+            output_path: Path to save the de-identified dataset (.csv, or .parquet for typed columnar storage)
         """
         if 'hashed_filename' not in self.df.columns:
             print("⚠️ Warning: Files have not been de-identified yet. Run deidentify_files() first.")
@@ -334,13 +1338,22 @@ class VideoDatasetManager:
         deidentified_df['original_filename'] = deidentified_df['filename']
         deidentified_df['filename'] = deidentified_df['hashed_filename']
         
-        # Save to CSV
-        deidentified_df.to_csv(output_path, index=False)
+        open_store(output_path).write(deidentified_df)
         print(f"✅ De-identified dataset saved to {output_path}")
 
 
 def main():
     """Main function demonstrating usage."""
+    parser = argparse.ArgumentParser(description="Child Development Video Dataset Manager")
+    parser.add_argument(
+        "--format", choices=["text", "json", "parquet"], default="text",
+        help="Also write summary statistics as JSON or Parquet next to the text report"
+    )
+    parser.add_argument(
+        "--summary-state", metavar="PATH",
+        help="Update the persisted summary state from newly appended rows and report from it"
+    )
+    args = parser.parse_args()
     
     print("🏥 Child Development Video Dataset Manager")
     print("=" * 70)
@@ -372,7 +1385,7 @@ def main():
         print("\n" + "=" * 70)
         print("STEP 2: Generating Summary Report")
         print("=" * 70)
-        summary = manager.generate_summary_report()
+        summary = manager.generate_summary_report(output_format=args.format, state_path=args.summary_state)
         
         # Save de-identified CSV
         print("\n" + "=" * 70)
@@ -0,0 +1,274 @@
+"""
+Storage backends for the video metadata dataset.
+
+VideoDatasetManager reads and writes its metadata through a MetadataStore, so
+the same reports and de-identification run on CSV or on Parquet. The Parquet
+backend stores typed columns (categorical milestone_id/label, int8 child_age)
+and pushes column projection and row filters down to the file reader, so only
+the needed columns and row groups are decoded.
+
+Convert an existing CSV:
+    python video_storage.py video_metadata.csv video_metadata.parquet
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import operator
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# A filter is (column, op, value); a list of filters is ANDed together,
+# e.g. [("child_age", ">", 6), ("child_age", "<=", 12)]
+Filter = Tuple[str, str, Any]
+
+_OPERATORS = {
+    "==": operator.eq, "=": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+# Typed columns used for columnar storage; other columns are kept as they are
+CATEGORICAL_COLUMNS = ("milestone_id", "label")
+INT8_COLUMNS = ("child_age",)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert metadata columns to compact types.
+
+    milestone_id and label become categoricals, and child_age becomes a nullable
+    int8 when every value is a whole number of months that fits in the type.
+    Otherwise child_age is left unchanged rather than being rounded.
+
+    Args:
+        df: Metadata as read from CSV
+
+    Returns:
+        New DataFrame with typed columns
+    """
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    for column in INT8_COLUMNS:
+        if column not in df.columns:
+            continue
+        values = pd.to_numeric(df[column], errors="coerce")
+        present = values.dropna()
+        info = np.iinfo(np.int8)
+        if (present == present.round()).all() and present.between(info.min, info.max).all():
+            df[column] = values.astype("Int8")
+    return df
+
+
+def apply_filters(df: pd.DataFrame, filters: Optional[Sequence[Filter]]) -> pd.DataFrame:
+    """Evaluate ANDed (column, op, value) filters in pandas; 'in'/'not in' take a collection."""
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if op == "in":
+            mask &= df[column].isin(value)
+        elif op == "not in":
+            mask &= ~df[column].isin(value)
+        else:
+            mask &= _OPERATORS[op](df[column], value).fillna(False).astype(bool)
+    return df[mask]
+
+
+class MetadataStore(ABC):
+    """Interface for reading and writing video metadata tables."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @abstractmethod
+    def read(self, columns: Optional[List[str]] = None, filters: Optional[Sequence[Filter]] = None) -> pd.DataFrame:
+        """
+        Load the table.
+
+        Args:
+            columns: Columns to load (None for all)
+            filters: ANDed (column, op, value) row filters
+
+        Returns:
+            DataFrame with a fresh RangeIndex
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_batches(self, batch_size: int = 50_000, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield the table batch_size rows at a time, with a RangeIndex continuing across batches."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, df: pd.DataFrame):
+        """Replace the table with df."""
+        raise NotImplementedError
+
+
+class CsvStore(MetadataStore):
+    """Plain CSV. Projection is done by the parser; filters are applied chunk by chunk."""
+
+    def read(self, columns=None, filters=None):
+        if not filters:
+            return pd.read_csv(self.path, usecols=columns)
+
+        # Filter each chunk as it is parsed so unmatched rows are never all in memory at once
+        needed = None if columns is None else list(dict.fromkeys(list(columns) + [f[0] for f in filters]))
+        with pd.read_csv(self.path, usecols=needed, chunksize=100_000) as reader:
+            parts = [apply_filters(chunk, filters) for chunk in reader]
+        df = pd.concat(parts, ignore_index=True) if parts else pd.read_csv(self.path, usecols=needed, nrows=0)
+        return df[columns] if columns is not None else df
+
+    def iter_batches(self, batch_size=50_000, columns=None):
+        with pd.read_csv(self.path, usecols=columns, chunksize=batch_size) as reader:
+            yield from reader
+
+    def write(self, df):
+        df.to_csv(self.path, index=False)
+
+    def header(self) -> Tuple[List[str], int]:
+        """Column names and the byte offset where the first data row starts."""
+        with open(self.path, 'rb') as f:
+            line = f.readline()
+        columns = next(csv.reader([line.decode('utf-8-sig')]), [])
+        return [column.strip() for column in columns], len(line)
+
+    def fingerprint(self, offset: int, window: int = 4096) -> Optional[str]:
+        """
+        Identify the file content before offset without reading all of it.
+
+        Hashes the header and the `window` bytes before offset, which changes
+        if the file is rewritten or truncated rather than appended to.
+
+        Returns:
+            Hex digest, or None if the file is now shorter than offset
+        """
+        with open(self.path, 'rb') as f:
+            header = f.readline()
+            if os.fstat(f.fileno()).st_size < offset:
+                return None
+            start = max(len(header), offset - window)
+            f.seek(start)
+            tail = f.read(max(0, offset - start))
+        return hashlib.sha256(header + b"\0" + tail).hexdigest()
+
+    def read_appended(self, offset: Optional[int] = None, block_bytes: int = 32 * 1024 * 1024) -> Iterator[Tuple[pd.DataFrame, int]]:
+        """
+        Parse rows from a byte offset to the end of the file, a block at a time.
+
+        Blocks are cut at line boundaries, so fields must not contain newlines.
+
+        Args:
+            offset: Where the first unread row starts (None for the first data row)
+            block_bytes: Bytes read per block; bounds memory for large appends
+
+        Yields:
+            (rows, offset just past those rows)
+        """
+        columns, data_start = self.header()
+        position = data_start if offset is None else offset
+        with open(self.path, 'rb') as f:
+            f.seek(position)
+            pending = b""
+            while True:
+                block = f.read(block_bytes)
+                if not block:
+                    # A final line without a newline still counts, as it does for pd.read_csv
+                    data, pending = pending, b""
+                else:
+                    data = pending + block
+                    cut = data.rfind(b"\n") + 1
+                    data, pending = data[:cut], data[cut:]
+                if data.strip():
+                    yield pd.read_csv(io.BytesIO(data), header=None, names=columns), position + len(data)
+                position += len(data)
+                if not block:
+                    break
+
+
+def _pyarrow_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet storage needs pyarrow: pip install pyarrow") from e
+    return pq
+
+
+class ParquetStore(MetadataStore):
+    """
+    Columnar Parquet file with typed columns.
+
+    Projection and filters are passed to pyarrow, which skips unneeded
+    columns entirely and row groups whose min/max statistics cannot match.
+    """
+
+    # Rows per row group; smaller groups let filters skip more, larger ones compress better
+    ROW_GROUP_SIZE = 128 * 1024
+
+    def read(self, columns=None, filters=None):
+        _pyarrow_parquet()
+        return pd.read_parquet(self.path, columns=columns, filters=list(filters) if filters else None)
+
+    def iter_batches(self, batch_size=50_000, columns=None):
+        pq = _pyarrow_parquet()
+        start = 0
+        for batch in pq.ParquetFile(self.path).iter_batches(batch_size=batch_size, columns=columns):
+            df = batch.to_pandas()
+            df.index = pd.RangeIndex(start, start + len(df))
+            start += len(df)
+            yield df
+
+    def write(self, df):
+        _pyarrow_parquet()
+        apply_schema(df).to_parquet(self.path, index=False, row_group_size=self.ROW_GROUP_SIZE)
+
+
+STORES = {".csv": CsvStore, ".parquet": ParquetStore, ".pq": ParquetStore}
+
+
+def open_store(path: str, strict: bool = False) -> MetadataStore:
+    """
+    Pick the storage backend from the file extension.
+
+    Args:
+        path: Metadata file
+        strict: Reject unknown extensions instead of treating the file as CSV,
+                as the metadata has always been read with pd.read_csv
+
+    Raises:
+        ValueError: If strict and the extension has no backend
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in STORES:
+        return STORES[suffix](path)
+    if strict:
+        raise ValueError(f"Unsupported metadata format '{suffix}' for {path} (expected one of {sorted(STORES)})")
+    return CsvStore(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert video metadata between CSV and Parquet.")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+
+    # Explicit conversions must not silently write CSV under another extension
+    try:
+        source, destination = open_store(args.source, strict=True), open_store(args.destination, strict=True)
+    except ValueError as e:
+        parser.error(str(e))
+    df = source.read()
+    destination.write(df)
+    print(f"✅ Wrote {len(df)} records to {args.destination}")
+
+
+if __name__ == "__main__":
+    main()